@@ -1,14 +1,30 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import gzip
+import http.client
 import json
 import ssl
-import urllib.request
-from dataclasses import dataclass
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+from pydantic import BaseModel, ValidationError
 
 from bas_orchestrator.models import ModuleResult
 
+if TYPE_CHECKING:
+    from bas_orchestrator.handshake_cache import HandshakeCache
+
+# Optional protocol features an agent may advertise in its handshake response.
+BATCH_FEATURE = "execute-batch"
+GZIP_FEATURE = "gzip"
+
 
 @dataclass(frozen=True)
 class AgentClientConfig:
@@ -23,10 +39,89 @@ class AgentClientConfig:
     allow_insecure_http: bool = False
     mock_capabilities: list[str] | None = None
     mock_policy_hash: str | None = None
+    mock_features: list[str] | None = None
+    pool_size: int = 8
+    pool_idle_timeout_seconds: float = 30.0
+    compress_min_bytes: int = 1024
 
 
 class AgentClientError(RuntimeError):
-    pass
+    # retryable: the request may be sent again safely (transport failure, timeout, 429/5xx).
+    # Agents treat (run_id, module_id) as an idempotency key, see docs/specs/AGENT_API.md.
+    def __init__(self, message: str, *, retryable: bool = False) -> None:
+        super().__init__(message)
+        self.retryable = retryable
+
+
+# Errors that mean a pooled keep-alive connection went stale before the request reached the
+# agent; the request is retried once on a fresh connection.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+def _split_agent_url(base_url: str) -> tuple[str, str, int | None, str]:
+    parts = urlsplit(base_url)
+    if parts.scheme not in {"http", "https"} or not parts.hostname:
+        raise AgentClientError(f"Unsupported agent URL: {base_url}")
+    return parts.scheme, parts.hostname, parts.port, parts.path.rstrip("/")
+
+
+class _ConnectionPool:
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        size: int,
+        idle_timeout: float,
+        ssl_context: ssl.SSLContext | None,
+    ) -> None:
+        self._scheme, self._host, self._port, self.path_prefix = _split_agent_url(base_url)
+        self._size = size
+        self._idle_timeout = idle_timeout
+        self._ssl_context = ssl_context
+        self._idle: list[tuple[float, http.client.HTTPConnection]] = []
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        now = time.monotonic()
+        with self._lock:
+            while self._idle:
+                released_at, connection = self._idle.pop()
+                if now - released_at <= self._idle_timeout:
+                    connection.timeout = timeout
+                    if connection.sock is not None:
+                        connection.sock.settimeout(timeout)
+                    return connection, True
+                connection.close()
+        return self.connect(timeout), False
+
+    def connect(self, timeout: float) -> http.client.HTTPConnection:
+        if self._scheme == "https":
+            return http.client.HTTPSConnection(
+                self._host, self._port, timeout=timeout, context=self._ssl_context
+            )
+        return http.client.HTTPConnection(self._host, self._port, timeout=timeout)
+
+    def release(self, connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if len(self._idle) < self._size:
+                self._idle.append((time.monotonic(), connection))
+                return
+        connection.close()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for _, connection in idle:
+            connection.close()
+
+
+class _BatchResponse(BaseModel):
+    results: list[ModuleResult]
 
 
 @dataclass(frozen=True)
@@ -34,21 +129,31 @@ class HandshakeResult:
     agent_id: str
     capabilities: list[str]
     policy_hash: str | None
+    features: list[str] = field(default_factory=list)
 
 
-class AgentClient:
+class _AgentClientBase:
+    # Protocol rules shared by the blocking and the asyncio client; subclasses only differ
+    # in how a JSON request reaches the agent.
     def __init__(self, config: AgentClientConfig) -> None:
         self._config = config
         self._handshake: HandshakeResult | None = None
 
-    def handshake(
-        self,
-        *,
-        agent_id: str | None,
-        capabilities: list[str],
-        version: str,
-        expected_policy_hash: str | None,
-    ) -> HandshakeResult:
+    @property
+    def supports_batch(self) -> bool:
+        return self._handshake is not None and BATCH_FEATURE in self._handshake.features
+
+    @property
+    def handshake_result(self) -> HandshakeResult | None:
+        # None until a handshake is accepted, and again once a cached handshake failed
+        # revalidation.
+        return self._handshake
+
+    @property
+    def _is_mock(self) -> bool:
+        return self._config.base_url.startswith("mock://")
+
+    def _check_handshake_config(self) -> None:
         if not self._config.enabled:
             raise AgentClientError("Agent client disabled")
         if self._config.base_url.startswith("http://") and not self._config.allow_insecure_http:
@@ -58,55 +163,182 @@ class AgentClient:
         ):
             raise AgentClientError("Both cert_path and key_path are required for TLS client auth")
 
-        if self._config.base_url.startswith("mock://"):
-            result = HandshakeResult(
-                agent_id=agent_id or "mock-agent",
-                capabilities=self._config.mock_capabilities or capabilities,
-                policy_hash=self._config.mock_policy_hash,
-            )
-            self._validate_handshake(result, capabilities)
-            self._validate_policy_hash(result, expected_policy_hash)
-            self._handshake = result
-            return result
+    def _mock_handshake(self, agent_id: str | None, capabilities: list[str]) -> HandshakeResult:
+        return HandshakeResult(
+            agent_id=agent_id or "mock-agent",
+            capabilities=self._config.mock_capabilities or capabilities,
+            policy_hash=self._config.mock_policy_hash,
+            features=list(self._config.mock_features or []),
+        )
 
-        payload = {
+    def _handshake_payload(
+        self, agent_id: str | None, capabilities: list[str], version: str
+    ) -> dict[str, Any]:
+        return {
             "agent_id": agent_id or "orchestrator",
             "capabilities": capabilities,
             "version": version,
         }
-        response = self._post_json("/v1/agent/handshake", payload)
-        result = HandshakeResult(
+
+    def _handshake_from_response(self, response: dict[str, Any]) -> HandshakeResult:
+        return HandshakeResult(
             agent_id=str(response.get("agent_id", "")),
             capabilities=list(response.get("capabilities", [])),
             policy_hash=response.get("policy_hash"),
+            features=[str(feature) for feature in response.get("features") or []],
         )
-        self._validate_handshake(result, capabilities)
+
+    def _accept_handshake(
+        self, result: HandshakeResult, requested: list[str], expected_policy_hash: str | None
+    ) -> HandshakeResult:
+        self._validate_handshake(result, requested)
         self._validate_policy_hash(result, expected_policy_hash)
         self._handshake = result
         return result
 
-    def execute_module(self, payload: dict[str, Any]) -> ModuleResult:
+    def _handshake_cache_key(
+        self,
+        cache: HandshakeCache,
+        agent_id: str | None,
+        capabilities: list[str],
+        version: str,
+        expected_policy_hash: str | None,
+    ) -> str:
+        return cache.key(
+            self._config.base_url,
+            agent_id=agent_id,
+            expected_policy_hash=expected_policy_hash,
+            capabilities=capabilities,
+            version=version,
+        )
+
+    def _cached_handshake(
+        self,
+        cache: HandshakeCache,
+        key: str,
+        requested: list[str],
+        expected_policy_hash: str | None,
+    ) -> HandshakeResult | None:
+        cached = cache.get(key)
+        if cached is None:
+            return None
+        try:
+            return self._accept_handshake(cached, requested, expected_policy_hash)
+        except AgentClientError:
+            cache.invalidate(key)
+            return None
+
+    def _reject_cached_handshake(
+        self, cache: HandshakeCache, key: str, exc: AgentClientError
+    ) -> None:
+        # An unreachable agent keeps its entry; an agent that answers differently (policy hash
+        # mismatch, missing capability, 4xx) loses it and stops receiving modules.
+        if exc.retryable:
+            return
+        cache.invalidate(key)
+        self._handshake = None
+
+    def _check_executable(self, payloads: list[dict[str, Any]], *, batch: bool = False) -> None:
         if not self._config.enabled:
             raise AgentClientError("Agent client disabled")
         if self._handshake is None:
             raise AgentClientError("Agent handshake required before execution")
-        if payload.get("module") not in self._handshake.capabilities:
-            raise AgentClientError("Agent missing capability for module")
-        if self._config.base_url.startswith("mock://"):
-            now = datetime.now(UTC).isoformat()
-            timestamp = payload.get("scope", {}).get("expires_at") or now
-            return ModuleResult.model_validate(
-                {
-                    "module_id": payload.get("module_id", "unknown"),
-                    "status": "pass",
-                    "started_at": timestamp,
-                    "finished_at": timestamp,
-                    "evidence": {"mock": True},
-                    "notes": "mock agent result",
-                }
+        for payload in payloads:
+            if payload.get("module") not in self._handshake.capabilities:
+                raise AgentClientError("Agent missing capability for module")
+        if batch and not self.supports_batch:
+            raise AgentClientError("Agent does not support batch execution")
+
+    def _mock_result(self, payload: dict[str, Any]) -> ModuleResult:
+        now = datetime.now(UTC).isoformat()
+        timestamp = payload.get("scope", {}).get("expires_at") or now
+        return ModuleResult.model_validate(
+            {
+                "module_id": payload.get("module_id", "unknown"),
+                "status": "pass",
+                "started_at": timestamp,
+                "finished_at": timestamp,
+                "evidence": {"mock": True},
+                "notes": "mock agent result",
+            }
+        )
+
+    def _decode_result(
+        self, status: int, body: bytes, content_encoding: str | None
+    ) -> ModuleResult:
+        # Results are validated straight from the response bytes by pydantic-core's JSON parser,
+        # skipping the intermediate dict that json.loads + model_validate would build.
+        data = self._response_bytes(status, body, content_encoding)
+        try:
+            return ModuleResult.model_validate_json(data)
+        except ValidationError as exc:
+            raise AgentClientError("Agent returned invalid result") from exc
+
+    def _decode_batch(
+        self,
+        status: int,
+        body: bytes,
+        content_encoding: str | None,
+        payloads: list[dict[str, Any]],
+    ) -> list[ModuleResult]:
+        data = self._response_bytes(status, body, content_encoding)
+        try:
+            results = _BatchResponse.model_validate_json(data).results
+        except ValidationError as exc:
+            raise AgentClientError("Agent returned invalid batch payload") from exc
+        if len(results) != len(payloads):
+            raise AgentClientError("Agent returned invalid batch payload")
+        if [result.module_id for result in results] != [
+            payload.get("module_id") for payload in payloads
+        ]:
+            raise AgentClientError("Agent batch results do not match requested modules")
+        return results
+
+    def _request_timeout(self, timeout_seconds: float | None) -> float:
+        timeout = self._config.timeout_seconds
+        if timeout_seconds is not None:
+            timeout = min(timeout, timeout_seconds)
+        return timeout
+
+    def _request_body(self, payload: dict[str, Any]) -> tuple[bytes, dict[str, str]]:
+        # Request bodies are gzipped only for agents that advertised gzip in their handshake;
+        # small bodies are sent as-is since compressing them costs more than it saves.
+        data = json.dumps(payload).encode("utf-8")
+        if (
+            self._handshake is not None
+            and GZIP_FEATURE in self._handshake.features
+            and len(data) >= self._config.compress_min_bytes
+        ):
+            return gzip.compress(data, compresslevel=6, mtime=0), {"Content-Encoding": "gzip"}
+        return data, {}
+
+    def _decode_response(
+        self, status: int, body: bytes, content_encoding: str | None = None
+    ) -> dict[str, Any]:
+        data = self._response_bytes(status, body, content_encoding)
+        try:
+            payload = json.loads(data)
+        except json.JSONDecodeError as exc:  # pragma: no cover - network path
+            raise AgentClientError("Agent returned invalid JSON") from exc
+
+        if not isinstance(payload, dict):
+            raise AgentClientError("Agent returned invalid payload")
+        return payload
+
+    def _response_bytes(self, status: int, body: bytes, content_encoding: str | None) -> bytes:
+        if status >= 400:
+            raise AgentClientError(
+                f"Agent request failed: HTTP {status}", retryable=status >= 500 or status == 429
             )
-        response = self._post_json("/v1/agent/modules/execute", payload)
-        return ModuleResult.model_validate(response)
+        encoding = (content_encoding or "identity").strip().lower()
+        if encoding == "gzip":
+            try:
+                body = gzip.decompress(body)
+            except (OSError, EOFError, zlib.error) as exc:
+                raise AgentClientError("Agent returned invalid gzip payload") from exc
+        elif encoding != "identity":
+            raise AgentClientError(f"Agent returned unsupported content encoding: {encoding}")
+        return body
 
     def _ssl_context(self) -> ssl.SSLContext:
         context = ssl.create_default_context()
@@ -119,33 +351,6 @@ class AgentClient:
             context.load_cert_chain(self._config.cert_path, self._config.key_path)
         return context
 
-    def _post_json(self, path: str, payload: dict[str, Any]) -> dict[str, Any]:
-        url = f"{self._config.base_url.rstrip('/')}{path}"
-        data = json.dumps(payload).encode("utf-8")
-        request = urllib.request.Request(
-            url,
-            data=data,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
-        context = self._ssl_context()
-        try:
-            with urllib.request.urlopen(
-                request, timeout=self._config.timeout_seconds, context=context
-            ) as res:
-                body = res.read().decode("utf-8")
-        except Exception as exc:  # pragma: no cover - network path
-            raise AgentClientError(f"Agent request failed: {exc}") from exc
-
-        try:
-            payload = json.loads(body)
-        except json.JSONDecodeError as exc:  # pragma: no cover - network path
-            raise AgentClientError("Agent returned invalid JSON") from exc
-
-        if not isinstance(payload, dict):
-            raise AgentClientError("Agent returned invalid payload")
-        return payload
-
     def _validate_policy_hash(
         self, result: HandshakeResult, expected_policy_hash: str | None
     ) -> None:
@@ -164,3 +369,456 @@ class AgentClient:
         missing = set(requested) - set(result.capabilities)
         if missing:
             raise AgentClientError("Agent missing requested capabilities")
+
+
+class AgentClient(_AgentClientBase):
+    def __init__(self, config: AgentClientConfig) -> None:
+        super().__init__(config)
+        self._pool: _ConnectionPool | None = None
+        self._pool_lock = threading.Lock()
+        self._revalidation: threading.Thread | None = None
+
+    def close(self) -> None:
+        if self._revalidation is not None:
+            self._revalidation.join(self._config.timeout_seconds)
+            self._revalidation = None
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close()
+
+    def handshake(
+        self,
+        *,
+        agent_id: str | None,
+        capabilities: list[str],
+        version: str,
+        expected_policy_hash: str | None,
+        require_capabilities: bool = True,
+        cache: HandshakeCache | None = None,
+    ) -> HandshakeResult:
+        # With a cache, a fresh cached handshake is returned at once and revalidated on a
+        # background thread; close() waits for that revalidation.
+        self._check_handshake_config()
+        required = capabilities if require_capabilities else []
+        if self._is_mock:
+            result = self._mock_handshake(agent_id, capabilities)
+            return self._accept_handshake(result, required, expected_policy_hash)
+
+        payload = self._handshake_payload(agent_id, capabilities, version)
+        key = None
+        if cache is not None:
+            key = self._handshake_cache_key(
+                cache, agent_id, capabilities, version, expected_policy_hash
+            )
+            cached = self._cached_handshake(cache, key, required, expected_policy_hash)
+            if cached is not None:
+                self._revalidation = threading.Thread(
+                    target=self._revalidate,
+                    args=(cache, key, payload, required, expected_policy_hash),
+                    name="bas-handshake-revalidate",
+                    daemon=True,
+                )
+                self._revalidation.start()
+                return cached
+
+        result = self._handshake_from_response(self._post_json("/v1/agent/handshake", payload))
+        accepted = self._accept_handshake(result, required, expected_policy_hash)
+        if cache is not None and key is not None:
+            cache.put(key, accepted)
+        return accepted
+
+    def execute_module(
+        self, payload: dict[str, Any], *, timeout_seconds: float | None = None
+    ) -> ModuleResult:
+        self._check_executable([payload])
+        if self._is_mock:
+            return self._mock_result(payload)
+        response = self._post("/v1/agent/modules/execute", payload, timeout_seconds=timeout_seconds)
+        return self._decode_result(*response)
+
+    def execute_batch(
+        self, payloads: list[dict[str, Any]], *, timeout_seconds: float | None = None
+    ) -> list[ModuleResult]:
+        self._check_executable(payloads, batch=True)
+        if self._is_mock:
+            return [self._mock_result(payload) for payload in payloads]
+        response = self._post(
+            "/v1/agent/modules/execute-batch",
+            {"modules": payloads},
+            timeout_seconds=timeout_seconds,
+        )
+        return self._decode_batch(*response, payloads)
+
+    def _revalidate(
+        self,
+        cache: HandshakeCache,
+        key: str,
+        payload: dict[str, Any],
+        required: list[str],
+        expected_policy_hash: str | None,
+    ) -> None:
+        try:
+            response = self._post_json("/v1/agent/handshake", payload)
+            result = self._accept_handshake(
+                self._handshake_from_response(response), required, expected_policy_hash
+            )
+        except AgentClientError as exc:
+            self._reject_cached_handshake(cache, key, exc)
+            return
+        cache.put(key, result)
+
+    def _connection_pool(self) -> _ConnectionPool:
+        # Built once per client: the SSL context (CA bundle, client cert) is loaded a single
+        # time and connections are kept alive across module executions.
+        with self._pool_lock:
+            if self._pool is None:
+                context = (
+                    self._ssl_context() if self._config.base_url.startswith("https://") else None
+                )
+                self._pool = _ConnectionPool(
+                    self._config.base_url,
+                    size=self._config.pool_size,
+                    idle_timeout=self._config.pool_idle_timeout_seconds,
+                    ssl_context=context,
+                )
+            return self._pool
+
+    def _post_json(
+        self, path: str, payload: dict[str, Any], *, timeout_seconds: float | None = None
+    ) -> dict[str, Any]:
+        return self._decode_response(*self._post(path, payload, timeout_seconds=timeout_seconds))
+
+    def _post(
+        self, path: str, payload: dict[str, Any], *, timeout_seconds: float | None = None
+    ) -> tuple[int, bytes, str | None]:
+        pool = self._connection_pool()
+        data, headers = self._request_body(payload)
+        timeout = self._request_timeout(timeout_seconds)
+        url = pool.path_prefix + path
+
+        connection, reused = pool.acquire(timeout)
+        try:
+            try:
+                status, body, encoding, keep_alive = self._send(connection, url, data, headers)
+            except _STALE_CONNECTION_ERRORS:
+                connection.close()
+                if not reused:
+                    raise
+                connection = pool.connect(timeout)
+                status, body, encoding, keep_alive = self._send(connection, url, data, headers)
+        except (OSError, http.client.HTTPException) as exc:
+            connection.close()
+            raise AgentClientError(f"Agent request failed: {exc}", retryable=True) from exc
+
+        if keep_alive:
+            pool.release(connection)
+        else:
+            connection.close()
+        return status, body, encoding
+
+    def _send(
+        self,
+        connection: http.client.HTTPConnection,
+        path: str,
+        data: bytes,
+        headers: dict[str, str],
+    ) -> tuple[int, bytes, str | None, bool]:
+        connection.request(
+            "POST",
+            path,
+            body=data,
+            headers={
+                "Content-Type": "application/json",
+                "Accept-Encoding": "gzip",
+                "Connection": "keep-alive",
+                **headers,
+            },
+        )
+        response = connection.getresponse()
+        body = response.read()
+        encoding = response.getheader("Content-Encoding")
+        return response.status, body, encoding, not response.will_close
+
+
+@dataclass
+class _AsyncConnection:
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+    released_at: float = 0.0
+
+    def close(self) -> None:
+        self.writer.close()
+
+    async def aclose(self) -> None:
+        self.writer.close()
+        with contextlib.suppress(OSError):
+            await self.writer.wait_closed()
+
+
+class _AsyncConnectionPool:
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        size: int,
+        idle_timeout: float,
+        ssl_context: ssl.SSLContext | None,
+    ) -> None:
+        scheme, self._host, port, self.path_prefix = _split_agent_url(base_url)
+        self._port = port or (443 if scheme == "https" else 80)
+        self.host_header = self._host if port is None else f"{self._host}:{port}"
+        self._size = size
+        self._idle_timeout = idle_timeout
+        self._ssl_context = ssl_context
+        self._idle: list[_AsyncConnection] = []
+
+    async def acquire(self) -> tuple[_AsyncConnection, bool]:
+        now = time.monotonic()
+        while self._idle:
+            connection = self._idle.pop()
+            if now - connection.released_at <= self._idle_timeout:
+                return connection, True
+            connection.close()
+        return await self.connect(), False
+
+    async def connect(self) -> _AsyncConnection:
+        reader, writer = await asyncio.open_connection(
+            self._host, self._port, ssl=self._ssl_context
+        )
+        return _AsyncConnection(reader, writer)
+
+    def release(self, connection: _AsyncConnection) -> None:
+        if len(self._idle) < self._size:
+            connection.released_at = time.monotonic()
+            self._idle.append(connection)
+            return
+        connection.close()
+
+    def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+
+class AsyncAgentClient(_AgentClientBase):
+    # Same contract as AgentClient on asyncio streams: every in-flight request holds its own
+    # HTTP/1.1 keep-alive connection, so one event loop thread can drive many concurrent
+    # modules. max_in_flight caps open connections per agent.
+    def __init__(self, config: AgentClientConfig, *, max_in_flight: int = 256) -> None:
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        super().__init__(config)
+        self._pool: _AsyncConnectionPool | None = None
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._revalidation: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> AsyncAgentClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._revalidation is not None:
+            await self._revalidation
+            self._revalidation = None
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close()
+
+    async def handshake(
+        self,
+        *,
+        agent_id: str | None,
+        capabilities: list[str],
+        version: str,
+        expected_policy_hash: str | None,
+        require_capabilities: bool = True,
+        cache: HandshakeCache | None = None,
+    ) -> HandshakeResult:
+        self._check_handshake_config()
+        required = capabilities if require_capabilities else []
+        if self._is_mock:
+            result = self._mock_handshake(agent_id, capabilities)
+            return self._accept_handshake(result, required, expected_policy_hash)
+
+        payload = self._handshake_payload(agent_id, capabilities, version)
+        key = None
+        if cache is not None:
+            key = self._handshake_cache_key(
+                cache, agent_id, capabilities, version, expected_policy_hash
+            )
+            cached = self._cached_handshake(cache, key, required, expected_policy_hash)
+            if cached is not None:
+                self._revalidation = asyncio.create_task(
+                    self._revalidate(cache, key, payload, required, expected_policy_hash)
+                )
+                return cached
+
+        response = await self._post_json("/v1/agent/handshake", payload)
+        result = self._handshake_from_response(response)
+        accepted = self._accept_handshake(result, required, expected_policy_hash)
+        if cache is not None and key is not None:
+            cache.put(key, accepted)
+        return accepted
+
+    async def execute_module(
+        self, payload: dict[str, Any], *, timeout_seconds: float | None = None
+    ) -> ModuleResult:
+        self._check_executable([payload])
+        if self._is_mock:
+            return self._mock_result(payload)
+        response = await self._post(
+            "/v1/agent/modules/execute", payload, timeout_seconds=timeout_seconds
+        )
+        return self._decode_result(*response)
+
+    async def execute_batch(
+        self, payloads: list[dict[str, Any]], *, timeout_seconds: float | None = None
+    ) -> list[ModuleResult]:
+        self._check_executable(payloads, batch=True)
+        if self._is_mock:
+            return [self._mock_result(payload) for payload in payloads]
+        response = await self._post(
+            "/v1/agent/modules/execute-batch",
+            {"modules": payloads},
+            timeout_seconds=timeout_seconds,
+        )
+        return self._decode_batch(*response, payloads)
+
+    async def _revalidate(
+        self,
+        cache: HandshakeCache,
+        key: str,
+        payload: dict[str, Any],
+        required: list[str],
+        expected_policy_hash: str | None,
+    ) -> None:
+        try:
+            response = await self._post_json("/v1/agent/handshake", payload)
+            result = self._accept_handshake(
+                self._handshake_from_response(response), required, expected_policy_hash
+            )
+        except AgentClientError as exc:
+            self._reject_cached_handshake(cache, key, exc)
+            return
+        cache.put(key, result)
+
+    def _connection_pool(self) -> _AsyncConnectionPool:
+        if self._pool is None:
+            context = self._ssl_context() if self._config.base_url.startswith("https://") else None
+            self._pool = _AsyncConnectionPool(
+                self._config.base_url,
+                size=self._config.pool_size,
+                idle_timeout=self._config.pool_idle_timeout_seconds,
+                ssl_context=context,
+            )
+        return self._pool
+
+    async def _post_json(
+        self, path: str, payload: dict[str, Any], *, timeout_seconds: float | None = None
+    ) -> dict[str, Any]:
+        response = await self._post(path, payload, timeout_seconds=timeout_seconds)
+        return self._decode_response(*response)
+
+    async def _post(
+        self, path: str, payload: dict[str, Any], *, timeout_seconds: float | None = None
+    ) -> tuple[int, bytes, str | None]:
+        pool = self._connection_pool()
+        request = self._encode_request(pool, path, *self._request_body(payload))
+        async with self._slots:
+            connection: _AsyncConnection | None = None
+            try:
+                async with asyncio.timeout(self._request_timeout(timeout_seconds)):
+                    connection, reused = await pool.acquire()
+                    try:
+                        status, body, encoding, keep_alive = await self._exchange(
+                            connection, request
+                        )
+                    except _ASYNC_STALE_CONNECTION_ERRORS:
+                        connection.close()
+                        if not reused:
+                            raise
+                        connection = await pool.connect()
+                        status, body, encoding, keep_alive = await self._exchange(
+                            connection, request
+                        )
+            except BaseException as exc:
+                # A request that failed or was cancelled part-way may leave unread response bytes
+                # behind, so its connection is closed rather than returned to the pool.
+                if connection is not None:
+                    await connection.aclose()
+                if isinstance(exc, TimeoutError):
+                    raise AgentClientError(
+                        "Agent request failed: timed out", retryable=True
+                    ) from exc
+                if isinstance(exc, (OSError, ValueError, asyncio.IncompleteReadError)):
+                    raise AgentClientError(f"Agent request failed: {exc}", retryable=True) from exc
+                raise
+
+        if keep_alive:
+            pool.release(connection)
+        else:
+            connection.close()
+        return status, body, encoding
+
+    def _encode_request(
+        self, pool: _AsyncConnectionPool, path: str, data: bytes, headers: dict[str, str]
+    ) -> bytes:
+        extra = "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+        head = (
+            f"POST {pool.path_prefix}{path} HTTP/1.1\r\n"
+            f"Host: {pool.host_header}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            "Accept-Encoding: gzip\r\n"
+            f"{extra}"
+            "Connection: keep-alive\r\n\r\n"
+        )
+        return head.encode("latin-1") + data
+
+    async def _exchange(
+        self, connection: _AsyncConnection, request: bytes
+    ) -> tuple[int, bytes, str | None, bool]:
+        connection.writer.write(request)
+        await connection.writer.drain()
+        reader = connection.reader
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Agent closed the connection")
+        version, _, rest = status_line.decode("latin-1").partition(" ")
+        status = int(rest.split(" ", 1)[0])
+        headers: dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+        if "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+        elif headers.get("transfer-encoding", "").lower() == "chunked":
+            body = await _read_chunked(reader)
+        else:
+            body = await reader.read()
+            keep_alive = False
+        return status, body, headers.get("content-encoding"), keep_alive
+
+
+# A reused connection that fails before any response byte arrived is retried once.
+_ASYNC_STALE_CONNECTION_ERRORS = (ConnectionResetError, BrokenPipeError)
+
+
+async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+    chunks: list[bytes] = []
+    while True:
+        size = int((await reader.readline()).split(b";", 1)[0].strip(), 16)
+        if size == 0:
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            return b"".join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readline()
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Collection, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from bas_orchestrator.agent_client import (
+    BATCH_FEATURE,
+    AgentClient,
+    AgentClientConfig,
+    AgentClientError,
+    HandshakeResult,
+)
+from bas_orchestrator.handshake_cache import HandshakeCache
+from bas_orchestrator.scheduler import CircuitBreaker, CircuitBreakerPolicy, LatencyWindow
+
+# Keys an agents file may set per agent; mock_* and enabled are reserved for tests/CLI flags.
+_AGENT_FILE_KEYS = frozenset(
+    config_field.name
+    for config_field in fields(AgentClientConfig)
+    if config_field.name != "enabled" and not config_field.name.startswith("mock_")
+)
+_LATENCY_SMOOTHING = 0.2
+
+
+class AgentPoolError(Exception):
+    pass
+
+
+@dataclass
+class PooledAgent:
+    client: AgentClient
+    # Handshake accepted when the pool connected; fixes the agent id used for routing keys.
+    connected_handshake: HandshakeResult
+    position: int
+    in_flight: int = 0
+    latency_ewma: float | None = None
+    breaker: CircuitBreaker | None = None
+
+    @property
+    def handshake(self) -> HandshakeResult:
+        # Background revalidation of a cached handshake replaces the client's result, so
+        # capability and feature checks follow what the agent reports now.
+        return self.client.handshake_result or self.connected_handshake
+
+    @property
+    def agent_id(self) -> str:
+        return self.connected_handshake.agent_id
+
+    @property
+    def supports_batch(self) -> bool:
+        return BATCH_FEATURE in self.handshake.features
+
+    def expected_wait(self) -> float:
+        # Agents without latency samples sort first so every agent gets probed.
+        return (self.in_flight + 1) * (self.latency_ewma or 0.0)
+
+
+class AgentPool:
+    # Routes each module to the least loaded agent that has its capability. Load is the
+    # expected wait: in-flight requests times the agent's smoothed observed latency.
+    def __init__(self, agents: Sequence[PooledAgent], *, latency_window: int = 256) -> None:
+        self.agents = list(agents)
+        # Single-module round trips across the whole pool; feeds the hedging threshold.
+        self.latencies = LatencyWindow(latency_window)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def connect(
+        cls,
+        configs: Sequence[AgentClientConfig],
+        *,
+        capabilities: list[str],
+        version: str,
+        breaker: CircuitBreakerPolicy | None = None,
+        latency_window: int = 256,
+        handshake_cache: HandshakeCache | None = None,
+    ) -> AgentPool:
+        # A single agent must cover every requested capability (as before); in a fleet each
+        # agent may cover a subset and modules are routed accordingly.
+        require_capabilities = len(configs) == 1
+        clients = [AgentClient(config) for config in configs]
+
+        def handshake(index: int) -> HandshakeResult:
+            config = configs[index]
+            return clients[index].handshake(
+                agent_id=config.agent_id,
+                capabilities=capabilities,
+                version=version,
+                expected_policy_hash=config.expected_policy_hash,
+                require_capabilities=require_capabilities,
+                cache=handshake_cache,
+            )
+
+        agents: list[PooledAgent] = []
+        failures: list[str] = []
+        with ThreadPoolExecutor(
+            max_workers=max(1, len(clients)), thread_name_prefix="bas-handshake"
+        ) as executor:
+            futures = [executor.submit(handshake, index) for index in range(len(clients))]
+            for index, future in enumerate(futures):
+                try:
+                    result = future.result()
+                except AgentClientError as exc:
+                    clients[index].close()
+                    failures.append(str(exc))
+                    continue
+                agents.append(
+                    PooledAgent(
+                        clients[index],
+                        result,
+                        index,
+                        breaker=CircuitBreaker(breaker) if breaker is not None else None,
+                    )
+                )
+        if not agents:
+            raise AgentClientError("; ".join(failures) or "No agents configured")
+        return cls(agents, latency_window=latency_window)
+
+    @property
+    def supports_batch(self) -> bool:
+        return any(agent.supports_batch for agent in self.agents)
+
+    @property
+    def agent_ids(self) -> list[str]:
+        return sorted({agent.agent_id for agent in self.agents})
+
+    def can_run(self, modules: Collection[str], *, batch: bool = False) -> bool:
+        return any(self._eligible(agent, modules, batch) for agent in self.agents)
+
+    def can_hedge(self, modules: Collection[str]) -> bool:
+        available = [
+            agent
+            for agent in self.agents
+            if self._eligible(agent, modules, False)
+            and (agent.breaker is None or agent.breaker.available())
+        ]
+        return len({agent.agent_id for agent in available}) > 1
+
+    @contextmanager
+    def route(
+        self,
+        modules: Collection[str],
+        *,
+        batch: bool = False,
+        avoid: Collection[str] = (),
+        slot: Callable[[PooledAgent], AbstractContextManager[object]] | None = None,
+    ) -> Iterator[PooledAgent]:
+        # avoid: agent ids that just failed this request; used only if another agent can serve.
+        # slot: entered for the chosen agent before the request is timed, so waiting for a
+        # concurrency slot or rate token is not counted as agent latency.
+        with self._lock:
+            capable = [agent for agent in self.agents if self._eligible(agent, modules, batch)]
+            if not capable:
+                raise AgentClientError("No connected agent supports the requested modules")
+            candidates = [
+                agent for agent in capable if agent.breaker is None or agent.breaker.available()
+            ]
+            if not candidates:
+                raise AgentClientError("Circuit open for every agent able to run the request")
+            preferred = [agent for agent in candidates if agent.agent_id not in avoid]
+            agent = min(
+                preferred or candidates,
+                key=lambda item: (item.expected_wait(), item.in_flight, item.position),
+            )
+            agent.in_flight += 1
+            if agent.breaker is not None:
+                agent.breaker.begin()
+        elapsed: float | None = None
+        dispatched = False
+        try:
+            with slot(agent) if slot is not None else nullcontext():
+                dispatched = True
+                started = time.monotonic()
+                yield agent
+                elapsed = time.monotonic() - started
+        except AgentClientError as exc:
+            # Errors the agent answered deliberately (4xx, bad payload) prove it is alive.
+            if agent.breaker is not None:
+                if exc.retryable:
+                    agent.breaker.record_failure()
+                else:
+                    agent.breaker.record_success()
+            raise
+        except BaseException:
+            # A request that never left (its slot wait gave up) says nothing about the agent.
+            if agent.breaker is not None:
+                if dispatched:
+                    agent.breaker.record_failure()
+                else:
+                    agent.breaker.release()
+            raise
+        finally:
+            with self._lock:
+                agent.in_flight -= 1
+                if elapsed is not None:
+                    if agent.breaker is not None:
+                        agent.breaker.record_success()
+                    if not batch:
+                        self.latencies.add(elapsed)
+                    previous = agent.latency_ewma
+                    agent.latency_ewma = (
+                        elapsed
+                        if previous is None
+                        else previous + _LATENCY_SMOOTHING * (elapsed - previous)
+                    )
+
+    def close(self) -> None:
+        for agent in self.agents:
+            agent.client.close()
+
+    def _eligible(self, agent: PooledAgent, modules: Collection[str], batch: bool) -> bool:
+        # A cached handshake that failed background revalidation takes the agent out of rotation.
+        if agent.client.handshake_result is None:
+            return False
+        if batch and not agent.supports_batch:
+            return False
+        return all(module in agent.handshake.capabilities for module in modules)
+
+
+def load_agent_configs(path: Path) -> list[AgentClientConfig]:
+    # agents file: {"agents": [{"base_url": ..., "cert_path": ..., ...}, ...]}
+    try:
+        raw = yaml.safe_load(path.read_text())
+    except FileNotFoundError as exc:
+        raise AgentPoolError(f"Agents file not found: {path}") from exc
+    except yaml.YAMLError as exc:
+        raise AgentPoolError(f"Invalid YAML in agents file: {path}") from exc
+
+    entries = raw.get("agents") if isinstance(raw, dict) else None
+    if not isinstance(entries, list) or not entries:
+        raise AgentPoolError("Agents file must contain a non-empty 'agents' list")
+    return [_agent_config(entry, position) for position, entry in enumerate(entries)]
+
+
+def _agent_config(entry: Any, position: int) -> AgentClientConfig:
+    if not isinstance(entry, dict) or not isinstance(entry.get("base_url"), str):
+        raise AgentPoolError(f"Agent entry {position} must be an object with a base_url")
+    unknown = sorted(set(entry) - _AGENT_FILE_KEYS)
+    if unknown:
+        raise AgentPoolError(f"Agent entry {position} has unknown keys: {', '.join(unknown)}")
+    return AgentClientConfig(**entry, enabled=True)
@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import gzip
+import json
+import random
+import ssl
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from pydantic import ValidationError
+
+from bas_orchestrator.agent_client import BATCH_FEATURE, GZIP_FEATURE
+from bas_orchestrator.models import ModuleResult
+from bas_orchestrator.modules.base import ModuleContext
+from bas_orchestrator.modules.registry import get_module, list_modules
+
+# A stand-in agent that speaks the real HTTP protocol (docs/specs/AGENT_API.md) and runs the
+# local registry modules, with injected latency, errors and a concurrency cap. It exists for
+# benchmarking the client, pool and scheduler offline; it does not enforce scope expiry.
+
+
+class AgentSimError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class LatencyDistribution:
+    # Parameters are in milliseconds, except the lognormal sigma.
+    kind: str = "constant"
+    params: tuple[float, ...] = (0.0,)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "constant":
+            millis = self.params[0]
+        elif self.kind == "uniform":
+            millis = rng.uniform(self.params[0], self.params[1])
+        elif self.kind == "exponential":
+            millis = rng.expovariate(1.0 / self.params[0]) if self.params[0] > 0 else 0.0
+        else:
+            millis = self.params[0] * rng.lognormvariate(0.0, self.params[1])
+        return max(0.0, millis) / 1000.0
+
+
+def parse_latency(spec: str) -> LatencyDistribution:
+    # constant:MS | uniform:LOW_MS:HIGH_MS | exponential:MEAN_MS | lognormal:MEDIAN_MS:SIGMA
+    kind, _, rest = spec.partition(":")
+    arity = {"constant": 1, "uniform": 2, "exponential": 1, "lognormal": 2}
+    if kind not in arity:
+        raise AgentSimError(f"Unknown latency distribution: {kind}")
+    try:
+        params = tuple(float(part) for part in rest.split(":")) if rest else ()
+    except ValueError as exc:
+        raise AgentSimError(f"Invalid latency parameters: {spec}") from exc
+    if len(params) != arity[kind] or any(param < 0 for param in params):
+        raise AgentSimError(f"Invalid latency parameters: {spec}")
+    if kind == "uniform" and params[0] > params[1]:
+        raise AgentSimError(f"Invalid latency parameters: {spec}")
+    return LatencyDistribution(kind=kind, params=params)
+
+
+@dataclass(frozen=True)
+class AgentSimConfig:
+    agent_id: str = "agent-sim"
+    # Defaults to every module in the local registry.
+    capabilities: list[str] | None = None
+    policy_hash: str | None = None
+    features: list[str] = field(default_factory=lambda: [BATCH_FEATURE, GZIP_FEATURE])
+    latency: LatencyDistribution = field(default_factory=LatencyDistribution)
+    # Fraction of requests answered with HTTP 503 before any work is done.
+    error_rate: float = 0.0
+    # Requests beyond this many in flight are answered with HTTP 429.
+    max_concurrency: int | None = None
+    seed: int | None = None
+    compress_min_bytes: int = 1024
+
+    def __post_init__(self) -> None:
+        if not 0.0 <= self.error_rate <= 1.0:
+            raise AgentSimError("error_rate must be between 0 and 1")
+        if self.max_concurrency is not None and self.max_concurrency < 1:
+            raise AgentSimError("max_concurrency must be at least 1")
+
+
+@dataclass
+class AgentSimStats:
+    requests: int = 0
+    modules: int = 0
+    injected_errors: int = 0
+    rejected: int = 0
+    peak_in_flight: int = 0
+
+
+def server_ssl_context(
+    cert_path: str, key_path: str, client_ca_path: str | None = None
+) -> ssl.SSLContext:
+    # With a client CA the simulator requires a client certificate (mTLS), like a real agent.
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    try:
+        context.load_cert_chain(cert_path, key_path)
+        if client_ca_path:
+            context.load_verify_locations(client_ca_path)
+            context.verify_mode = ssl.CERT_REQUIRED
+    except (OSError, ssl.SSLError) as exc:
+        raise AgentSimError(f"Failed to load TLS material: {exc}") from exc
+    return context
+
+
+class AgentSimServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        config: AgentSimConfig,
+        address: tuple[str, int] = ("127.0.0.1", 0),
+        *,
+        ssl_context: ssl.SSLContext | None = None,
+    ) -> None:
+        super().__init__(address, _AgentSimHandler)
+        self.config = config
+        self.capabilities = config.capabilities or list_modules()
+        self.stats = AgentSimStats()
+        self._ssl_context = ssl_context
+        self._rng = random.Random(config.seed)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        scheme = "https" if self._ssl_context is not None else "http"
+        return f"{scheme}://{host!s}:{port}"
+
+    def finish_request(self, request: Any, client_address: Any) -> None:
+        # The TLS handshake runs on the request thread so a slow client cannot stall accept().
+        if self._ssl_context is not None:
+            try:
+                request = self._ssl_context.wrap_socket(request, server_side=True)
+            except (OSError, ssl.SSLError):
+                return
+        super().finish_request(request, client_address)
+
+    def admit(self) -> int | None:
+        # Returns the HTTP status to fail the request with, or None once a slot is taken.
+        with self._lock:
+            self.stats.requests += 1
+            if self.config.error_rate and self._rng.random() < self.config.error_rate:
+                self.stats.injected_errors += 1
+                return 503
+            limit = self.config.max_concurrency
+            if limit is not None and self._in_flight >= limit:
+                self.stats.rejected += 1
+                return 429
+            self._in_flight += 1
+            self.stats.peak_in_flight = max(self.stats.peak_in_flight, self._in_flight)
+            return None
+
+    def release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def delay(self) -> float:
+        with self._lock:
+            return self.config.latency.sample(self._rng)
+
+    def handshake(self, payload: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "agent_id": self.config.agent_id,
+            "status": "ok",
+            "policy_hash": self.config.policy_hash,
+            "capabilities": self.capabilities,
+            "features": self.config.features,
+        }
+
+    def execute(self, payload: dict[str, Any]) -> dict[str, Any]:
+        with self._lock:
+            self.stats.modules += 1
+        module_id = str(payload.get("module_id", "unknown"))
+        module_name = str(payload.get("module", ""))
+        scope = payload.get("scope") or {}
+        if module_name not in self.capabilities:
+            return _error_result(module_id, f"module not offered by agent: {module_name}")
+        context = ModuleContext(
+            module_id=module_id,
+            target_id=str(payload.get("target_id", "")),
+            params=dict(payload.get("params") or {}),
+            expectations=dict(payload.get("expectations") or {}),
+            scope_allowlist=list(scope.get("allowlist") or []),
+        )
+        try:
+            result = get_module(module_name).run(context)
+        except Exception as exc:
+            return _error_result(module_id, f"{type(exc).__name__}: {exc}")
+        return result.model_dump(mode="json", exclude_none=True)
+
+
+def _error_result(module_id: str, message: str) -> dict[str, Any]:
+    now = datetime.now(UTC)
+    return ModuleResult(
+        module_id=module_id,
+        status="error",
+        started_at=now,
+        finished_at=now,
+        evidence={"error": "agent-sim failure", "message": message},
+    ).model_dump(mode="json", exclude_none=True)
+
+
+class _AgentSimHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: AgentSimServer
+
+    def do_POST(self) -> None:
+        try:
+            payload = self._read_payload()
+        except (ValueError, OSError, EOFError, zlib.error):
+            self._respond(400, {"error": "invalid request body"})
+            return
+
+        routes = {
+            "/v1/agent/handshake": self.server.handshake,
+            "/v1/agent/modules/execute": self.server.execute,
+            "/v1/agent/modules/execute-batch": self._execute_batch,
+        }
+        route = routes.get(self.path)
+        if route is None:
+            self._respond(404, {"error": "not found"})
+            return
+
+        failure = self.server.admit()
+        if failure is not None:
+            self._respond(failure, {"error": "simulated failure"})
+            return
+        try:
+            time.sleep(self.server.delay())
+            try:
+                body = route(payload)
+            except (ValidationError, TypeError, ValueError):
+                self._respond(400, {"error": "invalid payload"})
+                return
+            self._respond(200, body)
+        finally:
+            self.server.release()
+
+    def _execute_batch(self, payload: dict[str, Any]) -> dict[str, Any]:
+        modules = payload.get("modules")
+        if not isinstance(modules, list):
+            raise ValueError("modules must be a list")
+        return {"results": [self.server.execute(item) for item in modules]}
+
+    def _read_payload(self) -> dict[str, Any]:
+        length = int(self.headers.get("Content-Length", "0"))
+        data = self.rfile.read(length)
+        if self.headers.get("Content-Encoding", "identity").lower() == "gzip":
+            data = gzip.decompress(data)
+        payload = json.loads(data)
+        if not isinstance(payload, dict):
+            raise ValueError("payload must be an object")
+        return payload
+
+    def _respond(self, status: int, body: dict[str, Any]) -> None:
+        data = json.dumps(body).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        config = self.server.config
+        if (
+            GZIP_FEATURE in config.features
+            and "gzip" in self.headers.get("Accept-Encoding", "")
+            and len(data) >= config.compress_min_bytes
+        ):
+            data = gzip.compress(data, compresslevel=6, mtime=0)
+            headers["Content-Encoding"] = "gzip"
+        try:
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        except (TimeoutError, BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return
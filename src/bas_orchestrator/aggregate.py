@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import glob
+import multiprocessing
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from bas_orchestrator.evidence_stream import EvidenceStreamError, load_report_rows
+from bas_orchestrator.history import evidence_files
+from bas_orchestrator.scheduler import nearest_rank
+
+# Aggregate reporting over many evidence packs and streams. Each file is reduced to its report
+# fields (module, status, duration) in a worker process using the schema-light loader, and
+# only those small digests are combined here, in run start order.
+
+DEFAULT_REGRESSION_LIMIT = 10
+_GLOB_CHARS = frozenset("*?[")
+
+
+@dataclass(frozen=True)
+class RunDigest:
+    path: str
+    run_id: str | None = None
+    campaign_name: str | None = None
+    started_at: datetime | None = None
+    # (module_id, status, duration_ms) in campaign order.
+    results: tuple[tuple[str, str, int], ...] = ()
+    error: str | None = None
+
+
+def is_aggregate_source(spec: str) -> bool:
+    # An existing path is taken literally, even if its name contains glob characters.
+    path = Path(spec)
+    if path.exists():
+        return path.is_dir()
+    return any(char in _GLOB_CHARS for char in spec)
+
+
+def aggregate_paths(spec: str) -> list[Path]:
+    # A directory (searched recursively for evidence files) or a glob pattern.
+    if Path(spec).is_dir():
+        return list(evidence_files([Path(spec)]))
+    return sorted(Path(match) for match in glob.glob(spec, recursive=True) if Path(match).is_file())
+
+
+def digest_run(path: str) -> RunDigest:
+    try:
+        header, rows = load_report_rows(Path(path))
+        results = tuple(
+            (
+                row.module_id,
+                row.status,
+                int((row.finished_at - row.started_at).total_seconds() * 1000),
+            )
+            for row in rows
+        )
+    except EvidenceStreamError as exc:
+        return RunDigest(path, error=exc.reason)
+    return RunDigest(path, header.run_id, header.campaign_name, header.started_at, results)
+
+
+def digest_runs(paths: list[Path], *, workers: int | None = None) -> list[RunDigest]:
+    workers = workers or os.cpu_count() or 1
+    names = [str(path) for path in paths]
+    if workers <= 1 or len(names) <= 1:
+        return [digest_run(name) for name in names]
+    methods = multiprocessing.get_all_start_methods()
+    method = "forkserver" if "forkserver" in methods else "spawn"
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(names)), mp_context=multiprocessing.get_context(method)
+    ) as pool:
+        chunksize = max(1, len(names) // (workers * 4))
+        return list(pool.map(digest_run, names, chunksize=chunksize))
+
+
+def aggregate_runs(
+    digests: Iterable[RunDigest], *, regression_limit: int = DEFAULT_REGRESSION_LIMIT
+) -> dict[str, Any]:
+    digests = list(digests)
+    errors = [{"path": item.path, "reason": item.error} for item in digests if item.error]
+    runs = sorted(
+        (item for item in digests if item.error is None and item.started_at is not None),
+        key=lambda item: (item.started_at, item.run_id or ""),
+    )
+    outcomes: dict[str, list[tuple[str, str]]] = {}
+    durations: dict[str, list[int]] = {}
+    for run in runs:
+        for module_id, status, duration_ms in run.results:
+            outcomes.setdefault(module_id, []).append((run.run_id or "", status))
+            durations.setdefault(module_id, []).append(duration_ms)
+
+    modules = [
+        _module_row(module_id, outcomes[module_id], sorted(durations[module_id]))
+        for module_id in sorted(outcomes)
+    ]
+    regressions = sorted(
+        (row for module_id in outcomes if (row := _regression(module_id, outcomes[module_id]))),
+        key=lambda row: (-row["prior_pass_rate"], -row["prior_runs"], row["module_id"]),
+    )[:regression_limit]
+    started = [run.started_at.isoformat() for run in runs if run.started_at is not None]
+    return {
+        "ok": not errors and not regressions,
+        "runs": len(runs),
+        "first_started_at": started[0] if started else None,
+        "last_started_at": started[-1] if started else None,
+        "modules": modules,
+        "regressions": regressions,
+        "errors": errors,
+    }
+
+
+def _module_row(
+    module_id: str, outcomes: list[tuple[str, str]], durations: list[int]
+) -> dict[str, Any]:
+    statuses = [status for _, status in outcomes]
+    decided = [status == "pass" for status in statuses if status != "skipped"]
+    # Flakiness: share of consecutive decided runs whose pass/fail outcome flipped.
+    flips = sum(1 for before, after in zip(decided, decided[1:], strict=False) if before != after)
+    return {
+        "module_id": module_id,
+        "runs": len(statuses),
+        "passed": statuses.count("pass"),
+        "failed": statuses.count("fail"),
+        "errored": statuses.count("error"),
+        "skipped": statuses.count("skipped"),
+        "pass_rate": round(sum(decided) / len(decided), 4) if decided else None,
+        "flakiness": round(flips / (len(decided) - 1), 4) if len(decided) > 1 else 0.0,
+        "p50_ms": nearest_rank(durations, 50),
+        "p95_ms": nearest_rank(durations, 95),
+        "last_status": statuses[-1],
+    }
+
+
+def _regression(module_id: str, outcomes: list[tuple[str, str]]) -> dict[str, Any] | None:
+    # A module whose latest decided result fails after it had been passing; the higher its
+    # earlier pass rate, the more significant the regression.
+    decided = [(run_id, status) for run_id, status in outcomes if status != "skipped"]
+    if len(decided) < 2 or decided[-1][1] not in {"fail", "error"}:
+        return None
+    prior = [status for _, status in decided[:-1]]
+    if prior[-1] != "pass":
+        return None
+    streak = 0
+    for status in reversed(prior):
+        if status != "pass":
+            break
+        streak += 1
+    return {
+        "module_id": module_id,
+        "run_id": decided[-1][0],
+        "status": decided[-1][1],
+        "prior_runs": len(prior),
+        "prior_pass_rate": round(prior.count("pass") / len(prior), 4),
+        "passing_streak": streak,
+    }
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from bas_orchestrator.canonical import canonical_json
+from bas_orchestrator.models import EvidencePack, ModuleResult
+
+# Evidence values whose canonical JSON reaches min_bytes are stored once as
+# <dir>/<digest[:2]>/<digest> (SHA-256 of those bytes) and replaced in the result by
+# {"$blob": "sha256:<digest>", "size": n}. Identical payloads from any run share one blob.
+# Packs are signed over the references, so the signature commits to every blob's hash;
+# check() confirms that the referenced blobs are present and unmodified.
+
+BLOB_REF_KEY = "$blob"
+BLOB_DIGEST_PREFIX = "sha256:"
+DEFAULT_BLOB_MIN_BYTES = 4096
+
+
+class BlobStoreError(ValueError):
+    def __init__(self, reason: str, message: str) -> None:
+        super().__init__(message)
+        self.reason = reason
+
+
+def blob_digest(value: object) -> str | None:
+    # The digest named by a blob reference, or None when the value is not a reference.
+    if not isinstance(value, dict) or set(value) != {BLOB_REF_KEY, "size"}:
+        return None
+    ref = value[BLOB_REF_KEY]
+    if not isinstance(ref, str) or not ref.startswith(BLOB_DIGEST_PREFIX):
+        return None
+    return ref[len(BLOB_DIGEST_PREFIX) :]
+
+
+def blob_refs(result: ModuleResult) -> Iterator[tuple[str, str]]:
+    # (evidence key, digest) for every externalized value of a result.
+    for key, value in result.evidence.items():
+        digest = blob_digest(value)
+        if digest is not None:
+            yield key, digest
+
+
+class BlobStore:
+    def __init__(self, directory: Path, *, min_bytes: int = DEFAULT_BLOB_MIN_BYTES) -> None:
+        if min_bytes < 1:
+            raise ValueError("Blob size threshold must be positive")
+        self._directory = directory
+        self._min_bytes = min_bytes
+
+    def put(self, data: bytes) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest)
+        if path.exists():
+            return digest
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename: concurrent writers of the same blob race to identical content.
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        try:
+            data = self._path(digest).read_bytes()
+        except (FileNotFoundError, ValueError) as exc:
+            raise BlobStoreError("missing_blob", f"Evidence blob not found: {digest}") from exc
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise BlobStoreError("invalid_blob", f"Evidence blob hash mismatch: {digest}")
+        return data
+
+    def load(self, digest: str) -> Any:
+        try:
+            return json.loads(self.get(digest))
+        except json.JSONDecodeError as exc:
+            raise BlobStoreError("invalid_blob", f"Evidence blob is not JSON: {digest}") from exc
+
+    def externalize(self, result: ModuleResult) -> ModuleResult:
+        evidence: dict[str, Any] = {}
+        changed = False
+        for key, value in result.evidence.items():
+            data = canonical_json(value)
+            if len(data) < self._min_bytes or blob_digest(value) is not None:
+                evidence[key] = value
+                continue
+            digest = self.put(data)
+            evidence[key] = {BLOB_REF_KEY: BLOB_DIGEST_PREFIX + digest, "size": len(data)}
+            changed = True
+        return result.model_copy(update={"evidence": evidence}) if changed else result
+
+    def externalize_pack(self, evidence: EvidencePack) -> EvidencePack:
+        results = [self.externalize(result) for result in evidence.results]
+        return evidence.model_copy(update={"results": results})
+
+    def resolve(self, result: ModuleResult) -> ModuleResult:
+        refs = dict(blob_refs(result))
+        if not refs:
+            return result
+        evidence = {
+            key: self.load(refs[key]) if key in refs else value
+            for key, value in result.evidence.items()
+        }
+        return result.model_copy(update={"evidence": evidence})
+
+    def check(self, results: Iterable[ModuleResult]) -> int:
+        # Re-hashes each referenced blob once; returns how many distinct blobs were checked.
+        seen: set[str] = set()
+        for result in results:
+            for _, digest in blob_refs(result):
+                if digest not in seen:
+                    self.get(digest)
+                    seen.add(digest)
+        return len(seen)
+
+    def _path(self, digest: str) -> Path:
+        if len(digest) != 64 or any(char not in "0123456789abcdef" for char in digest):
+            raise ValueError(f"Invalid blob digest: {digest}")
+        return self._directory / digest[:2] / digest
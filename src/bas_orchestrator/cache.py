@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from pydantic import ValidationError
+
+from bas_orchestrator.canonical import canonical_digest
+from bas_orchestrator.models import ModuleResult, ModuleSpec, Target
+
+# Results are stored as <dir>/<key[:2]>/<key>.json. The key covers everything that can change
+# a module's outcome, so a hit is only possible for an identical module invocation. An entry's
+# mtime is its store time (TTL) and its atime is set explicitly on every hit (LRU order).
+
+CACHE_FORMAT = "v1"
+_CACHEABLE_STATUSES = {"pass", "fail", "skipped"}
+
+
+def cache_key(
+    module_spec: ModuleSpec,
+    *,
+    target: Target,
+    allowlist: list[str],
+    policy_hash: str | None,
+    module_version: str,
+) -> str:
+    payload = {
+        "format": CACHE_FORMAT,
+        "module_spec": module_spec.model_dump(mode="json"),
+        "target": target.model_dump(mode="json"),
+        "allowlist": allowlist,
+        "policy_hash": policy_hash,
+        "module_version": module_version,
+    }
+    return canonical_digest(payload)
+
+
+class ResultCache:
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        ttl_seconds: float | None = None,
+        max_bytes: int | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError("Cache TTL must be positive")
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError("Cache size limit must not be negative")
+        self._directory = directory
+        self._ttl_seconds = ttl_seconds
+        self._max_bytes = max_bytes
+        self._clock = clock
+
+    def get(self, key: str) -> ModuleResult | None:
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_bytes())
+            stored_at = float(entry["stored_at"])
+            result = ModuleResult.model_validate(entry["result"])
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError, ValidationError):
+            path.unlink(missing_ok=True)
+            return None
+        now = self._clock()
+        if self._ttl_seconds is not None and now - stored_at > self._ttl_seconds:
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(path, (now, path.stat().st_mtime))
+        except FileNotFoundError:  # pragma: no cover - evicted concurrently
+            pass
+        return result
+
+    def put(self, key: str, result: ModuleResult) -> None:
+        if result.status not in _CACHEABLE_STATUSES:
+            return
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        now = self._clock()
+        entry: dict[str, Any] = {"stored_at": now, "result": result.model_dump(mode="json")}
+        # Write-then-rename keeps readers from ever seeing a partial entry.
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(entry, handle, sort_keys=True, separators=(",", ":"))
+            os.utime(tmp_name, (now, now))
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def prune(self) -> int:
+        if not self._directory.exists():
+            return 0
+        now = self._clock()
+        entries: list[tuple[float, int, Path]] = []
+        removed = 0
+        for path in self._directory.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # pragma: no cover - evicted concurrently
+                continue
+            if self._ttl_seconds is not None and now - stat.st_mtime > self._ttl_seconds:
+                path.unlink(missing_ok=True)
+                removed += 1
+                continue
+            entries.append((stat.st_atime, stat.st_size, path))
+        if self._max_bytes is None:
+            return removed
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self._max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+    def _path(self, key: str) -> Path:
+        return self._directory / key[:2] / f"{key}.json"
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import hmac
+import json
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+from bas_orchestrator.models import EvidencePack
+
+# The one canonical JSON form used for signatures, content hashes and compact evidence files:
+# sorted keys, compact separators, ASCII-escaped, UTF-8. Changing it invalidates every existing
+# signature, cache key and policy hash.
+
+SIGNATURE_ALG = "hmac-sha256"
+SIGNATURE_FIELDS = frozenset({"signature", "signature_alg", "merkle_root"})
+
+
+def canonical_json(value: object) -> bytes:
+    return json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def canonical_digest(value: object) -> str:
+    return hashlib.sha256(canonical_json(value)).hexdigest()
+
+
+def model_digest(model: BaseModel) -> str:
+    return canonical_digest(model.model_dump(mode="json"))
+
+
+def canonical_array(items: Iterable[object]) -> Iterator[bytes]:
+    yield b"["
+    for index, item in enumerate(items):
+        if index:
+            yield b","
+        yield canonical_json(item)
+    yield b"]"
+
+
+def canonical_object(fields: Mapping[str, bytes | Iterable[bytes]]) -> Iterator[bytes]:
+    # Emits an object from pre-serialized member values (bytes, or chunks for large arrays);
+    # byte-for-byte equal to canonical_json of the corresponding dict.
+    yield b"{"
+    for position, key in enumerate(sorted(fields)):
+        yield (b"," if position else b"") + canonical_json(key) + b":"
+        value = fields[key]
+        if isinstance(value, bytes):
+            yield value
+        else:
+            yield from value
+    yield b"}"
+
+
+def hmac_chunks(chunks: Iterable[bytes], key: str) -> str:
+    mac = hmac.new(key.encode("utf-8"), digestmod=hashlib.sha256)
+    for chunk in chunks:
+        mac.update(chunk)
+    return mac.hexdigest()
+
+
+class CanonicalEvidence:
+    # An evidence pack dumped and serialized once. Signing, verification and compact file
+    # output all reuse the same per-field bytes; only the signature fields are added later.
+    def __init__(self, evidence: EvidencePack) -> None:
+        self.evidence = evidence
+        self._payload = evidence.model_dump(mode="json", exclude=set(SIGNATURE_FIELDS))
+        self._fields = {key: canonical_json(value) for key, value in self._payload.items()}
+        self._signature: dict[str, Any] = evidence.model_dump(
+            mode="json", include=set(SIGNATURE_FIELDS)
+        )
+
+    def digest(self, key: str) -> str:
+        return hmac_chunks(canonical_object(self._fields), key)
+
+    def sign(self, key: str) -> EvidencePack:
+        self._signature = {"signature_alg": SIGNATURE_ALG, "signature": self.digest(key)}
+        self.evidence = self.evidence.model_copy(update={**self._signature, "merkle_root": None})
+        return self.evidence
+
+    def verify(self, key: str) -> bool:
+        signature = self._signature.get("signature")
+        if self._signature.get("signature_alg") != SIGNATURE_ALG or not signature:
+            return False
+        return hmac.compare_digest(self.digest(key), signature)
+
+    def chunks(self) -> Iterator[bytes]:
+        signature = {key: canonical_json(value) for key, value in self._signature.items()}
+        return canonical_object({**self._fields, **signature})
+
+    def write(self, path: Path, *, compact: bool = False, compress: bool = False) -> None:
+        # compress gzips the same bytes; the signature covers the canonical form, not the file.
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(path, "wb") if compress else path.open("wb") as handle:
+            if not compact:
+                document = {**self._payload, **self._signature}
+                handle.write(json.dumps(document, indent=2, sort_keys=True).encode("utf-8"))
+                return
+            for chunk in self.chunks():
+                handle.write(chunk)
@@ -1,25 +1,78 @@
 from __future__ import annotations
 
 import json
+import sqlite3
+from collections.abc import Iterable
 from pathlib import Path
+from typing import Any
 
 import typer
 import yaml
 from pydantic import ValidationError
 
-from bas_orchestrator.agent_client import AgentClientConfig
+from bas_orchestrator.agent_client import BATCH_FEATURE, GZIP_FEATURE, AgentClientConfig
+from bas_orchestrator.agent_pool import AgentPoolError, load_agent_configs
+from bas_orchestrator.agent_sim import (
+    AgentSimConfig,
+    AgentSimError,
+    AgentSimServer,
+    parse_latency,
+    server_ssl_context,
+)
+from bas_orchestrator.aggregate import (
+    DEFAULT_REGRESSION_LIMIT,
+    aggregate_paths,
+    aggregate_runs,
+    digest_runs,
+    is_aggregate_source,
+)
+from bas_orchestrator.blob_store import DEFAULT_BLOB_MIN_BYTES, BlobStore, BlobStoreError
+from bas_orchestrator.cache import ResultCache
+from bas_orchestrator.canonical import CanonicalEvidence
 from bas_orchestrator.engine import (
+    DEFAULT_AGENT_BATCH_SIZE,
     CampaignLoadError,
     compute_policy_hash,
+    dependency_errors,
     effective_allowlist,
     load_campaign,
     load_policy,
     run_campaign,
     sign_evidence,
+    stream_campaign,
     verify_evidence,
 )
-from bas_orchestrator.models import EvidencePack, ModuleResult, ModuleSpec
+from bas_orchestrator.evidence_stream import (
+    EvidenceStream,
+    EvidenceStreamError,
+    EvidenceStreamWriter,
+    is_evidence_stream,
+    load_report_rows,
+    open_evidence_stream,
+    read_evidence_bytes,
+    verify_evidence_stream,
+)
+from bas_orchestrator.handshake_cache import DEFAULT_HANDSHAKE_TTL_SECONDS, HandshakeCache
+from bas_orchestrator.history import (
+    HISTORY_VIEWS,
+    HistoryError,
+    HistoryFilter,
+    HistoryIndex,
+    evidence_files,
+    parse_time,
+)
+from bas_orchestrator.isolation import ProcessIsolationConfig
+from bas_orchestrator.journal import JournalError, RunJournal
+from bas_orchestrator.merkle import PROOF_RECORD, MerkleProofError, build_proof, verify_proof
+from bas_orchestrator.models import (
+    EvidenceHeader,
+    EvidencePack,
+    ModuleResult,
+    ModuleSpec,
+    ResultRow,
+)
 from bas_orchestrator.modules.registry import get_module, list_modules
+from bas_orchestrator.scheduler import CircuitBreakerPolicy, HedgePolicy, RetryPolicy
 from bas_orchestrator.schema import dump_schemas
 from bas_orchestrator.summary_validate import (
     diff_summary as diff_summary_payload,
@@ -37,7 +90,18 @@ DETERMINISTIC_OPT = typer.Option(
     False, "--deterministic", help="Use stable timestamps and run id for reproducibility"
 )
 SIGN_KEY_OPT = typer.Option(None, "--sign-key", help="HMAC key for signing evidence pack")
-AGENT_URL_OPT = typer.Option(None, "--agent-url", help="Remote agent base URL")
+SIGN_MODES = ("hmac", "merkle")
+SIGN_MODE_OPT = typer.Option(
+    "hmac",
+    "--sign-mode",
+    help="hmac (whole pack) or merkle (per-result leaves, enables `bas prove`)",
+)
+AGENT_URL_OPT = typer.Option(
+    None, "--agent-url", help="Remote agent base URL (repeat to route across several agents)"
+)
+AGENTS_FILE_OPT = typer.Option(
+    None, "--agents-file", help="YAML/JSON file listing remote agents (implies --agent-enabled)"
+)
 AGENT_ENABLED_OPT = typer.Option(False, "--agent-enabled", help="Enable remote agent execution")
 AGENT_CERT_OPT = typer.Option(None, "--agent-cert", help="Client TLS cert path")
 AGENT_KEY_OPT = typer.Option(None, "--agent-key", help="Client TLS key path")
@@ -50,19 +114,164 @@ AGENT_ID_OPT = typer.Option(None, "--agent-id", help="Agent id used during hands
 AGENT_POLICY_HASH_OPT = typer.Option(
     None, "--agent-policy-hash", help="Expected agent policy hash for validation"
 )
+AGENT_POOL_SIZE_OPT = typer.Option(
+    8, "--agent-pool-size", min=1, help="Idle keep-alive connections kept per agent"
+)
+AGENT_POOL_IDLE_OPT = typer.Option(
+    30.0, "--agent-pool-idle", min=0, help="Seconds an idle agent connection is kept for reuse"
+)
+AGENT_COMPRESS_MIN_BYTES_OPT = typer.Option(
+    1024,
+    "--agent-compress-min-bytes",
+    min=0,
+    help="Gzip request bodies of at least this size for agents that advertise gzip",
+)
+AGENT_BATCH_SIZE_OPT = typer.Option(
+    DEFAULT_AGENT_BATCH_SIZE,
+    "--agent-batch-size",
+    min=1,
+    help="Modules per execute-batch request for agents that advertise batching (1 disables)",
+)
+AGENT_RETRIES_OPT = typer.Option(
+    0, "--agent-retries", min=0, help="Extra attempts for retryable agent failures"
+)
+AGENT_RETRY_BACKOFF_OPT = typer.Option(
+    0.1, "--agent-retry-backoff", min=0, help="Base delay in seconds for jittered retry backoff"
+)
+AGENT_BREAKER_THRESHOLD_OPT = typer.Option(
+    None,
+    "--agent-breaker-threshold",
+    min=1,
+    help="Stop sending to an agent after N consecutive failures (circuit breaker)",
+)
+AGENT_BREAKER_RESET_OPT = typer.Option(
+    30.0, "--agent-breaker-reset", min=0, help="Seconds before an open circuit lets a probe through"
+)
+AGENT_HEDGE_PERCENTILE_OPT = typer.Option(
+    None,
+    "--agent-hedge-percentile",
+    min=1,
+    max=99,
+    help="Send a hedged copy to a second agent after this latency percentile (e.g. 95)",
+)
+AGENT_HEDGE_MIN_SAMPLES_OPT = typer.Option(
+    20, "--agent-hedge-min-samples", min=1, help="Latency samples required before hedging"
+)
+AGENT_HANDSHAKE_CACHE_OPT = typer.Option(
+    None,
+    "--agent-handshake-cache",
+    help="Directory caching accepted agent handshakes; cached agents are revalidated in background",
+)
+AGENT_HANDSHAKE_TTL_OPT = typer.Option(
+    DEFAULT_HANDSHAKE_TTL_SECONDS,
+    "--agent-handshake-ttl",
+    min=1,
+    help="Maximum age in seconds of a reusable cached handshake",
+)
+CONCURRENCY_OPT = typer.Option(
+    1, "--concurrency", min=1, help="Maximum number of modules executed in parallel"
+)
+OUTPUT_FORMATS = ("json", "json.gz", "ndjson", "ndjson.gz")
+FORMAT_OPT = typer.Option(
+    "json",
+    "--format",
+    help=(
+        "Evidence output format: json (single document) or ndjson (streamed per result), "
+        "optionally gzip-compressed (json.gz, ndjson.gz)"
+    ),
+)
+COMPACT_OPT = typer.Option(
+    False,
+    "--compact",
+    help="Write the JSON evidence pack in canonical compact form (the bytes that are signed)",
+)
+JOURNAL_DIR_OPT = typer.Option(
+    None, "--journal-dir", help="Directory for a crash-safe run journal (<run_id>.journal)"
+)
+RESUME_OPT = typer.Option(None, "--resume", help="Resume an interrupted run from its journal file")
+CACHE_DIR_OPT = typer.Option(
+    None, "--cache-dir", help="Reuse local module results from a content-addressed cache"
+)
+CACHE_TTL_OPT = typer.Option(
+    None, "--cache-ttl", min=1, help="Maximum age in seconds of reusable cached results"
+)
+CACHE_MAX_BYTES_OPT = typer.Option(
+    None, "--cache-max-bytes", min=0, help="Evict least recently used cache entries above this size"
+)
+BLOB_DIR_OPT = typer.Option(
+    None,
+    "--blob-dir",
+    help="Store large evidence values once in this content-addressed blob directory",
+)
+BLOB_MIN_BYTES_OPT = typer.Option(
+    DEFAULT_BLOB_MIN_BYTES,
+    "--blob-min-bytes",
+    min=1,
+    help="Externalize evidence values whose canonical JSON is at least this many bytes",
+)
+DEADLINE_OPT = typer.Option(
+    None,
+    "--deadline",
+    min=0.001,
+    help="Campaign-wide time budget in seconds; unfinished modules are timed out or skipped",
+)
+ISOLATION_MODES = ("thread", "process")
+ISOLATION_OPT = typer.Option(
+    "thread",
+    "--isolation",
+    help="Run local modules in orchestrator threads or in a pool of worker processes",
+)
+WORKER_MAX_TASKS_OPT = typer.Option(
+    None, "--worker-max-tasks", min=1, help="Recycle each worker process after N modules"
+)
+WORKER_MAX_MEMORY_OPT = typer.Option(
+    None, "--worker-max-memory", min=1, help="Address-space limit per worker process in bytes"
+)
+WORKER_MAX_CPU_OPT = typer.Option(
+    None, "--worker-max-cpu", min=1, help="CPU-time limit per worker process in seconds"
+)
 VERIFY_EVIDENCE_ARG = typer.Argument(..., help="Path to evidence pack JSON")
 VERIFY_KEY_OPT = typer.Option(..., "--sign-key", help="HMAC key used to sign evidence")
 VERIFY_JSON_OPT = typer.Option(False, "--json", help="Emit machine-readable JSON output")
+VERIFY_PROOF_OPT = typer.Option(
+    False, "--proof", help="Verify a single-result Merkle proof written by `bas prove`"
+)
+VERIFY_BLOB_DIR_OPT = typer.Option(
+    None, "--blob-dir", help="Also check every referenced evidence blob against its hash"
+)
+PROVE_EVIDENCE_ARG = typer.Argument(..., help="Path to a Merkle-signed evidence pack or stream")
+PROVE_MODULE_OPT = typer.Option(..., "--module-id", help="Module whose result to prove")
+PROVE_OUT_OPT = typer.Option(None, "--out", help="Write the proof here instead of stdout")
 VALIDATE_SPEC_OPT = typer.Option(..., "--spec", help="Path to module spec YAML/JSON")
 VALIDATE_RESULT_OPT = typer.Option(None, "--result", help="Path to module result JSON")
 SCHEMA_OUT_OPT = typer.Option(..., "--out", help="Output directory for JSON schemas")
-REPORT_EVIDENCE_ARG = typer.Argument(..., help="Path to evidence pack JSON")
+REPORT_EVIDENCE_ARG = typer.Argument(
+    ..., help="Evidence pack or stream, or a directory or glob of them for an aggregate report"
+)
 REPORT_JSON_OPT = typer.Option(False, "--json", help="Emit machine-readable JSON output")
 REPORT_EXIT_NONZERO_OPT = typer.Option(
     False,
     "--exit-nonzero",
     help="Exit with code 1 if any module failed/errored (code 2 is reserved for invalid inputs)",
 )
+REPORT_MODULE_OPT = typer.Option(
+    None, "--module-id", help="Print one module's full result instead of the summary"
+)
+REPORT_BLOB_DIR_OPT = typer.Option(
+    None, "--blob-dir", help="Resolve evidence blob references of the printed result"
+)
+REPORT_WORKERS_OPT = typer.Option(
+    None,
+    "--workers",
+    min=1,
+    help="Processes reading packs when reporting over a directory or glob (default: CPU count)",
+)
+REPORT_REGRESSIONS_OPT = typer.Option(
+    DEFAULT_REGRESSION_LIMIT,
+    "--regressions",
+    min=0,
+    help="Number of worst regressions listed in an aggregate report",
+)
 VALIDATE_SUMMARY_ARG = typer.Argument(..., help="Path to summary JSON")
 VALIDATE_SUMMARY_JSON_OPT = typer.Option(False, "--json", help="Emit machine-readable JSON output")
 DIFF_SUMMARY_GOLDEN_ARG = typer.Argument(..., help="Path to golden summary JSON")
@@ -79,12 +288,66 @@ DIFF_SUMMARY_IGNORE_PATH_OPT = typer.Option(
     help="JSON-path patterns to ignore (repeatable, supports * and [*])",
 )
 POLICY_HASH_ARG = typer.Argument(..., help="Path to policy YAML/JSON")
+HISTORY_DB_OPT = typer.Option(
+    Path(".bas/history.db"), "--db", help="SQLite run-history index to update or query"
+)
+INDEX_PATHS_ARG = typer.Argument(..., help="Evidence files or directories to ingest")
+INDEX_KEY_OPT = typer.Option(
+    None, "--sign-key", help="Verify each signature while ingesting and record the outcome"
+)
+INDEX_JSON_OPT = typer.Option(False, "--json", help="Emit machine-readable JSON output")
+HISTORY_VIEW_OPT = typer.Option(
+    "modules",
+    "--view",
+    help="modules (per-module aggregates), runs, trend (per day) or newly-failing",
+)
+HISTORY_MODULE_OPT = typer.Option(None, "--module-id", help="Only results of this module")
+HISTORY_CAMPAIGN_OPT = typer.Option(None, "--campaign", help="Only runs of this campaign")
+HISTORY_STATUS_OPT = typer.Option(None, "--status", help="Only results with this status")
+HISTORY_SINCE_OPT = typer.Option(
+    None, "--since", help="Only results started at or after this time (ISO time or 7d/24h/30m)"
+)
+HISTORY_UNTIL_OPT = typer.Option(
+    None, "--until", help="Only results started before this time (ISO time or 7d/24h/30m)"
+)
+HISTORY_JSON_OPT = typer.Option(False, "--json", help="Emit machine-readable JSON output")
 POLICY_HASH_JSON_OPT = typer.Option(False, "--json", help="Emit machine-readable JSON output")
 VALIDATE_CAMPAIGN_ARG = typer.Argument(..., help="Path to campaign YAML")
 VALIDATE_CAMPAIGN_POLICY_OPT = typer.Option(
     None, "--policy", help="Policy YAML/JSON path with allowlists"
 )
 VALIDATE_CAMPAIGN_JSON_OPT = typer.Option(False, "--json", help="Emit machine-readable JSON output")
+AGENT_SIM_HOST_OPT = typer.Option("127.0.0.1", "--host", help="Address to listen on")
+AGENT_SIM_PORT_OPT = typer.Option(8443, "--port", min=0, max=65535, help="Port to listen on")
+AGENT_SIM_ID_OPT = typer.Option("agent-sim", "--agent-id", help="Agent id returned in handshakes")
+AGENT_SIM_CAPABILITY_OPT = typer.Option(
+    None, "--capability", help="Module offered by the agent (repeatable, default: all local)"
+)
+AGENT_SIM_POLICY_HASH_OPT = typer.Option(
+    None, "--policy-hash", help="Policy hash returned in handshakes"
+)
+AGENT_SIM_LATENCY_OPT = typer.Option(
+    "constant:0",
+    "--latency",
+    help="Per-request latency in ms: constant:MS, uniform:LOW:HIGH, exponential:MEAN, "
+    "lognormal:MEDIAN:SIGMA",
+)
+AGENT_SIM_ERROR_RATE_OPT = typer.Option(
+    0.0, "--error-rate", min=0.0, max=1.0, help="Fraction of requests answered with HTTP 503"
+)
+AGENT_SIM_MAX_CONCURRENCY_OPT = typer.Option(
+    None, "--max-concurrency", min=1, help="Answer HTTP 429 above this many in-flight requests"
+)
+AGENT_SIM_NO_BATCH_OPT = typer.Option(
+    False, "--no-batch", help="Do not advertise the execute-batch feature"
+)
+AGENT_SIM_NO_GZIP_OPT = typer.Option(False, "--no-gzip", help="Do not advertise the gzip feature")
+AGENT_SIM_SEED_OPT = typer.Option(None, "--seed", help="Seed for latency and error injection")
+AGENT_SIM_TLS_CERT_OPT = typer.Option(None, "--tls-cert", help="Server TLS certificate (PEM)")
+AGENT_SIM_TLS_KEY_OPT = typer.Option(None, "--tls-key", help="Server TLS private key (PEM)")
+AGENT_SIM_CLIENT_CA_OPT = typer.Option(
+    None, "--tls-client-ca", help="CA bundle for client certificates (enables mTLS)"
+)
 
 EXAMPLE_CAMPAIGN = """version: v1
 name: "basic-campaign"
@@ -125,7 +388,9 @@ def run(
     out: Path = OUT_OPT,
     deterministic: bool = DETERMINISTIC_OPT,
     sign_key: str | None = SIGN_KEY_OPT,
-    agent_url: str | None = AGENT_URL_OPT,
+    sign_mode: str = SIGN_MODE_OPT,
+    agent_url: list[str] | None = AGENT_URL_OPT,
+    agents_file: Path | None = AGENTS_FILE_OPT,
     agent_enabled: bool = AGENT_ENABLED_OPT,
     agent_cert: str | None = AGENT_CERT_OPT,
     agent_key: str | None = AGENT_KEY_OPT,
@@ -134,7 +399,43 @@ def run(
     policy_path: Path | None = POLICY_OPT,
     agent_id: str | None = AGENT_ID_OPT,
     agent_policy_hash: str | None = AGENT_POLICY_HASH_OPT,
+    agent_pool_size: int = AGENT_POOL_SIZE_OPT,
+    agent_pool_idle: float = AGENT_POOL_IDLE_OPT,
+    agent_compress_min_bytes: int = AGENT_COMPRESS_MIN_BYTES_OPT,
+    agent_batch_size: int = AGENT_BATCH_SIZE_OPT,
+    agent_retries: int = AGENT_RETRIES_OPT,
+    agent_retry_backoff: float = AGENT_RETRY_BACKOFF_OPT,
+    agent_breaker_threshold: int | None = AGENT_BREAKER_THRESHOLD_OPT,
+    agent_breaker_reset: float = AGENT_BREAKER_RESET_OPT,
+    agent_hedge_percentile: float | None = AGENT_HEDGE_PERCENTILE_OPT,
+    agent_hedge_min_samples: int = AGENT_HEDGE_MIN_SAMPLES_OPT,
+    agent_handshake_cache: Path | None = AGENT_HANDSHAKE_CACHE_OPT,
+    agent_handshake_ttl: float = AGENT_HANDSHAKE_TTL_OPT,
+    concurrency: int = CONCURRENCY_OPT,
+    output_format: str = FORMAT_OPT,
+    compact: bool = COMPACT_OPT,
+    journal_dir: Path | None = JOURNAL_DIR_OPT,
+    resume: Path | None = RESUME_OPT,
+    cache_dir: Path | None = CACHE_DIR_OPT,
+    cache_ttl: float | None = CACHE_TTL_OPT,
+    cache_max_bytes: int | None = CACHE_MAX_BYTES_OPT,
+    blob_dir: Path | None = BLOB_DIR_OPT,
+    blob_min_bytes: int = BLOB_MIN_BYTES_OPT,
+    deadline: float | None = DEADLINE_OPT,
+    isolation: str = ISOLATION_OPT,
+    worker_max_tasks: int | None = WORKER_MAX_TASKS_OPT,
+    worker_max_memory: int | None = WORKER_MAX_MEMORY_OPT,
+    worker_max_cpu: int | None = WORKER_MAX_CPU_OPT,
 ) -> None:
+    if output_format not in OUTPUT_FORMATS:
+        raise typer.BadParameter(f"Unsupported format: {output_format}")
+    if isolation not in ISOLATION_MODES:
+        raise typer.BadParameter(f"Unsupported isolation mode: {isolation}")
+    if sign_mode not in SIGN_MODES:
+        raise typer.BadParameter(f"Unsupported sign mode: {sign_mode}")
+    if compact and not output_format.startswith("json"):
+        raise typer.BadParameter("--compact only applies to --format json or json.gz")
+    compress = output_format.endswith(".gz")
     try:
         spec = load_campaign(campaign)
     except CampaignLoadError as exc:
@@ -147,33 +448,200 @@ def run(
         except CampaignLoadError as exc:
             raise typer.BadParameter(str(exc)) from exc
 
-    agent_config = None
+    agent_configs: list[AgentClientConfig] = []
+    if agents_file is not None:
+        try:
+            agent_configs = load_agent_configs(agents_file)
+        except AgentPoolError as exc:
+            raise typer.BadParameter(str(exc)) from exc
     if agent_enabled:
-        if not agent_url:
+        if not agent_url and not agent_configs:
             raise typer.BadParameter("--agent-url is required when --agent-enabled is set")
-        agent_config = AgentClientConfig(
-            base_url=agent_url,
-            cert_path=agent_cert,
-            key_path=agent_key,
-            ca_path=agent_ca,
-            enabled=True,
-            agent_id=agent_id,
-            expected_policy_hash=agent_policy_hash,
-            allow_insecure_http=agent_insecure,
+        agent_configs.extend(
+            AgentClientConfig(
+                base_url=url,
+                cert_path=agent_cert,
+                key_path=agent_key,
+                ca_path=agent_ca,
+                enabled=True,
+                agent_id=agent_id,
+                expected_policy_hash=agent_policy_hash,
+                allow_insecure_http=agent_insecure,
+                pool_size=agent_pool_size,
+                pool_idle_timeout_seconds=agent_pool_idle,
+                compress_min_bytes=agent_compress_min_bytes,
+            )
+            for url in agent_url or []
+        )
+
+    agent_retry = RetryPolicy(
+        max_attempts=agent_retries + 1, base_delay_seconds=agent_retry_backoff
+    )
+    agent_breaker = (
+        CircuitBreakerPolicy(
+            failure_threshold=agent_breaker_threshold, reset_seconds=agent_breaker_reset
         )
-    evidence = run_campaign(
-        spec,
-        deterministic=deterministic,
-        agent_config=agent_config,
-        policy=policy,
+        if agent_breaker_threshold is not None
+        else None
     )
-    if sign_key:
-        evidence = sign_evidence(evidence, sign_key)
-    out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text(json.dumps(evidence.model_dump(mode="json"), indent=2, sort_keys=True))
+    agent_hedge = (
+        HedgePolicy(
+            percentile=agent_hedge_percentile,
+            min_samples=agent_hedge_min_samples,
+            window=max(256, agent_hedge_min_samples),
+        )
+        if agent_hedge_percentile is not None
+        else None
+    )
+
+    handshake_cache = None
+    if agent_handshake_cache is not None:
+        handshake_cache = HandshakeCache(agent_handshake_cache, ttl_seconds=agent_handshake_ttl)
+
+    process_isolation = None
+    if isolation == "process":
+        process_isolation = ProcessIsolationConfig(
+            max_tasks_per_child=worker_max_tasks,
+            max_memory_bytes=worker_max_memory,
+            max_cpu_seconds=worker_max_cpu,
+        )
+
+    cache = None
+    if cache_dir is not None:
+        cache = ResultCache(cache_dir, ttl_seconds=cache_ttl, max_bytes=cache_max_bytes)
+    blobs = BlobStore(blob_dir, min_bytes=blob_min_bytes) if blob_dir is not None else None
+
+    journal = None
+    try:
+        if resume is not None:
+            journal = RunJournal.resume(resume)
+        elif journal_dir is not None:
+            journal = RunJournal(journal_dir)
+
+        if output_format.startswith("ndjson"):
+            writer = EvidenceStreamWriter(
+                out, merkle=sign_mode == "merkle", compress=compress, blobs=blobs
+            )
+            evidence = stream_campaign(
+                spec,
+                writer,
+                deterministic=deterministic,
+                agent_configs=agent_configs,
+                policy=policy,
+                max_workers=concurrency,
+                journal=journal,
+                cache=cache,
+                deadline_seconds=deadline,
+                process_isolation=process_isolation,
+                agent_batch_size=agent_batch_size,
+                agent_retry=agent_retry,
+                agent_breaker=agent_breaker,
+                agent_hedge=agent_hedge,
+                agent_handshake_cache=handshake_cache,
+            )
+            writer.finish(evidence, sign_key=sign_key)
+            if journal is not None:
+                journal.complete()
+            typer.echo(f"Wrote evidence stream to {out}")
+            return
+
+        evidence = run_campaign(
+            spec,
+            deterministic=deterministic,
+            agent_configs=agent_configs,
+            policy=policy,
+            max_workers=concurrency,
+            journal=journal,
+            cache=cache,
+            deadline_seconds=deadline,
+            process_isolation=process_isolation,
+            agent_batch_size=agent_batch_size,
+            agent_retry=agent_retry,
+            agent_breaker=agent_breaker,
+            agent_hedge=agent_hedge,
+            agent_handshake_cache=handshake_cache,
+        )
+    except JournalError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    finally:
+        if journal is not None:
+            journal.close()
+    if blobs is not None:
+        evidence = blobs.externalize_pack(evidence)
+    # Dumped and serialized once; the signature is computed over the same bytes that
+    # --compact writes.
+    if sign_key and sign_mode == "merkle":
+        evidence = sign_evidence(evidence, sign_key, merkle=True)
+    document = CanonicalEvidence(evidence)
+    if sign_key and sign_mode == "hmac":
+        document.sign(sign_key)
+    document.write(out, compact=compact, compress=compress)
+    if journal is not None:
+        journal.complete()
     typer.echo(f"Wrote evidence pack to {out}")
 
 
+@app.command()
+def agent_sim(
+    host: str = AGENT_SIM_HOST_OPT,
+    port: int = AGENT_SIM_PORT_OPT,
+    agent_id: str = AGENT_SIM_ID_OPT,
+    capability: list[str] | None = AGENT_SIM_CAPABILITY_OPT,
+    policy_hash: str | None = AGENT_SIM_POLICY_HASH_OPT,
+    latency: str = AGENT_SIM_LATENCY_OPT,
+    error_rate: float = AGENT_SIM_ERROR_RATE_OPT,
+    max_concurrency: int | None = AGENT_SIM_MAX_CONCURRENCY_OPT,
+    no_batch: bool = AGENT_SIM_NO_BATCH_OPT,
+    no_gzip: bool = AGENT_SIM_NO_GZIP_OPT,
+    seed: int | None = AGENT_SIM_SEED_OPT,
+    tls_cert: str | None = AGENT_SIM_TLS_CERT_OPT,
+    tls_key: str | None = AGENT_SIM_TLS_KEY_OPT,
+    tls_client_ca: str | None = AGENT_SIM_CLIENT_CA_OPT,
+) -> None:
+    unknown = sorted(set(capability or []) - set(list_modules()))
+    if unknown:
+        raise typer.BadParameter(f"Unknown module: {', '.join(unknown)}")
+    if bool(tls_cert) != bool(tls_key):
+        raise typer.BadParameter("--tls-cert and --tls-key must be provided together")
+    if tls_client_ca and not tls_cert:
+        raise typer.BadParameter("--tls-client-ca requires --tls-cert and --tls-key")
+    features = [
+        feature
+        for feature, disabled in ((BATCH_FEATURE, no_batch), (GZIP_FEATURE, no_gzip))
+        if not disabled
+    ]
+    try:
+        config = AgentSimConfig(
+            agent_id=agent_id,
+            capabilities=capability or None,
+            policy_hash=policy_hash,
+            features=features,
+            latency=parse_latency(latency),
+            error_rate=error_rate,
+            max_concurrency=max_concurrency,
+            seed=seed,
+        )
+        context = None
+        if tls_cert and tls_key:
+            context = server_ssl_context(tls_cert, tls_key, tls_client_ca)
+    except AgentSimError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+
+    server = AgentSimServer(config, (host, port), ssl_context=context)
+    typer.echo(f"Simulated agent listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    stats = server.stats
+    typer.echo(
+        f"requests={stats.requests} modules={stats.modules} injected_errors="
+        f"{stats.injected_errors} rejected={stats.rejected} peak_in_flight={stats.peak_in_flight}"
+    )
+
+
 @app.command()
 def modules() -> None:
     for name in list_modules():
@@ -185,34 +653,101 @@ def verify(
     evidence_path: Path = VERIFY_EVIDENCE_ARG,
     sign_key: str = VERIFY_KEY_OPT,
     json_output: bool = VERIFY_JSON_OPT,
+    proof: bool = VERIFY_PROOF_OPT,
+    blob_dir: Path | None = VERIFY_BLOB_DIR_OPT,
 ) -> None:
     if not evidence_path.exists():
         raise typer.BadParameter(f"Evidence file not found: {evidence_path}")
+    if proof:
+        _verify_proof(evidence_path, sign_key, json_output)
+        return
+    evidence, stream = _load_evidence(evidence_path, json_output)
+    if not evidence.signature or not evidence.signature_alg:
+        if json_output:
+            typer.echo(json.dumps({"ok": False, "reason": "missing_signature"}))
+        raise typer.Exit(code=1)
     try:
-        payload = json.loads(evidence_path.read_text())
-    except json.JSONDecodeError as exc:
+        if stream is not None:
+            ok = verify_evidence_stream(stream, sign_key)
+        else:
+            ok = verify_evidence(evidence, sign_key)
+    except EvidenceStreamError as exc:
         if json_output:
-            typer.echo(json.dumps({"ok": False, "reason": "invalid_json"}))
+            typer.echo(json.dumps({"ok": False, "reason": exc.reason}))
         raise typer.Exit(code=2) from exc
+    if not ok:
+        if json_output:
+            typer.echo(json.dumps({"ok": False, "reason": "invalid_signature"}))
+        raise typer.Exit(code=1)
+    if blob_dir is None:
+        if json_output:
+            typer.echo(json.dumps({"ok": True}))
+        else:
+            typer.echo("evidence signature ok")
+        return
+    # The signature covers each reference's digest, so matching blobs are authentic too.
     try:
-        evidence = EvidencePack.model_validate(payload)
-    except ValidationError as exc:
+        checked = BlobStore(blob_dir).check(
+            stream.iter_results() if stream is not None else evidence.results
+        )
+    except BlobStoreError as exc:
         if json_output:
-            typer.echo(json.dumps({"ok": False, "reason": "invalid_schema"}))
+            typer.echo(json.dumps({"ok": False, "reason": exc.reason}))
+        raise typer.Exit(code=1) from exc
+    if json_output:
+        typer.echo(json.dumps({"ok": True, "blobs": checked}))
+    else:
+        typer.echo(f"evidence signature ok ({checked} blobs checked)")
+
+
+def _verify_proof(path: Path, sign_key: str, json_output: bool) -> None:
+    try:
+        document = _read_json(path)
+    except (json.JSONDecodeError, EvidenceStreamError) as exc:
+        if json_output:
+            typer.echo(json.dumps({"ok": False, "reason": "invalid_json"}))
         raise typer.Exit(code=2) from exc
-    if not evidence.signature or not evidence.signature_alg:
+    try:
+        if not isinstance(document, dict) or document.get("record") != PROOF_RECORD:
+            raise MerkleProofError("invalid_proof", "Not a Merkle proof document")
+        ok = verify_proof(document, sign_key)
+    except MerkleProofError as exc:
         if json_output:
-            typer.echo(json.dumps({"ok": False, "reason": "missing_signature"}))
-        raise typer.Exit(code=1)
-    ok = verify_evidence(evidence, sign_key)
+            typer.echo(json.dumps({"ok": False, "reason": exc.reason}))
+        raise typer.Exit(code=2) from exc
     if not ok:
         if json_output:
             typer.echo(json.dumps({"ok": False, "reason": "invalid_signature"}))
         raise typer.Exit(code=1)
     if json_output:
-        typer.echo(json.dumps({"ok": True}))
+        typer.echo(json.dumps({"ok": True, "module_id": document["result"]["module_id"]}))
     else:
-        typer.echo("evidence signature ok")
+        typer.echo("result proof ok")
+
+
+@app.command()
+def prove(
+    evidence_path: Path = PROVE_EVIDENCE_ARG,
+    module_id: str = PROVE_MODULE_OPT,
+    out: Path | None = PROVE_OUT_OPT,
+) -> None:
+    if not evidence_path.exists():
+        raise typer.BadParameter(f"Evidence file not found: {evidence_path}")
+    evidence, stream = _load_evidence(evidence_path, json_output=False)
+    results = stream.iter_results() if stream is not None else evidence.results
+    try:
+        document = build_proof(
+            evidence, (result.model_dump(mode="json") for result in results), module_id
+        )
+    except (MerkleProofError, EvidenceStreamError) as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    text = json.dumps(document, indent=2, sort_keys=True)
+    if out is None:
+        typer.echo(text)
+        return
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(text)
+    typer.echo(f"Wrote proof for {module_id} to {out}")
 
 
 @app.command()
@@ -260,82 +795,53 @@ def report(
     evidence_path: Path = REPORT_EVIDENCE_ARG,
     json_output: bool = REPORT_JSON_OPT,
     exit_nonzero: bool = REPORT_EXIT_NONZERO_OPT,
+    module_id: str | None = REPORT_MODULE_OPT,
+    blob_dir: Path | None = REPORT_BLOB_DIR_OPT,
+    workers: int | None = REPORT_WORKERS_OPT,
+    regressions: int = REPORT_REGRESSIONS_OPT,
 ) -> None:
+    if is_aggregate_source(str(evidence_path)):
+        if module_id is not None:
+            raise typer.BadParameter("--module-id needs a single evidence file")
+        _report_aggregate(str(evidence_path), json_output, exit_nonzero, workers, regressions)
+        return
     if not evidence_path.exists():
         raise typer.BadParameter(f"Evidence file not found: {evidence_path}")
+    if module_id is not None:
+        evidence, stream = _load_evidence(evidence_path, json_output)
+        _report_result(evidence, stream, module_id, blob_dir, json_output)
+        return
+    header, results = _load_report_rows(evidence_path, json_output)
     try:
-        payload = json.loads(evidence_path.read_text())
-    except json.JSONDecodeError as exc:
-        if json_output:
-            typer.echo(json.dumps({"ok": False, "reason": "invalid_json"}))
-        raise typer.Exit(code=2) from exc
-
-    try:
-        evidence = EvidencePack.model_validate(payload)
-    except ValidationError as exc:
+        payload = _summary_payload(header, results)
+    except EvidenceStreamError as exc:
         if json_output:
-            typer.echo(json.dumps({"ok": False, "reason": "invalid_schema"}))
+            typer.echo(json.dumps({"ok": False, "reason": exc.reason}))
         raise typer.Exit(code=2) from exc
-
-    counts = {"total": 0, "passed": 0, "failed": 0, "errored": 0, "skipped": 0}
-    for result in evidence.results:
-        counts["total"] += 1
-        if result.status == "pass":
-            counts["passed"] += 1
-        elif result.status == "fail":
-            counts["failed"] += 1
-        elif result.status == "error":
-            counts["errored"] += 1
-        else:
-            counts["skipped"] += 1
-
-    ok = counts["failed"] == 0 and counts["errored"] == 0
+    counts = payload["summary"]
+    rows: list[dict[str, Any]] = payload["results"]
+    ok = bool(payload["ok"])
 
     if json_output:
-        typer.echo(
-            json.dumps(
-                {
-                    "ok": ok,
-                    "campaign_name": evidence.campaign_name,
-                    "run_id": evidence.run_id,
-                    "started_at": evidence.started_at.isoformat(),
-                    "finished_at": evidence.finished_at.isoformat(),
-                    "score": evidence.score,
-                    "summary": counts,
-                    "results": [
-                        {
-                            "module_id": result.module_id,
-                            "status": result.status,
-                            "notes": result.notes,
-                            "duration_ms": int(
-                                (result.finished_at - result.started_at).total_seconds() * 1000
-                            ),
-                            "evidence_ref": f"$.results[{index}].evidence",
-                        }
-                        for index, result in enumerate(evidence.results)
-                    ],
-                },
-                sort_keys=True,
-            )
-        )
+        typer.echo(json.dumps(payload, sort_keys=True))
         if exit_nonzero and not ok:
             raise typer.Exit(code=1)
         return
 
-    typer.echo(f"Campaign: {evidence.campaign_name}")
-    typer.echo(f"Run ID:   {evidence.run_id}")
-    typer.echo(f"Started:  {evidence.started_at.isoformat()}")
-    typer.echo(f"Finished: {evidence.finished_at.isoformat()}")
+    typer.echo(f"Campaign: {header.campaign_name}")
+    typer.echo(f"Run ID:   {header.run_id}")
+    typer.echo(f"Started:  {header.started_at.isoformat()}")
+    typer.echo(f"Finished: {header.finished_at.isoformat()}")
     typer.echo(
         "Score:    "
-        f"{evidence.score:.2f} (passed {counts['passed']}/{counts['total']}; "
+        f"{header.score:.2f} (passed {counts['passed']}/{counts['total']}; "
         f"failed {counts['failed']}; errored {counts['errored']}; skipped {counts['skipped']})"
     )
     typer.echo("")
     typer.echo("Modules")
 
-    module_col = max(len("module_id"), max((len(r.module_id) for r in evidence.results), default=0))
-    status_col = max(len("status"), max((len(r.status) for r in evidence.results), default=0))
+    module_col = max(len("module_id"), max((len(r["module_id"]) for r in rows), default=0))
+    status_col = max(len("status"), max((len(r["status"]) for r in rows), default=0))
     duration_col = len("duration_ms")
 
     typer.echo(
@@ -345,13 +851,12 @@ def report(
         "notes"
     )
     typer.echo(f"{'-' * module_col}  {'-' * status_col}  {'-' * duration_col}  -----")
-    for result in evidence.results:
-        notes = result.notes or ""
-        duration_ms = int((result.finished_at - result.started_at).total_seconds() * 1000)
+    for row in rows:
+        notes = row["notes"] or ""
         typer.echo(
-            f"{result.module_id.ljust(module_col)}  "
-            f"{result.status.ljust(status_col)}  "
-            f"{str(duration_ms).ljust(duration_col)}  "
+            f"{row['module_id'].ljust(module_col)}  "
+            f"{row['status'].ljust(status_col)}  "
+            f"{str(row['duration_ms']).ljust(duration_col)}  "
             f"{notes}"
         )
 
@@ -359,6 +864,168 @@ def report(
         raise typer.Exit(code=1)
 
 
+def _report_aggregate(
+    spec: str, json_output: bool, exit_nonzero: bool, workers: int | None, regressions: int
+) -> None:
+    paths = aggregate_paths(spec)
+    if not paths:
+        raise typer.BadParameter(f"No evidence files match: {spec}")
+    payload = aggregate_runs(digest_runs(paths, workers=workers), regression_limit=regressions)
+    if payload["runs"] == 0:
+        if json_output:
+            typer.echo(json.dumps({"ok": False, "reason": "no_readable_evidence"}))
+        raise typer.Exit(code=2)
+    ok = bool(payload["ok"])
+    if json_output:
+        typer.echo(json.dumps(payload, sort_keys=True))
+        if exit_nonzero and not ok:
+            raise typer.Exit(code=1)
+        return
+
+    typer.echo(f"Runs:     {payload['runs']}")
+    typer.echo(f"First:    {payload['first_started_at']}")
+    typer.echo(f"Last:     {payload['last_started_at']}")
+    typer.echo("")
+    typer.echo("Modules")
+    _echo_table(
+        payload["modules"],
+        ["module_id", "runs", "pass_rate", "flakiness", "p50_ms", "p95_ms", "last_status"],
+    )
+    if payload["regressions"]:
+        typer.echo("")
+        typer.echo("Regressions")
+        _echo_table(
+            payload["regressions"],
+            ["module_id", "run_id", "status", "prior_pass_rate", "passing_streak"],
+        )
+    for error in payload["errors"]:
+        typer.echo(f"- unreadable {error['path']}: {error['reason']}")
+    if exit_nonzero and not ok:
+        raise typer.Exit(code=1)
+
+
+def _echo_table(rows: list[dict[str, Any]], columns: list[str]) -> None:
+    cells = [
+        ["" if row[column] is None else str(row[column]) for column in columns] for row in rows
+    ]
+    widths = [
+        max(len(column), *(len(line[position]) for line in cells))
+        for position, column in enumerate(columns)
+    ]
+    typer.echo(
+        "  ".join(column.ljust(width) for column, width in zip(columns, widths, strict=True))
+    )
+    typer.echo("  ".join("-" * width for width in widths))
+    for line in cells:
+        typer.echo("  ".join(cell.ljust(width) for cell, width in zip(line, widths, strict=True)))
+
+
+def _report_result(
+    evidence: EvidencePack,
+    stream: EvidenceStream | None,
+    module_id: str,
+    blob_dir: Path | None,
+    json_output: bool,
+) -> None:
+    # Only the selected result's blobs are read; the summary report never touches blobs.
+    try:
+        results = stream.iter_results() if stream is not None else evidence.results
+        result = next((item for item in results if item.module_id == module_id), None)
+        if result is None:
+            raise typer.BadParameter(f"No result for module: {module_id}")
+        if blob_dir is not None:
+            result = BlobStore(blob_dir).resolve(result)
+    except (EvidenceStreamError, BlobStoreError) as exc:
+        if json_output:
+            typer.echo(json.dumps({"ok": False, "reason": exc.reason}))
+        raise typer.Exit(code=2) from exc
+    payload = result.model_dump(mode="json")
+    if json_output:
+        typer.echo(json.dumps(payload, sort_keys=True))
+    else:
+        typer.echo(json.dumps(payload, indent=2, sort_keys=True))
+
+
+def _load_evidence(path: Path, json_output: bool) -> tuple[EvidencePack, EvidenceStream | None]:
+    # NDJSON streams are opened lazily: the returned pack holds metadata only and results
+    # are read from the stream on demand.
+    if is_evidence_stream(path):
+        try:
+            stream = open_evidence_stream(path)
+        except EvidenceStreamError as exc:
+            if json_output:
+                typer.echo(json.dumps({"ok": False, "reason": exc.reason}))
+            raise typer.Exit(code=2) from exc
+        return stream.evidence, stream
+
+    try:
+        payload = _read_json(path)
+    except (json.JSONDecodeError, EvidenceStreamError) as exc:
+        if json_output:
+            typer.echo(json.dumps({"ok": False, "reason": "invalid_json"}))
+        raise typer.Exit(code=2) from exc
+    try:
+        evidence = EvidencePack.model_validate(payload)
+    except ValidationError as exc:
+        if json_output:
+            typer.echo(json.dumps({"ok": False, "reason": "invalid_schema"}))
+        raise typer.Exit(code=2) from exc
+    return evidence, None
+
+
+def _load_report_rows(
+    path: Path, json_output: bool
+) -> tuple[EvidenceHeader | EvidencePack, Iterable[ResultRow]]:
+    try:
+        return load_report_rows(path)
+    except EvidenceStreamError as exc:
+        if json_output:
+            typer.echo(json.dumps({"ok": False, "reason": exc.reason}))
+        raise typer.Exit(code=2) from exc
+
+
+def _read_json(path: Path) -> object:
+    # Plain or gzip-compressed JSON; the container is detected from the file's magic bytes.
+    return json.loads(read_evidence_bytes(path))
+
+
+def _summary_payload(
+    evidence: EvidenceHeader | EvidencePack, results: Iterable[ModuleResult | ResultRow]
+) -> dict[str, Any]:
+    counts = {"total": 0, "passed": 0, "failed": 0, "errored": 0, "skipped": 0}
+    rows: list[dict[str, Any]] = []
+    for index, result in enumerate(results):
+        counts["total"] += 1
+        if result.status == "pass":
+            counts["passed"] += 1
+        elif result.status == "fail":
+            counts["failed"] += 1
+        elif result.status == "error":
+            counts["errored"] += 1
+        else:
+            counts["skipped"] += 1
+        rows.append(
+            {
+                "module_id": result.module_id,
+                "status": result.status,
+                "notes": result.notes,
+                "duration_ms": int((result.finished_at - result.started_at).total_seconds() * 1000),
+                "evidence_ref": f"$.results[{index}].evidence",
+            }
+        )
+
+    return {
+        "ok": counts["failed"] == 0 and counts["errored"] == 0,
+        "campaign_name": evidence.campaign_name,
+        "run_id": evidence.run_id,
+        "started_at": evidence.started_at.isoformat(),
+        "finished_at": evidence.finished_at.isoformat(),
+        "score": evidence.score,
+        "summary": counts,
+        "results": rows,
+    }
+
+
 @app.command()
 def validate_summary(
     summary_path: Path = VALIDATE_SUMMARY_ARG,
@@ -366,12 +1033,23 @@ def validate_summary(
 ) -> None:
     if not summary_path.exists():
         raise typer.BadParameter(f"Summary file not found: {summary_path}")
-    try:
-        payload = json.loads(summary_path.read_text())
-    except json.JSONDecodeError as exc:
-        if json_output:
-            typer.echo(json.dumps({"ok": False, "reason": "invalid_json"}))
-        raise typer.Exit(code=2) from exc
+    payload: object
+    if is_evidence_stream(summary_path):
+        # Evidence streams are summarized on the fly, exactly as `bas report --json` would.
+        header, rows = _load_report_rows(summary_path, json_output)
+        try:
+            payload = _summary_payload(header, rows)
+        except EvidenceStreamError as exc:
+            if json_output:
+                typer.echo(json.dumps({"ok": False, "reason": exc.reason}))
+            raise typer.Exit(code=2) from exc
+    else:
+        try:
+            payload = _read_json(summary_path)
+        except (json.JSONDecodeError, EvidenceStreamError) as exc:
+            if json_output:
+                typer.echo(json.dumps({"ok": False, "reason": "invalid_json"}))
+            raise typer.Exit(code=2) from exc
 
     errors = validate_summary_payload(payload)
     ok = not errors
@@ -404,9 +1082,9 @@ def diff_summary(
         raise typer.BadParameter(f"Candidate summary not found: {candidate_path}")
 
     try:
-        golden_payload = json.loads(golden_path.read_text())
-        candidate_payload = json.loads(candidate_path.read_text())
-    except json.JSONDecodeError as exc:
+        golden_payload = _read_json(golden_path)
+        candidate_payload = _read_json(candidate_path)
+    except (json.JSONDecodeError, EvidenceStreamError) as exc:
         if json_output:
             typer.echo(json.dumps({"ok": False, "reason": "invalid_json"}))
         raise typer.Exit(code=2) from exc
@@ -468,7 +1146,7 @@ def validate_campaign(
             raise typer.Exit(code=2) from exc
 
     try:
-        spec = load_campaign(campaign)
+        spec = load_campaign(campaign, validate_dependencies=False)
     except CampaignLoadError as exc:
         if json_output:
             typer.echo(json.dumps({"ok": False, "reason": "invalid_campaign"}))
@@ -512,6 +1190,7 @@ def validate_campaign(
                 }
             )
 
+    errors.extend(dependency_errors(spec))
     ok = not errors
 
     if json_output:
@@ -529,3 +1208,84 @@ def validate_campaign(
         module_id = error.get("module_id", "?")
         typer.echo(f"- [{error['code']}] {module_id}: {error['message']}")
     raise typer.Exit(code=1)
+
+
+@app.command("index")
+def index_history(
+    paths: list[Path] = INDEX_PATHS_ARG,
+    db: Path = HISTORY_DB_OPT,
+    sign_key: str | None = INDEX_KEY_OPT,
+    json_output: bool = INDEX_JSON_OPT,
+) -> None:
+    missing = [path for path in paths if not path.exists()]
+    if missing:
+        raise typer.BadParameter(f"Evidence path not found: {missing[0]}")
+    try:
+        history = HistoryIndex(db)
+    except (HistoryError, sqlite3.Error) as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    with history:
+        outcomes = [history.index(path, sign_key=sign_key) for path in evidence_files(paths)]
+    counts = {"indexed": 0, "unchanged": 0, "error": 0}
+    for outcome in outcomes:
+        counts[outcome.action] += 1
+    ok = counts["error"] == 0
+    if json_output:
+        files = [
+            {
+                "path": str(outcome.path),
+                "action": outcome.action,
+                "run_id": outcome.run_id,
+                "verified": outcome.verified,
+                "reason": outcome.reason,
+            }
+            for outcome in outcomes
+        ]
+        typer.echo(json.dumps({"ok": ok, **counts, "files": files}, sort_keys=True))
+    else:
+        for outcome in outcomes:
+            if outcome.action == "error":
+                typer.echo(f"- {outcome.path}: {outcome.reason}")
+        typer.echo(
+            f"indexed {counts['indexed']}, unchanged {counts['unchanged']}, "
+            f"errors {counts['error']} ({db})"
+        )
+    if not ok:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def history(
+    db: Path = HISTORY_DB_OPT,
+    view: str = HISTORY_VIEW_OPT,
+    module_id: str | None = HISTORY_MODULE_OPT,
+    campaign: str | None = HISTORY_CAMPAIGN_OPT,
+    status: str | None = HISTORY_STATUS_OPT,
+    since: str | None = HISTORY_SINCE_OPT,
+    until: str | None = HISTORY_UNTIL_OPT,
+    json_output: bool = HISTORY_JSON_OPT,
+) -> None:
+    if view not in HISTORY_VIEWS:
+        raise typer.BadParameter(f"Unsupported history view: {view}")
+    if not db.exists():
+        raise typer.BadParameter(f"History index not found: {db}")
+    try:
+        filters = HistoryFilter(
+            module_id=module_id,
+            campaign_name=campaign,
+            status=status,
+            since=parse_time(since) if since is not None else None,
+            until=parse_time(until) if until is not None else None,
+        )
+        with HistoryIndex(db) as index:
+            rows = index.query(view, filters)
+    except (HistoryError, sqlite3.Error) as exc:
+        raise typer.BadParameter(str(exc)) from exc
+
+    if json_output:
+        typer.echo(json.dumps({"view": view, "rows": rows}, sort_keys=True))
+        return
+    if not rows:
+        typer.echo("no matching history")
+        return
+    _echo_table(rows, list(rows[0]))
@@ -1,19 +1,50 @@
 from __future__ import annotations
 
-import hashlib
-import hmac
-import json
+import queue
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Protocol, TypeVar
 from uuid import uuid4
 
 import yaml
 
-from bas_orchestrator.agent_client import AgentClient, AgentClientConfig, AgentClientError
-from bas_orchestrator.models import CampaignSpec, EvidencePack, ModuleResult, ModuleSpec, PolicySpec
-from bas_orchestrator.modules.base import ModuleContext
+from bas_orchestrator.agent_client import AgentClientConfig, AgentClientError
+from bas_orchestrator.agent_pool import AgentPool
+from bas_orchestrator.cache import ResultCache, cache_key
+from bas_orchestrator.canonical import CanonicalEvidence, model_digest
+from bas_orchestrator.handshake_cache import HandshakeCache
+from bas_orchestrator.isolation import (
+    ModuleWorkerTimeout,
+    ProcessIsolationConfig,
+    ProcessModuleRunner,
+)
+from bas_orchestrator.journal import JournalError, JournalState, RunJournal
+from bas_orchestrator.merkle import MERKLE_ALG, sign_merkle, verify_merkle
+from bas_orchestrator.models import (
+    CampaignSpec,
+    EvidencePack,
+    ExecutionLimits,
+    ModuleResult,
+    ModuleSpec,
+    PolicySpec,
+    Target,
+)
+from bas_orchestrator.modules.base import Module, ModuleContext
 from bas_orchestrator.modules.registry import get_module
+from bas_orchestrator.scheduler import (
+    CircuitBreakerPolicy,
+    ConcurrencyLimiter,
+    HedgePolicy,
+    RetryPolicy,
+    TokenBucket,
+)
 from bas_orchestrator.summary_validate import validate_summary_counts
 
 
@@ -24,8 +55,15 @@ class CampaignLoadError(Exception):
 SUPPORTED_CAMPAIGN_VERSIONS = {"v1"}
 SUPPORTED_POLICY_VERSIONS = {"v1"}
 
+DEFAULT_AGENT_BATCH_SIZE = 16
 
-def load_campaign(path: Path) -> CampaignSpec:
+_LimitT = TypeVar("_LimitT", int, float)
+_T = TypeVar("_T")
+
+_STATUS_COUNTERS = {"pass": "passed", "fail": "failed", "error": "errored", "skipped": "skipped"}
+
+
+def load_campaign(path: Path, *, validate_dependencies: bool = True) -> CampaignSpec:
     try:
         raw = yaml.safe_load(path.read_text())
     except FileNotFoundError as exc:
@@ -39,9 +77,87 @@ def load_campaign(path: Path) -> CampaignSpec:
     spec = CampaignSpec.model_validate(raw)
     if spec.version not in SUPPORTED_CAMPAIGN_VERSIONS:
         raise CampaignLoadError(f"Unsupported campaign version: {spec.version}")
+    if validate_dependencies:
+        errors = dependency_errors(spec)
+        if errors:
+            raise CampaignLoadError(errors[0]["message"])
     return spec
 
 
+def dependency_errors(spec: CampaignSpec) -> list[dict[str, str]]:
+    known = {module_spec.id for module_spec in spec.modules}
+    errors: list[dict[str, str]] = []
+    for module_spec in spec.modules:
+        for dependency in module_spec.depends_on or []:
+            if dependency == module_spec.id:
+                errors.append(
+                    {
+                        "code": "dependency_cycle",
+                        "module_id": module_spec.id,
+                        "message": f"Module {module_spec.id} depends on itself",
+                    }
+                )
+            elif dependency not in known:
+                errors.append(
+                    {
+                        "code": "unknown_dependency",
+                        "module_id": module_spec.id,
+                        "message": f"Unknown dependency: {dependency}",
+                    }
+                )
+    if errors:
+        return errors
+
+    _, blocked = _dependency_waves(spec)
+    if blocked:
+        cycle = ", ".join(spec.modules[index].id for index in blocked)
+        errors.append(
+            {
+                "code": "dependency_cycle",
+                "module_id": spec.modules[blocked[0]].id,
+                "message": f"Dependency cycle between modules: {cycle}",
+            }
+        )
+    return errors
+
+
+def dependency_waves(spec: CampaignSpec) -> list[list[int]]:
+    errors = dependency_errors(spec)
+    if errors:
+        raise CampaignLoadError(errors[0]["message"])
+    waves, _ = _dependency_waves(spec)
+    return waves
+
+
+def _dependency_waves(spec: CampaignSpec) -> tuple[list[list[int]], list[int]]:
+    # Kahn's algorithm, grouped into frontiers; indices left over sit on (or behind) a cycle.
+    indices_by_id: dict[str, list[int]] = {}
+    for index, module_spec in enumerate(spec.modules):
+        indices_by_id.setdefault(module_spec.id, []).append(index)
+
+    pending = [0] * len(spec.modules)
+    dependents: list[list[int]] = [[] for _ in spec.modules]
+    for index, module_spec in enumerate(spec.modules):
+        for dependency in set(module_spec.depends_on or []):
+            for prerequisite in indices_by_id.get(dependency, []):
+                pending[index] += 1
+                dependents[prerequisite].append(index)
+
+    waves: list[list[int]] = []
+    frontier = [index for index, count in enumerate(pending) if count == 0]
+    while frontier:
+        waves.append(frontier)
+        ready: list[int] = []
+        for index in frontier:
+            for dependent in dependents[index]:
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    ready.append(dependent)
+        frontier = sorted(ready)
+    blocked = [index for index, count in enumerate(pending) if count > 0]
+    return waves, blocked
+
+
 def load_policy(path: Path) -> PolicySpec:
     try:
         raw = yaml.safe_load(path.read_text())
@@ -59,10 +175,12 @@ def load_policy(path: Path) -> PolicySpec:
     return policy
 
 
+def _campaign_digest(spec: CampaignSpec) -> str:
+    return model_digest(spec)
+
+
 def _deterministic_run_id(spec: CampaignSpec) -> str:
-    payload = json.dumps(spec.model_dump(mode="json"), sort_keys=True, separators=(",", ":"))
-    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
-    return f"det-{digest[:16]}"
+    return f"det-{_campaign_digest(spec)[:16]}"
 
 
 def _normalized_result(result: ModuleResult, *, fixed_time: datetime | None) -> ModuleResult:
@@ -76,181 +194,880 @@ def _normalized_result(result: ModuleResult, *, fixed_time: datetime | None) ->
     )
 
 
+@dataclass(frozen=True)
+class _CampaignRun:
+    run_id: str
+    fixed_time: datetime | None
+    target_lookup: dict[str, Target]
+    policy: PolicySpec | None
+    agents: AgentPool | None
+    retry_policy: RetryPolicy
+    hedge_policy: HedgePolicy | None
+    limits: ExecutionLimits
+    limiter: ConcurrencyLimiter | None
+    rate_limiter: TokenBucket | None
+    cache: ResultCache | None
+    policy_hash: str | None
+    deadline: float | None
+    process_runner: ProcessModuleRunner | None
+
+
+class EvidenceSink(Protocol):
+    def start(self, *, campaign_name: str, run_id: str, started_at: datetime) -> None: ...
+
+    def write(self, result: ModuleResult) -> None: ...
+
+
+class _ListSink:
+    def __init__(self) -> None:
+        self.results: list[ModuleResult] = []
+
+    def start(self, *, campaign_name: str, run_id: str, started_at: datetime) -> None:
+        return None
+
+    def write(self, result: ModuleResult) -> None:
+        self.results.append(result)
+
+
+class _ResultTally:
+    def __init__(self) -> None:
+        self.counts = {"total": 0, "passed": 0, "failed": 0, "errored": 0, "skipped": 0}
+
+    def add(self, result: ModuleResult) -> None:
+        self.counts["total"] += 1
+        self.counts[_STATUS_COUNTERS[result.status]] += 1
+
+    def score(self) -> tuple[float, dict[str, Any]]:
+        total = self.counts["total"]
+        score = 0.0 if total == 0 else self.counts["passed"] / total
+        summary = dict(self.counts)
+        errors = validate_summary_counts(summary)
+        if errors:
+            raise ValueError(f"Invalid summary counts: {errors}")
+        return score, summary
+
+
+class _OrderedEmitter:
+    # Buffers out-of-order completions so the sink always sees campaign order.
+    def __init__(self, sink: EvidenceSink) -> None:
+        self._sink = sink
+        self._pending: dict[int, ModuleResult] = {}
+        self._next = 0
+        self.tally = _ResultTally()
+
+    def settle(self, index: int, result: ModuleResult) -> None:
+        self._pending[index] = result
+        while self._next in self._pending:
+            ready = self._pending.pop(self._next)
+            self.tally.add(ready)
+            self._sink.write(ready)
+            self._next += 1
+
+
 def run_campaign(
     spec: CampaignSpec,
     *,
     deterministic: bool = False,
     agent_config: AgentClientConfig | None = None,
+    agent_configs: Sequence[AgentClientConfig] | None = None,
+    policy: PolicySpec | None = None,
+    max_workers: int = 1,
+    journal: RunJournal | None = None,
+    cache: ResultCache | None = None,
+    deadline_seconds: float | None = None,
+    process_isolation: ProcessIsolationConfig | None = None,
+    agent_batch_size: int = DEFAULT_AGENT_BATCH_SIZE,
+    agent_retry: RetryPolicy | None = None,
+    agent_breaker: CircuitBreakerPolicy | None = None,
+    agent_hedge: HedgePolicy | None = None,
+    agent_handshake_cache: HandshakeCache | None = None,
+) -> EvidencePack:
+    sink = _ListSink()
+    evidence = stream_campaign(
+        spec,
+        sink,
+        deterministic=deterministic,
+        agent_config=agent_config,
+        agent_configs=agent_configs,
+        policy=policy,
+        max_workers=max_workers,
+        journal=journal,
+        cache=cache,
+        deadline_seconds=deadline_seconds,
+        process_isolation=process_isolation,
+        agent_batch_size=agent_batch_size,
+        agent_retry=agent_retry,
+        agent_breaker=agent_breaker,
+        agent_hedge=agent_hedge,
+        agent_handshake_cache=agent_handshake_cache,
+    )
+    return evidence.model_copy(update={"results": sink.results})
+
+
+def stream_campaign(
+    spec: CampaignSpec,
+    sink: EvidenceSink,
+    *,
+    deterministic: bool = False,
+    agent_config: AgentClientConfig | None = None,
+    agent_configs: Sequence[AgentClientConfig] | None = None,
     policy: PolicySpec | None = None,
+    max_workers: int = 1,
+    journal: RunJournal | None = None,
+    cache: ResultCache | None = None,
+    deadline_seconds: float | None = None,
+    process_isolation: ProcessIsolationConfig | None = None,
+    agent_batch_size: int = DEFAULT_AGENT_BATCH_SIZE,
+    agent_retry: RetryPolicy | None = None,
+    agent_breaker: CircuitBreakerPolicy | None = None,
+    agent_hedge: HedgePolicy | None = None,
+    agent_handshake_cache: HandshakeCache | None = None,
 ) -> EvidencePack:
+    # Results are handed to the sink as soon as campaign order allows; the returned pack
+    # carries the run metadata, score and summary but no results.
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    if agent_batch_size < 1:
+        raise ValueError("agent_batch_size must be at least 1")
+    configs = [*(agent_configs or []), *([agent_config] if agent_config else [])]
+    if deadline_seconds is not None and deadline_seconds <= 0:
+        raise ValueError("deadline_seconds must be positive")
+    deadline = time.monotonic() + deadline_seconds if deadline_seconds is not None else None
+
     fixed_time = datetime(1970, 1, 1, tzinfo=UTC) if deterministic else None
-    run_id = _deterministic_run_id(spec) if deterministic else str(uuid4())
-    started_at = fixed_time or datetime.now(UTC)
-    results: list[ModuleResult] = []
+    completed: dict[int, ModuleResult] = {}
+    resumed = journal.state if journal is not None else None
+    if resumed is not None:
+        _check_resumable(spec, resumed, deterministic=deterministic)
+        run_id = resumed.run_id
+        started_at = resumed.started_at
+        completed = resumed.completed
+    else:
+        run_id = _deterministic_run_id(spec) if deterministic else str(uuid4())
+        started_at = fixed_time or datetime.now(UTC)
+        if journal is not None:
+            journal.begin(
+                run_id=run_id,
+                started_at=started_at,
+                campaign_digest=_campaign_digest(spec),
+                deterministic=deterministic,
+            )
+    sink.start(campaign_name=spec.name, run_id=run_id, started_at=started_at)
+    emitter = _OrderedEmitter(sink)
 
     target_lookup = {target.id: target for target in spec.targets}
-    agent = AgentClient(agent_config) if agent_config else None
-    agent_caps = None
-    if agent is not None:
+    agents = None
+    if configs:
         try:
-            agent_caps = agent.handshake(
-                agent_id=agent_config.agent_id if agent_config else None,
+            agents = AgentPool.connect(
+                configs,
                 capabilities=sorted({module.module for module in spec.modules}),
                 version=spec.version,
-                expected_policy_hash=agent_config.expected_policy_hash if agent_config else None,
+                breaker=agent_breaker,
+                latency_window=agent_hedge.window if agent_hedge is not None else 256,
+                handshake_cache=agent_handshake_cache,
             )
         except AgentClientError as exc:
-            for module_spec in spec.modules:
-                results.append(
-                    ModuleResult(
+            for index, module_spec in enumerate(spec.modules):
+                emitter.settle(
+                    index,
+                    completed.get(index)
+                    or ModuleResult(
                         module_id=module_spec.id,
                         status="error",
                         started_at=fixed_time or datetime.now(UTC),
                         finished_at=fixed_time or datetime.now(UTC),
                         evidence={"error": "agent handshake failed", "message": str(exc)},
-                    )
+                    ),
                 )
-            finished_at = fixed_time or datetime.now(UTC)
-            score, summary = score_results(results)
-            return EvidencePack(
-                campaign_name=spec.name,
-                run_id=run_id,
-                started_at=started_at,
-                finished_at=finished_at,
-                results=results,
-                score=score,
-                summary=summary,
-            )
+            return _finished_pack(spec, run_id, started_at, fixed_time, emitter.tally)
 
-    for module_spec in spec.modules:
-        if module_spec.target_id not in target_lookup:
-            results.append(
-                ModuleResult(
-                    module_id=module_spec.id,
-                    status="error",
-                    started_at=fixed_time or datetime.now(UTC),
-                    finished_at=fixed_time or datetime.now(UTC),
-                    evidence={"error": "unknown target"},
-                    notes=f"Unknown target: {module_spec.target_id}",
-                )
-            )
-            continue
+    limits = effective_limits(spec, policy)
+    process_runner = (
+        ProcessModuleRunner(process_isolation, default_workers=max_workers)
+        if process_isolation is not None and agents is None
+        else None
+    )
+    run = _CampaignRun(
+        run_id=run_id,
+        fixed_time=fixed_time,
+        target_lookup=target_lookup,
+        policy=policy,
+        agents=agents,
+        retry_policy=agent_retry or RetryPolicy(),
+        hedge_policy=agent_hedge,
+        limits=limits,
+        limiter=_build_limiter(spec, limits, agents),
+        rate_limiter=(
+            TokenBucket(limits.requests_per_second, limits.burst or 1)
+            if limits.requests_per_second
+            else None
+        ),
+        cache=cache,
+        policy_hash=compute_policy_hash(policy) if policy is not None else None,
+        deadline=deadline,
+        process_runner=process_runner,
+    )
+    not_passed: set[str] = set()
 
-        try:
-            module = get_module(module_spec.module)
-        except KeyError as exc:
-            results.append(
-                ModuleResult(
-                    module_id=module_spec.id,
-                    status="error",
-                    started_at=fixed_time or datetime.now(UTC),
-                    finished_at=fixed_time or datetime.now(UTC),
-                    evidence={"error": "unknown module"},
-                    notes=str(exc),
-                )
-            )
-            continue
+    def settle(index: int, result: ModuleResult, *, durable: bool = False) -> None:
+        # Journal first so a crash after this point never loses the result.
+        if journal is not None and not durable:
+            journal.record(index, result)
+        if result.status != "pass":
+            not_passed.add(spec.modules[index].id)
+        emitter.settle(index, result)
 
-        allowlist = effective_allowlist(module_spec, policy)
-        context = ModuleContext(
-            module_id=module_spec.id,
-            target_id=module_spec.target_id,
-            params=module_spec.params,
-            expectations=module_spec.expectations,
-            scope_allowlist=allowlist,
+    with ExitStack() as stack:
+        if agents is not None:
+            stack.callback(agents.close)
+        if process_runner is not None:
+            stack.callback(process_runner.shutdown)
+        pool = (
+            stack.enter_context(
+                ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bas-module")
+            )
+            if max_workers > 1
+            else None
         )
-
-        if agent is not None:
-            if agent_caps is not None and module_spec.module not in agent_caps.capabilities:
-                results.append(
-                    ModuleResult(
-                        module_id=module_spec.id,
-                        status="error",
-                        started_at=fixed_time or datetime.now(UTC),
-                        finished_at=fixed_time or datetime.now(UTC),
-                        evidence={"error": "module not supported by agent"},
-                        notes=f"missing capability: {module_spec.module}",
-                    )
-                )
-                continue
-            payload = {
-                "run_id": run_id,
-                "module_id": module_spec.id,
-                "module": module_spec.module,
-                "target_id": module_spec.target_id,
-                "params": module_spec.params,
-                "expectations": module_spec.expectations,
-                "scope": {
-                    "allowlist": allowlist,
-                    "expires_at": (fixed_time or datetime.now(UTC)).isoformat(),
-                },
-            }
-            try:
-                result = agent.execute_module(payload)
-            except AgentClientError as exc:
-                results.append(
-                    ModuleResult(
-                        module_id=module_spec.id,
-                        status="error",
-                        started_at=fixed_time or datetime.now(UTC),
-                        finished_at=fixed_time or datetime.now(UTC),
-                        evidence={"error": "agent failure", "message": str(exc)},
-                    )
-                )
-                continue
-        else:
-            try:
-                result = module.run(context)
-            except Exception as exc:  # pragma: no cover - defensive
-                results.append(
-                    ModuleResult(
-                        module_id=module_spec.id,
-                        status="error",
-                        started_at=fixed_time or datetime.now(UTC),
-                        finished_at=fixed_time or datetime.now(UTC),
-                        evidence={"error": "module exception", "message": str(exc)},
-                    )
-                )
+        for wave in dependency_waves(spec):
+            runnable: list[int] = []
+            for index in wave:
+                if index in completed:
+                    settle(index, completed[index], durable=True)
+                    continue
+                depends_on = spec.modules[index].depends_on or []
+                unmet = [dependency for dependency in depends_on if dependency in not_passed]
+                if unmet:
+                    settle(index, _skipped_for_dependencies(spec.modules[index], unmet, fixed_time))
+                else:
+                    runnable.append(index)
+            tasks = _wave_tasks(run, spec, runnable, agent_batch_size, max_workers)
+            if pool is None:
+                for task in tasks:
+                    for index, result in zip(task, _execute_task(run, spec, task), strict=True):
+                        settle(index, result)
                 continue
+            futures = {pool.submit(_execute_task, run, spec, task): task for task in tasks}
+            for future in as_completed(futures):
+                task = futures.pop(future)
+                for index, result in zip(task, future.result(), strict=True):
+                    settle(index, result)
 
-        results.append(_normalized_result(result, fixed_time=fixed_time))
+    if cache is not None:
+        cache.prune()
+    return _finished_pack(spec, run_id, started_at, fixed_time, emitter.tally)
+
+
+def _wave_tasks(
+    run: _CampaignRun, spec: CampaignSpec, runnable: list[int], batch_size: int, max_workers: int
+) -> list[list[int]]:
+    # Each task is a list of campaign indices executed together. Modules for an agent that
+    # advertises batching are grouped, split so every worker still gets a share of the wave;
+    # modules with their own timeout_seconds are always sent on their own.
+    if run.agents is None or batch_size == 1 or not run.agents.supports_batch:
+        return [[index] for index in runnable]
+    batchable = [index for index in runnable if spec.modules[index].timeout_seconds is None]
+    tasks = [[index] for index in runnable if spec.modules[index].timeout_seconds is not None]
+    size = min(batch_size, max(1, -(-len(batchable) // max_workers)))
+    if run.limits.max_per_agent is not None:
+        size = min(size, run.limits.max_per_agent)
+    groups = _agent_batches(run, [spec.modules[index] for index in batchable], size)
+    tasks.extend([batchable[position] for position in group] for group in groups)
+    return tasks
+
+
+def _execute_task(run: _CampaignRun, spec: CampaignSpec, task: list[int]) -> list[ModuleResult]:
+    module_specs = [spec.modules[index] for index in task]
+    batchable = (
+        len(task) > 1
+        and run.agents is not None
+        and run.agents.can_run({module_spec.module for module_spec in module_specs}, batch=True)
+    )
+    if not batchable:
+        # No single batch-capable agent covers the group; route its modules one by one.
+        return [_execute_module(run, module_spec) for module_spec in module_specs]
+    return _execute_agent_batch(run, module_specs)
 
-    finished_at = fixed_time or datetime.now(UTC)
-    score, summary = score_results(results)
 
+def _check_resumable(spec: CampaignSpec, state: JournalState, *, deterministic: bool) -> None:
+    if state.campaign_digest != _campaign_digest(spec):
+        raise JournalError("Journal was recorded for a different campaign")
+    if state.deterministic != deterministic:
+        raise JournalError("Journal deterministic mode does not match this run")
+    for index, result in state.completed.items():
+        if index >= len(spec.modules) or spec.modules[index].id != result.module_id:
+            raise JournalError(f"Journal result {result.module_id} does not match the campaign")
+
+
+def _finished_pack(
+    spec: CampaignSpec,
+    run_id: str,
+    started_at: datetime,
+    fixed_time: datetime | None,
+    tally: _ResultTally,
+) -> EvidencePack:
+    finished_at = fixed_time or datetime.now(UTC)
+    score, summary = tally.score()
     return EvidencePack(
         campaign_name=spec.name,
         run_id=run_id,
         started_at=started_at,
         finished_at=finished_at,
-        results=results,
+        results=[],
         score=score,
         summary=summary,
     )
 
 
-def sign_evidence(evidence: EvidencePack, key: str) -> EvidencePack:
-    digest = _sign_payload(evidence, key)
-    return evidence.model_copy(update={"signature_alg": "hmac-sha256", "signature": digest})
+@dataclass(frozen=True)
+class _PreparedModule:
+    spec: ModuleSpec
+    module: Module
+    allowlist: list[str]
+    context: ModuleContext
+    timeout: float | None
+    timeout_reason: str
 
 
-def verify_evidence(evidence: EvidencePack, key: str) -> bool:
-    if evidence.signature_alg != "hmac-sha256" or not evidence.signature:
-        return False
-    digest = _sign_payload(evidence, key)
-    return hmac.compare_digest(digest, evidence.signature)
+def _prepare_module(run: _CampaignRun, module_spec: ModuleSpec) -> ModuleResult | _PreparedModule:
+    # Checks shared by every execution path; returns the final result when the module
+    # cannot be dispatched at all.
+    fixed_time = run.fixed_time
+    if module_spec.target_id not in run.target_lookup:
+        return ModuleResult(
+            module_id=module_spec.id,
+            status="error",
+            started_at=fixed_time or datetime.now(UTC),
+            finished_at=fixed_time or datetime.now(UTC),
+            evidence={"error": "unknown target"},
+            notes=f"Unknown target: {module_spec.target_id}",
+        )
+
+    try:
+        module = get_module(module_spec.module)
+    except KeyError as exc:
+        return ModuleResult(
+            module_id=module_spec.id,
+            status="error",
+            started_at=fixed_time or datetime.now(UTC),
+            finished_at=fixed_time or datetime.now(UTC),
+            evidence={"error": "unknown module"},
+            notes=str(exc),
+        )
+
+    timeout, timeout_reason = _module_timeout(run, module_spec)
+    if timeout is not None and timeout <= 0:
+        return _deadline_skipped(module_spec, fixed_time)
+
+    if run.agents is not None and not run.agents.can_run([module_spec.module]):
+        return ModuleResult(
+            module_id=module_spec.id,
+            status="error",
+            started_at=fixed_time or datetime.now(UTC),
+            finished_at=fixed_time or datetime.now(UTC),
+            evidence={"error": "module not supported by agent"},
+            notes=f"missing capability: {module_spec.module}",
+        )
+
+    allowlist = effective_allowlist(module_spec, run.policy)
+    context = ModuleContext(
+        module_id=module_spec.id,
+        target_id=module_spec.target_id,
+        params=module_spec.params,
+        expectations=module_spec.expectations,
+        scope_allowlist=allowlist,
+        deadline=_wall_deadline(timeout),
+    )
+    return _PreparedModule(
+        spec=module_spec,
+        module=module,
+        allowlist=allowlist,
+        context=context,
+        timeout=timeout,
+        timeout_reason=timeout_reason,
+    )
+
+
+def _execute_module(run: _CampaignRun, module_spec: ModuleSpec) -> ModuleResult:
+    fixed_time = run.fixed_time
+    prepared = _prepare_module(run, module_spec)
+    if isinstance(prepared, ModuleResult):
+        return prepared
+    timeout = prepared.timeout
+
+    if run.agents is not None:
+        agents = run.agents
+        payload = _agent_payload(run, prepared)
+        dispatch = _AgentDispatch()
+
+        def send(tried: set[str]) -> ModuleResult:
+            with agents.route(
+                [module_spec.module],
+                avoid=tried,
+                slot=lambda agent: _agent_slot(run, [module_spec], agent.agent_id, dispatch),
+            ) as agent:
+                tried.add(agent.agent_id)
+                sent = agent.client.execute_module(payload, timeout_seconds=timeout)
+            return sent.model_copy(update={"agent_id": agent.agent_id})
+
+        def hedged_send(tried: set[str]) -> ModuleResult:
+            return _hedged(run, [module_spec.module], send, tried)
+
+        try:
+            result = _call_with_timeout(lambda: _with_retries(run, hedged_send, timeout), timeout)
+        except _DeadlinePassed:
+            return _deadline_skipped(module_spec, fixed_time)
+        except _ModuleTimeout:
+            if not dispatch.abandon() and prepared.timeout_reason == _DEADLINE_REASON:
+                return _deadline_skipped(module_spec, fixed_time)
+            return _timed_out(module_spec, timeout, prepared.timeout_reason, fixed_time)
+        except AgentClientError as exc:
+            return _agent_failure(module_spec, exc, fixed_time)
+    else:
+        module = prepared.module
+        context = prepared.context
+        key = None
+        if run.cache is not None:
+            key = cache_key(
+                module_spec,
+                target=run.target_lookup[module_spec.target_id],
+                allowlist=prepared.allowlist,
+                policy_hash=run.policy_hash,
+                module_version=module.version,
+            )
+            hit = run.cache.get(key)
+            if hit is not None:
+                return _normalized_result(
+                    hit.model_copy(update={"cached": True}), fixed_time=fixed_time
+                )
+        runner = run.process_runner
+        timeout_reason = prepared.timeout_reason
+        try:
+            with _dispatch_slot(run, [module_spec], deadline=run.deadline):
+                # Waiting for a slot or rate token counts against the campaign deadline.
+                if run.deadline is not None:
+                    timeout, timeout_reason = _module_timeout(run, module_spec)
+                    if timeout is not None and timeout <= 0:
+                        raise _DeadlinePassed
+                    context = replace(context, deadline=_wall_deadline(timeout))
+                if runner is not None:
+                    result = runner.run(module_spec.module, context, timeout=timeout)
+                else:
+                    result = _call_with_timeout(lambda: module.run(context), timeout)
+        except _DeadlinePassed:
+            return _deadline_skipped(module_spec, fixed_time)
+        except (_ModuleTimeout, ModuleWorkerTimeout):
+            return _timed_out(module_spec, timeout, timeout_reason, fixed_time)
+        except Exception as exc:  # pragma: no cover - defensive
+            return ModuleResult(
+                module_id=module_spec.id,
+                status="error",
+                started_at=fixed_time or datetime.now(UTC),
+                finished_at=fixed_time or datetime.now(UTC),
+                evidence={"error": "module exception", "message": str(exc)},
+            )
+        if run.cache is not None and key is not None:
+            run.cache.put(key, result)
+
+    return _normalized_result(result, fixed_time=fixed_time)
+
+
+def _execute_agent_batch(run: _CampaignRun, module_specs: list[ModuleSpec]) -> list[ModuleResult]:
+    fixed_time = run.fixed_time
+    results: dict[int, ModuleResult] = {}
+    batch: list[tuple[int, _PreparedModule]] = []
+    for position, module_spec in enumerate(module_specs):
+        prepared = _prepare_module(run, module_spec)
+        if isinstance(prepared, ModuleResult):
+            results[position] = prepared
+        else:
+            batch.append((position, prepared))
+
+    if batch:
+        agents = run.agents
+        if agents is None:
+            raise ValueError("Agent batches require an agent")
+        payloads = [_agent_payload(run, prepared) for _, prepared in batch]
+        # Batched modules carry no per-module timeout, so they share the campaign deadline.
+        timeout = min(
+            (prepared.timeout for _, prepared in batch if prepared.timeout is not None),
+            default=None,
+        )
+        batch_specs = [prepared.spec for _, prepared in batch]
+        modules = {module_spec.module for module_spec in batch_specs}
+        dispatch = _AgentDispatch()
+
+        def send(tried: set[str]) -> list[ModuleResult]:
+            with agents.route(
+                modules,
+                batch=True,
+                avoid=tried,
+                slot=lambda agent: _agent_slot(run, batch_specs, agent.agent_id, dispatch),
+            ) as agent:
+                tried.add(agent.agent_id)
+                sent = agent.client.execute_batch(payloads, timeout_seconds=timeout)
+            return [result.model_copy(update={"agent_id": agent.agent_id}) for result in sent]
+
+        try:
+            received = _call_with_timeout(lambda: _with_retries(run, send, timeout), timeout)
+        except _DeadlinePassed:
+            batch_results = [_deadline_skipped(prepared.spec, fixed_time) for _, prepared in batch]
+        except _ModuleTimeout:
+            sent = dispatch.abandon()
+            batch_results = [
+                _deadline_skipped(prepared.spec, fixed_time)
+                if not sent and prepared.timeout_reason == _DEADLINE_REASON
+                else _timed_out(prepared.spec, timeout, prepared.timeout_reason, fixed_time)
+                for _, prepared in batch
+            ]
+        except AgentClientError as exc:
+            batch_results = [
+                _agent_failure(prepared.spec, exc, fixed_time) for _, prepared in batch
+            ]
+        else:
+            batch_results = [
+                _normalized_result(result, fixed_time=fixed_time) for result in received
+            ]
+        for (position, _), result in zip(batch, batch_results, strict=True):
+            results[position] = result
+
+    return [results[position] for position in range(len(module_specs))]
+
+
+def _hedged(
+    run: _CampaignRun,
+    modules: list[str],
+    send: Callable[[set[str]], ModuleResult],
+    tried: set[str],
+) -> ModuleResult:
+    # Sends a second copy to another capable agent once the first has been outstanding for
+    # the pool's pNN latency and keeps whichever valid result arrives first. Blocking requests
+    # cannot be aborted, so the slower copy is abandoned and its result discarded.
+    policy = run.hedge_policy
+    agents = run.agents
+    if policy is None or agents is None or not agents.can_hedge(modules):
+        return send(tried)
+    delay = agents.latencies.percentile(policy.percentile, min_samples=policy.min_samples)
+    if delay is None:
+        return send(tried)
+
+    outcomes: queue.Queue[ModuleResult | BaseException] = queue.Queue()
+
+    def launch() -> None:
+        def target() -> None:
+            try:
+                outcomes.put(send(tried))
+            except BaseException as exc:  # re-raised in the calling thread
+                outcomes.put(exc)
+
+        threading.Thread(target=target, name="bas-hedge", daemon=True).start()
+
+    launch()
+    launched = 1
+    try:
+        outcome = outcomes.get(timeout=delay)
+    except queue.Empty:
+        launch()
+        launched = 2
+        outcome = outcomes.get()
+    received = 1
+    failure: BaseException | None = None
+    while isinstance(outcome, BaseException):
+        failure = failure or outcome
+        if received == launched:
+            raise failure
+        outcome = outcomes.get()
+        received += 1
+    return outcome.model_copy(update={"hedged": True}) if launched > 1 else outcome
+
+
+def _with_retries(run: _CampaignRun, send: Callable[[set[str]], _T], timeout: float | None) -> _T:
+    # Retries retryable agent failures with jittered backoff, preferring agents that have not
+    # failed this request yet. Stops once the next attempt could not finish in time.
+    policy = run.retry_policy
+    give_up_at = time.monotonic() + timeout if timeout is not None else None
+    tried: set[str] = set()
+    attempt = 1
+    while True:
+        try:
+            return send(tried)
+        except AgentClientError as exc:
+            if not exc.retryable or attempt >= policy.max_attempts:
+                raise
+            delay = policy.backoff(attempt)
+            if give_up_at is not None and time.monotonic() + delay >= give_up_at:
+                raise
+        time.sleep(delay)
+        attempt += 1
+
+
+def _agent_payload(run: _CampaignRun, prepared: _PreparedModule) -> dict[str, Any]:
+    module_spec = prepared.spec
+    return {
+        "run_id": run.run_id,
+        "module_id": module_spec.id,
+        "module": module_spec.module,
+        "target_id": module_spec.target_id,
+        "params": module_spec.params,
+        "expectations": module_spec.expectations,
+        "scope": {
+            "allowlist": prepared.allowlist,
+            "expires_at": (run.fixed_time or datetime.now(UTC)).isoformat(),
+        },
+    }
+
+
+def _agent_failure(
+    module_spec: ModuleSpec, exc: AgentClientError, fixed_time: datetime | None
+) -> ModuleResult:
+    return ModuleResult(
+        module_id=module_spec.id,
+        status="error",
+        started_at=fixed_time or datetime.now(UTC),
+        finished_at=fixed_time or datetime.now(UTC),
+        evidence={"error": "agent failure", "message": str(exc)},
+    )
+
+
+def _agent_batches(run: _CampaignRun, module_specs: list[ModuleSpec], size: int) -> list[list[int]]:
+    # Greedy grouping in campaign order. A batch never needs more slots of a limit key than
+    # the limit allows, otherwise it could never be dispatched.
+    batches: list[list[int]] = []
+    current: list[int] = []
+    used: Counter[str] = Counter()
+    for position, module_spec in enumerate(module_specs):
+        keys = Counter(_limit_keys(run, module_spec))
+        fits = len(current) < size and all(
+            limit is None or used[key] + count <= limit
+            for key, count in keys.items()
+            for limit in [_slot_limit(run, key)]
+        )
+        if current and not fits:
+            batches.append(current)
+            current, used = [], Counter()
+        current.append(position)
+        used.update(keys)
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _slot_limit(run: _CampaignRun, key: str) -> int | None:
+    return run.limiter.limit(key) if run.limiter is not None else None
 
 
-def _sign_payload(evidence: EvidencePack, key: str) -> str:
-    payload = evidence.model_dump(mode="json", exclude={"signature", "signature_alg"})
-    message = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
-    return hmac.new(key.encode("utf-8"), message, hashlib.sha256).hexdigest()
+_DEADLINE_REASON = "campaign deadline exceeded"
+
+
+class _ModuleTimeout(Exception):
+    pass
+
+
+class _DeadlinePassed(Exception):
+    # The campaign deadline passed while the module was still waiting to be dispatched.
+    pass
+
+
+class _AgentDispatch:
+    # Agent requests wait for their slot inside the thread _call_with_timeout abandons. The
+    # caller and that thread agree here, under one lock, on whether the request was sent
+    # before the caller gave up; an abandoned request is never sent afterwards.
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._sent = False
+        self._abandoned = False
+
+    def start(self) -> None:
+        with self._lock:
+            if self._abandoned:
+                raise _DeadlinePassed
+            self._sent = True
+
+    def abandon(self) -> bool:
+        # Returns whether the request had already been sent.
+        with self._lock:
+            self._abandoned = True
+            return self._sent
+
+
+def _module_timeout(run: _CampaignRun, module_spec: ModuleSpec) -> tuple[float | None, str]:
+    timeout = module_spec.timeout_seconds
+    reason = "module timeout"
+    if run.deadline is not None:
+        remaining = run.deadline - time.monotonic()
+        if timeout is None or remaining < timeout:
+            return remaining, _DEADLINE_REASON
+    return timeout, reason
+
+
+def _wall_deadline(timeout: float | None) -> float | None:
+    return time.time() + timeout if timeout is not None else None
+
+
+def _call_with_timeout(call: Callable[[], _T], timeout: float | None) -> _T:
+    if timeout is None:
+        return call()
+    # Python threads cannot be killed: on timeout the worker is abandoned (daemon) and the
+    # module is expected to notice ModuleContext.time_remaining() hitting zero and return.
+    outcome: list[_T | BaseException] = []
+
+    def target() -> None:
+        try:
+            outcome.append(call())
+        except BaseException as exc:  # re-raised in the calling thread
+            outcome.append(exc)
+
+    worker = threading.Thread(target=target, name="bas-module-timeout", daemon=True)
+    worker.start()
+    worker.join(timeout)
+    if worker.is_alive() or not outcome:
+        raise _ModuleTimeout
+    value = outcome[0]
+    if isinstance(value, BaseException):
+        raise value
+    return value
+
+
+def _timed_out(
+    module_spec: ModuleSpec, timeout: float | None, reason: str, fixed_time: datetime | None
+) -> ModuleResult:
+    return ModuleResult(
+        module_id=module_spec.id,
+        status="error",
+        started_at=fixed_time or datetime.now(UTC),
+        finished_at=fixed_time or datetime.now(UTC),
+        evidence={"error": "timeout", "reason": reason, "timeout_seconds": timeout},
+        notes=f"{reason} after {timeout:.3f}s" if timeout is not None else reason,
+    )
+
+
+def _deadline_skipped(module_spec: ModuleSpec, fixed_time: datetime | None) -> ModuleResult:
+    return ModuleResult(
+        module_id=module_spec.id,
+        status="skipped",
+        started_at=fixed_time or datetime.now(UTC),
+        finished_at=fixed_time or datetime.now(UTC),
+        evidence={"reason": _DEADLINE_REASON},
+        notes="not started before the campaign deadline",
+    )
+
+
+def _skipped_for_dependencies(
+    module_spec: ModuleSpec, unmet: list[str], fixed_time: datetime | None
+) -> ModuleResult:
+    return ModuleResult(
+        module_id=module_spec.id,
+        status="skipped",
+        started_at=fixed_time or datetime.now(UTC),
+        finished_at=fixed_time or datetime.now(UTC),
+        evidence={"reason": "dependency not satisfied", "dependencies": unmet},
+        notes=f"prerequisite did not pass: {', '.join(unmet)}",
+    )
+
+
+def _limit_keys(
+    run: _CampaignRun, module_spec: ModuleSpec, agent_id: str | None = None
+) -> list[str]:
+    keys = [f"target:{module_spec.target_id}"]
+    target = run.target_lookup.get(module_spec.target_id)
+    if target is not None:
+        keys.extend(f"tag:{tag}" for tag in sorted(set(target.tags)))
+    if agent_id is not None:
+        keys.append(f"agent:{agent_id}")
+    return keys
+
+
+@contextmanager
+def _dispatch_slot(
+    run: _CampaignRun,
+    module_specs: list[ModuleSpec],
+    agent_id: str | None = None,
+    *,
+    deadline: float | None = None,
+) -> Iterator[None]:
+    # A batch holds one slot per module and draws one rate token per module. With a deadline
+    # (time.monotonic), waiting stops once it passes and _DeadlinePassed is raised.
+    keys = [key for module_spec in module_specs for key in _limit_keys(run, module_spec, agent_id)]
+
+    def remaining() -> float | None:
+        return max(0.0, deadline - time.monotonic()) if deadline is not None else None
+
+    with ExitStack() as stack:
+        if run.limiter is not None:
+            try:
+                stack.enter_context(run.limiter.hold(keys, timeout=remaining()))
+            except TimeoutError:
+                raise _DeadlinePassed from None
+        if run.rate_limiter is not None:
+            for _ in module_specs:
+                if not run.rate_limiter.acquire(timeout=remaining()):
+                    raise _DeadlinePassed
+        yield
+
+
+@contextmanager
+def _agent_slot(
+    run: _CampaignRun, module_specs: list[ModuleSpec], agent_id: str, dispatch: _AgentDispatch
+) -> Iterator[None]:
+    with _dispatch_slot(run, module_specs, agent_id, deadline=run.deadline):
+        dispatch.start()
+        yield
+
+
+def _build_limiter(
+    spec: CampaignSpec, limits: ExecutionLimits, agents: AgentPool | None
+) -> ConcurrencyLimiter | None:
+    slots: dict[str, int] = {}
+    if limits.max_per_target is not None:
+        slots.update({f"target:{target.id}": limits.max_per_target for target in spec.targets})
+    slots.update({f"tag:{tag}": limit for tag, limit in limits.max_per_tag.items()})
+    if limits.max_per_agent is not None and agents is not None:
+        slots.update({f"agent:{agent_id}": limits.max_per_agent for agent_id in agents.agent_ids})
+    return ConcurrencyLimiter(slots) if slots else None
+
+
+def effective_limits(spec: CampaignSpec, policy: PolicySpec | None) -> ExecutionLimits:
+    # Policy limits are operator guardrails: when both sides set a limit the stricter wins.
+    campaign = spec.limits or ExecutionLimits()
+    if policy is None or policy.limits is None:
+        return campaign
+    guard = policy.limits
+    max_per_tag = dict(campaign.max_per_tag)
+    for tag, limit in guard.max_per_tag.items():
+        max_per_tag[tag] = min(limit, max_per_tag.get(tag, limit))
+    return ExecutionLimits(
+        max_per_target=_stricter(campaign.max_per_target, guard.max_per_target),
+        max_per_tag=max_per_tag,
+        max_per_agent=_stricter(campaign.max_per_agent, guard.max_per_agent),
+        requests_per_second=_stricter(campaign.requests_per_second, guard.requests_per_second),
+        burst=_stricter(campaign.burst, guard.burst),
+    )
+
+
+def _stricter(left: _LimitT | None, right: _LimitT | None) -> _LimitT | None:
+    if left is None:
+        return right
+    if right is None:
+        return left
+    return min(left, right)
+
+
+def sign_evidence(evidence: EvidencePack, key: str, *, merkle: bool = False) -> EvidencePack:
+    if merkle:
+        return sign_merkle(evidence, key)
+    return CanonicalEvidence(evidence).sign(key)
+
+
+def verify_evidence(evidence: EvidencePack, key: str) -> bool:
+    if evidence.signature_alg == MERKLE_ALG:
+        payloads = (result.model_dump(mode="json") for result in evidence.results)
+        return verify_merkle(evidence, payloads, key)
+    return CanonicalEvidence(evidence).verify(key)
 
 
 def compute_policy_hash(policy: PolicySpec) -> str:
-    payload = policy.model_dump(mode="json")
-    message = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
-    return hashlib.sha256(message).hexdigest()
+    return model_digest(policy)
 
 
 def effective_allowlist(module_spec: ModuleSpec, policy: PolicySpec | None) -> list[str]:
@@ -267,21 +1084,7 @@ def effective_allowlist(module_spec: ModuleSpec, policy: PolicySpec | None) -> l
 
 
 def score_results(results: list[ModuleResult]) -> tuple[float, dict[str, Any]]:
-    total = len(results)
-    passed = sum(1 for result in results if result.status == "pass")
-    failed = sum(1 for result in results if result.status == "fail")
-    errored = sum(1 for result in results if result.status == "error")
-    skipped = sum(1 for result in results if result.status == "skipped")
-
-    score = 0.0 if total == 0 else passed / total
-    summary = {
-        "total": total,
-        "passed": passed,
-        "failed": failed,
-        "errored": errored,
-        "skipped": skipped,
-    }
-    errors = validate_summary_counts(summary)
-    if errors:
-        raise ValueError(f"Invalid summary counts: {errors}")
-    return score, summary
+    tally = _ResultTally()
+    for result in results:
+        tally.add(result)
+    return tally.score()
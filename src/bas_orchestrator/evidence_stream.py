@@ -0,0 +1,333 @@
+from __future__ import annotations
+
+import gzip
+import hmac
+import json
+import os
+import zlib
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any, Generic, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from bas_orchestrator.blob_store import BlobStore
+from bas_orchestrator.canonical import (
+    SIGNATURE_ALG,
+    SIGNATURE_FIELDS,
+    canonical_array,
+    canonical_json,
+    canonical_object,
+    hmac_chunks,
+)
+from bas_orchestrator.merkle import (
+    MERKLE_ALG,
+    MerkleAccumulator,
+    leaf_hash,
+    merkle_signature,
+    verify_merkle,
+)
+from bas_orchestrator.models import (
+    EvidenceHeader,
+    EvidencePack,
+    EvidenceRows,
+    ModuleResult,
+    ResultRow,
+)
+
+# NDJSON evidence stream layout, one JSON object per line:
+#   {"record": "header", "schema_version", "campaign_name", "run_id", "started_at"}
+#   {"record": "result", "result": {...ModuleResult...}}        (campaign order, 0..n)
+#   {"record": "trailer", "finished_at", "score", "summary", "signature_alg", "signature"}
+# Signatures are computed over the same canonical form as a JSON evidence pack, so a stream
+# and the equivalent pack carry identical signatures. With merkle=True the writer hashes each
+# result as it is written, so signing needs no second pass over the file.
+#
+# Any evidence file (JSON pack or stream) may be gzip-compressed; readers detect the gzip magic
+# bytes. Streams are decompressed record by record, JSON packs in one piece (they are parsed
+# as a single document anyway). A compressed stream is two gzip members, results then trailer,
+# so the results can be re-read for signing before the trailer is appended.
+
+_HEADER_FIELDS = ("schema_version", "campaign_name", "run_id", "started_at")
+_TRAILER_FIELDS = ("finished_at", "score", "summary", "signature_alg", "signature", "merkle_root")
+_PROBE_BYTES = 64 * 1024
+_GZIP_MAGIC = b"\x1f\x8b"
+
+_ResultT = TypeVar("_ResultT", bound=BaseModel)
+
+
+class EvidenceStreamError(ValueError):
+    def __init__(self, reason: str, message: str) -> None:
+        super().__init__(message)
+        self.reason = reason
+
+
+def is_gzip_file(path: Path) -> bool:
+    with path.open("rb") as handle:
+        return handle.read(2) == _GZIP_MAGIC
+
+
+def open_evidence_file(path: Path) -> IO[bytes] | gzip.GzipFile:
+    if is_gzip_file(path):
+        return gzip.open(path, "rb")
+    return path.open("rb")
+
+
+def read_evidence_bytes(path: Path) -> bytes:
+    # Whole-file read for JSON packs; streams go through _lines instead.
+    try:
+        with open_evidence_file(path) as handle:
+            return handle.read()
+    except (EOFError, zlib.error, gzip.BadGzipFile) as exc:
+        raise EvidenceStreamError("invalid_json", f"Invalid gzip evidence file: {path}") from exc
+
+
+class EvidenceStreamWriter:
+    def __init__(
+        self,
+        path: Path,
+        *,
+        merkle: bool = False,
+        compress: bool = False,
+        blobs: BlobStore | None = None,
+    ) -> None:
+        self._path = path
+        self._handle: IO[str] | None = None
+        self._merkle = MerkleAccumulator() if merkle else None
+        self._compress = compress
+        self._blobs = blobs
+
+    def start(self, *, campaign_name: str, run_id: str, started_at: datetime) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        if self._compress:
+            self._handle = gzip.open(self._path, "wt", encoding="utf-8")
+        else:
+            self._handle = self._path.open("w", encoding="utf-8")
+        header = EvidencePack(
+            campaign_name=campaign_name,
+            run_id=run_id,
+            started_at=started_at,
+            finished_at=started_at,
+            results=[],
+            score=0.0,
+            summary={},
+        ).model_dump(mode="json", include=set(_HEADER_FIELDS))
+        self._write_line({"record": "header", **header})
+
+    def write(self, result: ModuleResult) -> None:
+        if self._blobs is not None:
+            result = self._blobs.externalize(result)
+        payload = result.model_dump(mode="json")
+        if self._merkle is not None:
+            self._merkle.add(leaf_hash(payload))
+        self._write_line({"record": "result", "result": payload})
+
+    def finish(self, evidence: EvidencePack, *, sign_key: str | None = None) -> EvidencePack:
+        if self._handle is None:
+            raise EvidenceStreamError("incomplete_stream", "Evidence stream was never started")
+        if self._compress:
+            # Completes the results member so it can be read back for signing.
+            self._handle.close()
+        else:
+            self._handle.flush()
+        if sign_key and self._merkle is not None:
+            root = self._merkle.root()
+            evidence = evidence.model_copy(
+                update={
+                    "signature_alg": MERKLE_ALG,
+                    "signature": merkle_signature(evidence, root, self._merkle.count, sign_key),
+                    "merkle_root": root.hex(),
+                }
+            )
+        elif sign_key:
+            payloads = (
+                result.model_dump(mode="json") for result in _read_results(self._path, ModuleResult)
+            )
+            signature = stream_signature(evidence, payloads, sign_key)
+            evidence = evidence.model_copy(
+                update={"signature_alg": SIGNATURE_ALG, "signature": signature}
+            )
+        trailer = evidence.model_dump(mode="json", include=set(_TRAILER_FIELDS))
+        record = {"record": "trailer", **trailer}
+        if self._compress:
+            with self._path.open("ab") as raw:
+                with gzip.GzipFile(fileobj=raw, mode="wb") as member:
+                    member.write(_encode_line(record).encode("utf-8"))
+                raw.flush()
+                os.fsync(raw.fileno())
+        else:
+            self._write_line(record)
+            os.fsync(self._handle.fileno())
+            self._handle.close()
+        self._handle = None
+        return evidence
+
+    def _write_line(self, record: dict[str, Any]) -> None:
+        if self._handle is None:
+            raise EvidenceStreamError("incomplete_stream", "Evidence stream was never started")
+        self._handle.write(_encode_line(record))
+        # A per-line flush on a gzip stream forces a sync block and ruins the compression ratio.
+        if not self._compress:
+            self._handle.flush()
+
+
+class EvidenceStream:
+    def __init__(self, path: Path, evidence: EvidencePack) -> None:
+        self.path = path
+        # Header and trailer metadata; ``results`` is always empty, use iter_results().
+        self.evidence = evidence
+
+    def iter_results(self) -> Iterator[ModuleResult]:
+        return _read_results(self.path, ModuleResult)
+
+    def iter_rows(self) -> Iterator[ResultRow]:
+        # Report fields only; evidence bodies are never materialized.
+        return _read_results(self.path, ResultRow)
+
+
+def is_evidence_stream(path: Path) -> bool:
+    try:
+        with open_evidence_file(path) as handle:
+            first_line = handle.readline(_PROBE_BYTES)
+        record = json.loads(first_line)
+    except (json.JSONDecodeError, UnicodeDecodeError, EOFError, zlib.error, gzip.BadGzipFile):
+        return False
+    return isinstance(record, dict) and record.get("record") == "header"
+
+
+def open_evidence_stream(path: Path) -> EvidenceStream:
+    with open_evidence_file(path) as handle:
+        header = _decode_record(handle.readline(), "header")
+    trailer = _decode_record(_last_line(path), "trailer")
+    fields = {key: header.get(key) for key in _HEADER_FIELDS if key in header}
+    fields.update({key: trailer.get(key) for key in _TRAILER_FIELDS if key in trailer})
+    try:
+        evidence = EvidencePack.model_validate({**fields, "results": []})
+    except ValidationError as exc:
+        raise EvidenceStreamError("invalid_schema", "Invalid evidence stream metadata") from exc
+    return EvidenceStream(path, evidence)
+
+
+def load_report_rows(path: Path) -> tuple[EvidenceHeader | EvidencePack, Iterable[ResultRow]]:
+    # Schema-light loading of a pack or stream for summaries: only report fields are
+    # validated, and evidence bodies are skipped by the parser instead of being built.
+    if is_evidence_stream(path):
+        stream = open_evidence_stream(path)
+        return stream.evidence, stream.iter_rows()
+    try:
+        pack = EvidenceRows.model_validate_json(read_evidence_bytes(path))
+    except ValidationError as exc:
+        reason = "invalid_json" if _is_json_error(exc) else "invalid_schema"
+        raise EvidenceStreamError(reason, f"Invalid evidence pack: {path}") from exc
+    return pack, pack.results
+
+
+def verify_evidence_stream(stream: EvidenceStream, key: str) -> bool:
+    evidence = stream.evidence
+    if evidence.signature_alg == MERKLE_ALG:
+        results = (result.model_dump(mode="json") for result in stream.iter_results())
+        return verify_merkle(evidence, results, key)
+    if evidence.signature_alg != SIGNATURE_ALG or not evidence.signature:
+        return False
+    payloads = (result.model_dump(mode="json") for result in stream.iter_results())
+    digest = stream_signature(evidence, payloads, key)
+    return hmac.compare_digest(digest, evidence.signature)
+
+
+def stream_signature(evidence: EvidencePack, results: Iterable[dict[str, Any]], key: str) -> str:
+    # Same bytes as CanonicalEvidence signs for a JSON pack, without holding every result in
+    # memory at once.
+    fields: dict[str, bytes | Iterable[bytes]] = {
+        name: canonical_json(value)
+        for name, value in evidence.model_dump(
+            mode="json", exclude=set(SIGNATURE_FIELDS) | {"results"}
+        ).items()
+    }
+    fields["results"] = canonical_array(results)
+    return hmac_chunks(canonical_object(fields), key)
+
+
+class _ResultLine(BaseModel, Generic[_ResultT]):
+    record: str | None = None
+    result: _ResultT | None = None
+
+
+def _read_results(path: Path, model: type[_ResultT]) -> Iterator[_ResultT]:
+    # Each line is parsed and validated in one pass by pydantic-core; fields the model does
+    # not declare are skipped by the parser.
+    line_model = _ResultLine[model]  # type: ignore[valid-type]
+    with open_evidence_file(path) as handle:
+        for line_number, line in enumerate(_lines(handle), start=1):
+            if not line.strip():
+                continue
+            try:
+                record = line_model.model_validate_json(line)
+            except ValidationError as exc:
+                reason = "invalid_json" if _is_json_error(exc) else "invalid_schema"
+                raise EvidenceStreamError(reason, f"Invalid record on line {line_number}") from exc
+            if record.record != "result":
+                continue
+            if record.result is None:
+                raise EvidenceStreamError("invalid_schema", f"Invalid result on line {line_number}")
+            yield record.result
+
+
+def _is_json_error(exc: ValidationError) -> bool:
+    return any(error["type"] == "json_invalid" for error in exc.errors())
+
+
+def _encode_line(record: dict[str, Any]) -> str:
+    return json.dumps(record, sort_keys=True, separators=(",", ":")) + "\n"
+
+
+def _lines(handle: Iterable[bytes]) -> Iterator[bytes]:
+    # A gzip stream cut off mid-run reads like a plain stream without its trailer.
+    try:
+        yield from handle
+    except (EOFError, zlib.error, gzip.BadGzipFile) as exc:
+        raise EvidenceStreamError("incomplete_stream", "Evidence stream is truncated") from exc
+
+
+def _decode_record(line: bytes, kind: str) -> dict[str, Any]:
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError as exc:
+        if kind == "trailer":
+            raise EvidenceStreamError(
+                "incomplete_stream", "Evidence stream has no trailer"
+            ) from exc
+        raise EvidenceStreamError("invalid_json", f"Invalid evidence stream {kind}") from exc
+    if not isinstance(record, dict) or record.get("record") != kind:
+        if kind == "trailer":
+            raise EvidenceStreamError("incomplete_stream", "Evidence stream has no trailer")
+        raise EvidenceStreamError("invalid_schema", f"Evidence stream {kind} missing")
+    return record
+
+
+def _last_line(path: Path, chunk_size: int = 8192) -> bytes:
+    if is_gzip_file(path):
+        # gzip cannot be read backwards; keep the last non-empty line of one forward pass.
+        last = b""
+        try:
+            with gzip.open(path, "rb") as compressed:
+                for line in _lines(compressed):
+                    if line.strip():
+                        last = line
+        except EvidenceStreamError:
+            return b""
+        return last.rstrip(b"\n")
+    with path.open("rb") as handle:
+        handle.seek(0, os.SEEK_END)
+        position = handle.tell()
+        buffer = b""
+        while position > 0:
+            step = min(chunk_size, position)
+            position -= step
+            handle.seek(position)
+            buffer = handle.read(step) + buffer
+            stripped = buffer.rstrip(b"\n")
+            newline = stripped.rfind(b"\n")
+            if newline != -1:
+                return stripped[newline + 1 :]
+        return buffer.rstrip(b"\n")
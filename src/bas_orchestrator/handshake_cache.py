@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from bas_orchestrator.agent_client import HandshakeResult
+from bas_orchestrator.canonical import canonical_digest
+
+# Accepted agent handshakes are stored as <dir>/<key>.json so later runs can dispatch before a
+# fresh handshake completes; the client revalidates every cached handshake in the background.
+# The key covers the agent URL, the expected agent id and policy hash, and what was requested.
+
+HANDSHAKE_CACHE_FORMAT = "v1"
+DEFAULT_HANDSHAKE_TTL_SECONDS = 300.0
+
+
+def handshake_cache_key(
+    base_url: str,
+    *,
+    agent_id: str | None,
+    expected_policy_hash: str | None,
+    capabilities: list[str],
+    version: str,
+) -> str:
+    payload = {
+        "format": HANDSHAKE_CACHE_FORMAT,
+        "base_url": base_url.rstrip("/"),
+        "agent_id": agent_id,
+        "expected_policy_hash": expected_policy_hash,
+        "capabilities": sorted(capabilities),
+        "version": version,
+    }
+    return canonical_digest(payload)
+
+
+class HandshakeCache:
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        ttl_seconds: float = DEFAULT_HANDSHAKE_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if ttl_seconds <= 0:
+            raise ValueError("Handshake cache TTL must be positive")
+        self._directory = directory
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+
+    def key(
+        self,
+        base_url: str,
+        *,
+        agent_id: str | None,
+        expected_policy_hash: str | None,
+        capabilities: list[str],
+        version: str,
+    ) -> str:
+        return handshake_cache_key(
+            base_url,
+            agent_id=agent_id,
+            expected_policy_hash=expected_policy_hash,
+            capabilities=capabilities,
+            version=version,
+        )
+
+    def get(self, key: str) -> HandshakeResult | None:
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_bytes())
+            stored_at = float(entry["stored_at"])
+            raw = entry["handshake"]
+            result = HandshakeResult(
+                agent_id=str(raw["agent_id"]),
+                capabilities=[str(capability) for capability in raw["capabilities"]],
+                policy_hash=raw["policy_hash"],
+                features=[str(feature) for feature in raw.get("features") or []],
+            )
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+            path.unlink(missing_ok=True)
+            return None
+        if self._clock() - stored_at > self._ttl_seconds:
+            path.unlink(missing_ok=True)
+            return None
+        return result
+
+    def put(self, key: str, result: HandshakeResult) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry: dict[str, Any] = {"stored_at": self._clock(), "handshake": asdict(result)}
+        # Write-then-rename keeps concurrent runs from reading a partial entry.
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(entry, handle, sort_keys=True, separators=(",", ":"))
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def invalidate(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self._directory / f"{key}.json"
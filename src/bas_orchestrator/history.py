@@ -0,0 +1,345 @@
+from __future__ import annotations
+
+import re
+import sqlite3
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from pydantic import ValidationError
+
+from bas_orchestrator.engine import verify_evidence
+from bas_orchestrator.evidence_stream import (
+    EvidenceStreamError,
+    is_evidence_stream,
+    load_report_rows,
+    open_evidence_stream,
+    read_evidence_bytes,
+    verify_evidence_stream,
+)
+from bas_orchestrator.models import (
+    EvidenceHeader,
+    EvidencePack,
+    ModuleResult,
+    ResultRow,
+)
+from bas_orchestrator.scheduler import nearest_rank
+
+# A local SQLite index over evidence packs and streams: one row per run and per result, so
+# history questions become single queries instead of re-parsing every pack. Files are
+# re-ingested only when their size or mtime changed; a run indexed again (same run_id) is
+# replaced. Timestamps are stored as fixed-width UTC strings so they compare lexically.
+
+HISTORY_SCHEMA_VERSION = 1
+HISTORY_VIEWS = ("modules", "runs", "trend", "newly-failing")
+EVIDENCE_SUFFIXES = (".json", ".json.gz", ".ndjson", ".ndjson.gz")
+_RELATIVE_TIME = re.compile(r"^(\d+)([dhm])$")
+_FAILING = ("fail", "error")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    campaign_name TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    finished_at TEXT NOT NULL,
+    score REAL NOT NULL,
+    signature_alg TEXT,
+    verified INTEGER,
+    source TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id TEXT NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    module_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    finished_at TEXT NOT NULL,
+    duration_ms INTEGER NOT NULL,
+    notes TEXT,
+    PRIMARY KEY (run_id, position)
+);
+CREATE INDEX IF NOT EXISTS results_module ON results(module_id, started_at);
+CREATE INDEX IF NOT EXISTS results_started ON results(started_at);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    run_id TEXT NOT NULL
+);
+"""
+
+
+class HistoryError(ValueError):
+    def __init__(self, reason: str, message: str) -> None:
+        super().__init__(message)
+        self.reason = reason
+
+
+@dataclass(frozen=True)
+class HistoryFilter:
+    module_id: str | None = None
+    campaign_name: str | None = None
+    status: str | None = None
+    since: datetime | None = None
+    until: datetime | None = None
+
+
+@dataclass(frozen=True)
+class IndexOutcome:
+    path: Path
+    run_id: str | None
+    # "indexed", "unchanged" or "error"
+    action: str
+    verified: bool | None = None
+    reason: str | None = None
+
+
+def parse_time(value: str, *, now: datetime | None = None) -> datetime:
+    # An ISO date/timestamp, or a relative age such as 7d, 24h or 30m.
+    match = _RELATIVE_TIME.match(value)
+    if match:
+        amount, unit = int(match.group(1)), match.group(2)
+        delta = {"d": timedelta(days=amount), "h": timedelta(hours=amount)}.get(
+            unit, timedelta(minutes=amount)
+        )
+        return (now or datetime.now(UTC)) - delta
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError as exc:
+        raise HistoryError("invalid_time", f"Invalid time: {value}") from exc
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=UTC)
+
+
+def evidence_files(paths: Iterable[Path]) -> Iterator[Path]:
+    for path in paths:
+        if path.is_dir():
+            yield from sorted(
+                item
+                for item in path.rglob("*")
+                if item.is_file() and item.name.endswith(EVIDENCE_SUFFIXES)
+            )
+        else:
+            yield path
+
+
+class HistoryIndex:
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        # typeshed only models single-argument aggregates.
+        self._conn.create_aggregate("percentile", 2, _Percentile)  # type: ignore[arg-type]
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, HISTORY_SCHEMA_VERSION):
+            self._conn.close()
+            raise HistoryError("unsupported_schema", f"Unsupported history index: {path}")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f"PRAGMA user_version = {HISTORY_SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> HistoryIndex:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def index(self, path: Path, *, sign_key: str | None = None) -> IndexOutcome:
+        stat = path.stat()
+        key = str(path.resolve())
+        known = self._conn.execute(
+            "SELECT files.run_id, size, mtime_ns, verified FROM files "
+            "LEFT JOIN runs ON runs.run_id = files.run_id WHERE path = ?",
+            (key,),
+        ).fetchone()
+        if (
+            known is not None
+            and known["size"] == stat.st_size
+            and known["mtime_ns"] == stat.st_mtime_ns
+            and (sign_key is None or known["verified"] is not None)
+        ):
+            return IndexOutcome(path, known["run_id"], "unchanged")
+        try:
+            header, rows, verified = _load(path, sign_key)
+            records = [
+                (header.run_id, position, *_result_columns(row))
+                for position, row in enumerate(rows)
+            ]
+        except (HistoryError, EvidenceStreamError) as exc:
+            return IndexOutcome(path, None, "error", reason=exc.reason)
+        with self._conn:
+            # Replaces both this run if indexed before and whatever run the file held last time
+            # (its content, and so its run_id, may have changed).
+            self._conn.execute(
+                "DELETE FROM runs WHERE run_id = ? OR source = ?", (header.run_id, key)
+            )
+            self._conn.execute(
+                "INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    header.run_id,
+                    header.campaign_name,
+                    _timestamp(header.started_at),
+                    _timestamp(header.finished_at),
+                    header.score,
+                    header.signature_alg,
+                    verified,
+                    key,
+                ),
+            )
+            self._conn.executemany("INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)", records)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                (key, stat.st_size, stat.st_mtime_ns, header.run_id),
+            )
+        return IndexOutcome(path, header.run_id, "indexed", verified=verified)
+
+    def query(self, view: str, filters: HistoryFilter | None = None) -> list[dict[str, Any]]:
+        if view not in HISTORY_VIEWS:
+            raise HistoryError("unknown_view", f"Unknown history view: {view}")
+        filters = filters or HistoryFilter()
+        if view == "newly-failing":
+            if filters.status is not None:
+                # The view selects failing results itself; a status filter cannot apply.
+                raise HistoryError(
+                    "unsupported_filter", "The newly-failing view does not take a status filter"
+                )
+            return self._newly_failing(filters)
+        where, params = _where(filters)
+        sql = {
+            "modules": f"""
+                SELECT module_id, COUNT(*) AS total,
+                    SUM(status = 'pass') AS passed, SUM(status = 'fail') AS failed,
+                    SUM(status = 'error') AS errored, SUM(status = 'skipped') AS skipped,
+                    percentile(duration_ms, 50) AS p50_ms, percentile(duration_ms, 95) AS p95_ms,
+                    MAX(results.started_at) AS last_seen
+                FROM results JOIN runs USING (run_id) {where}
+                GROUP BY module_id ORDER BY module_id""",
+            "runs": f"""
+                SELECT run_id, campaign_name, runs.started_at, score, verified,
+                    COUNT(*) AS total, SUM(status = 'fail') AS failed,
+                    SUM(status = 'error') AS errored
+                FROM results JOIN runs USING (run_id) {where}
+                GROUP BY run_id ORDER BY runs.started_at, run_id""",
+            "trend": f"""
+                SELECT substr(results.started_at, 1, 10) AS day,
+                    COUNT(DISTINCT run_id) AS runs, COUNT(*) AS total,
+                    SUM(status = 'pass') AS passed, SUM(status = 'fail') AS failed,
+                    SUM(status = 'error') AS errored,
+                    percentile(duration_ms, 95) AS p95_ms
+                FROM results JOIN runs USING (run_id) {where}
+                GROUP BY day ORDER BY day""",
+        }[view]
+        rows = [dict(row) for row in self._conn.execute(sql, params)]
+        if view == "runs":
+            for row in rows:
+                row["verified"] = None if row["verified"] is None else bool(row["verified"])
+        return rows
+
+    def _newly_failing(self, filters: HistoryFilter) -> list[dict[str, Any]]:
+        # Modules whose latest result fails after a passing one, with that transition inside
+        # the time window. Earlier history is consulted for the previous status.
+        where, params = _where(HistoryFilter(filters.module_id, filters.campaign_name))
+        outer = [
+            "recency = 1",
+            "previous_status = 'pass'",
+            f"status IN ({', '.join('?' for _ in _FAILING)})",
+        ]
+        outer_params: list[Any] = list(_FAILING)
+        if filters.since is not None:
+            outer.append("started_at >= ?")
+            outer_params.append(_timestamp(filters.since))
+        if filters.until is not None:
+            outer.append("started_at < ?")
+            outer_params.append(_timestamp(filters.until))
+        sql = f"""
+            WITH ordered AS (
+                SELECT module_id, run_id, status, results.started_at AS started_at,
+                    LAG(status) OVER (
+                        PARTITION BY module_id ORDER BY results.started_at, run_id
+                    ) AS previous_status,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY module_id ORDER BY results.started_at DESC, run_id DESC
+                    ) AS recency
+                FROM results JOIN runs USING (run_id) {where}
+            )
+            SELECT module_id, run_id, started_at, status, previous_status FROM ordered
+            WHERE {" AND ".join(outer)}
+            ORDER BY module_id"""
+        return [dict(row) for row in self._conn.execute(sql, [*params, *outer_params])]
+
+
+class _Percentile:
+    # Nearest-rank percentile, as used for hedging delays.
+    def __init__(self) -> None:
+        self._values: list[int] = []
+        self._percentile = 50
+
+    def step(self, value: int | None, percentile: int) -> None:
+        if value is not None:
+            self._values.append(value)
+        self._percentile = percentile
+
+    def finalize(self) -> int | None:
+        if not self._values:
+            return None
+        return nearest_rank(sorted(self._values), self._percentile)
+
+
+def _load(
+    path: Path, sign_key: str | None
+) -> tuple[EvidenceHeader | EvidencePack, Iterable[ResultRow | ModuleResult], bool | None]:
+    # Without a key only report fields are validated (as `bas report` does); verifying a
+    # signature needs the full results.
+    if not sign_key:
+        header, rows = load_report_rows(path)
+        return header, rows, None
+    if is_evidence_stream(path):
+        stream = open_evidence_stream(path)
+        return stream.evidence, stream.iter_rows(), verify_evidence_stream(stream, sign_key)
+    try:
+        pack = EvidencePack.model_validate_json(read_evidence_bytes(path))
+    except ValidationError as exc:
+        invalid_json = any(error["type"] == "json_invalid" for error in exc.errors())
+        reason = "invalid_json" if invalid_json else "invalid_schema"
+        raise HistoryError(reason, f"Invalid evidence pack: {path}") from exc
+    return pack, pack.results, verify_evidence(pack, sign_key)
+
+
+def _result_columns(row: ResultRow | ModuleResult) -> tuple[Any, ...]:
+    duration_ms = int((row.finished_at - row.started_at).total_seconds() * 1000)
+    return (
+        row.module_id,
+        row.status,
+        _timestamp(row.started_at),
+        _timestamp(row.finished_at),
+        duration_ms,
+        row.notes,
+    )
+
+
+def _timestamp(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _where(filters: HistoryFilter) -> tuple[str, list[Any]]:
+    clauses: list[str] = []
+    params: list[Any] = []
+    for clause, value in (
+        ("module_id = ?", filters.module_id),
+        ("campaign_name = ?", filters.campaign_name),
+        ("status = ?", filters.status),
+        ("results.started_at >= ?", filters.since),
+        ("results.started_at < ?", filters.until),
+    ):
+        if value is not None:
+            clauses.append(clause)
+            params.append(_timestamp(value) if isinstance(value, datetime) else value)
+    return ("WHERE " + " AND ".join(clauses) if clauses else ""), params
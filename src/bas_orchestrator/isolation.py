@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import multiprocessing
+import threading
+import time
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from multiprocessing.context import BaseContext
+
+from bas_orchestrator.models import ModuleResult
+from bas_orchestrator.modules.base import ModuleContext
+from bas_orchestrator.modules.registry import get_module
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    resource = None  # type: ignore[assignment]
+
+
+@dataclass(frozen=True)
+class ProcessIsolationConfig:
+    max_workers: int | None = None
+    # Recycle each worker after this many modules to contain leaks.
+    max_tasks_per_child: int | None = None
+    # Address-space (RLIMIT_AS) and CPU-time (RLIMIT_CPU) caps applied to every worker.
+    max_memory_bytes: int | None = None
+    max_cpu_seconds: int | None = None
+
+
+# After shutdown, idle workers get this long to exit before any still running are killed.
+_SHUTDOWN_GRACE_SECONDS = 1.0
+
+
+class ModuleIsolationError(RuntimeError):
+    pass
+
+
+class ModuleWorkerTimeout(ModuleIsolationError):
+    pass
+
+
+class ProcessModuleRunner:
+    # Runs registry modules in worker processes. Only the module name, the (small, frozen)
+    # ModuleContext and the resulting ModuleResult cross the process boundary. Each worker
+    # serves one module at a time over its own pipe, so a hung module is stopped by killing
+    # exactly its worker; modules running alongside it are unaffected and never re-run.
+    def __init__(self, config: ProcessIsolationConfig, *, default_workers: int) -> None:
+        if (config.max_memory_bytes or config.max_cpu_seconds) and resource is None:
+            raise ModuleIsolationError("Worker resource limits require a POSIX platform")
+        if config.max_tasks_per_child is not None and config.max_tasks_per_child < 1:
+            raise ValueError("max_tasks_per_child must be at least 1")
+        self._config = config
+        methods = multiprocessing.get_all_start_methods()
+        self._context = multiprocessing.get_context(
+            "forkserver" if "forkserver" in methods else "spawn"
+        )
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(config.max_workers or default_workers)
+        self._idle: list[_Worker] = []
+        self._workers: set[_Worker] = set()
+
+    def run(
+        self, module_name: str, context: ModuleContext, *, timeout: float | None = None
+    ) -> ModuleResult:
+        give_up_at = time.monotonic() + timeout if timeout is not None else None
+        if not self._slots.acquire(timeout=None if timeout is None else max(0.0, timeout)):
+            raise ModuleWorkerTimeout(f"Module did not finish within {timeout:.3f}s")
+        try:
+            worker = self._checkout()
+            try:
+                worker.connection.send((_run_in_worker, module_name, context))
+                remaining = give_up_at - time.monotonic() if give_up_at is not None else None
+                if not worker.connection.poll(None if remaining is None else max(0.0, remaining)):
+                    # A worker process cannot be interrupted, only killed.
+                    self._retire(worker, kill=True)
+                    raise ModuleWorkerTimeout(f"Module did not finish within {timeout:.3f}s")
+                outcome, value = worker.connection.recv()
+            except (EOFError, OSError) as exc:
+                # The worker died (rlimit hit, crash, OOM kill); a fresh one serves later modules.
+                self._retire(worker, kill=True)
+                raise ModuleIsolationError(
+                    f"Module worker terminated abruptly (exit code {worker.process.exitcode})"
+                ) from exc
+            self._checkin(worker)
+        finally:
+            self._slots.release()
+        if outcome == "error":
+            raise value
+        result: ModuleResult = value
+        return result
+
+    def shutdown(self) -> None:
+        # Never waits on a hung module: workers still running after a short grace are killed.
+        with self._lock:
+            workers, self._workers, self._idle = self._workers, set(), []
+        for worker in workers:
+            worker.stop()
+        give_up_at = time.monotonic() + _SHUTDOWN_GRACE_SECONDS
+        for worker in workers:
+            worker.process.join(max(0.0, give_up_at - time.monotonic()))
+            if worker.process.is_alive():
+                worker.process.kill()
+                worker.process.join()
+
+    def _checkout(self) -> _Worker:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        worker = _Worker(self._context, self._config)
+        with self._lock:
+            self._workers.add(worker)
+        return worker
+
+    def _checkin(self, worker: _Worker) -> None:
+        worker.tasks += 1
+        limit = self._config.max_tasks_per_child
+        if limit is not None and worker.tasks >= limit:
+            self._retire(worker)
+            return
+        with self._lock:
+            if worker in self._workers:
+                self._idle.append(worker)
+                return
+        worker.stop()  # shut down while the module ran
+
+    def _retire(self, worker: _Worker, *, kill: bool = False) -> None:
+        with self._lock:
+            self._workers.discard(worker)
+        if kill:
+            worker.process.kill()
+        worker.stop()
+        worker.process.join()
+
+
+class _Worker:
+    # One worker process and the parent's end of the pipe it serves modules over.
+    def __init__(self, context: BaseContext, config: ProcessIsolationConfig) -> None:
+        self.connection, child = context.Pipe()
+        self.process = context.Process(  # type: ignore[attr-defined]
+            target=_serve,
+            args=(child, config.max_memory_bytes, config.max_cpu_seconds),
+            daemon=True,
+        )
+        self.process.start()
+        child.close()
+        self.tasks = 0
+
+    def stop(self) -> None:
+        # Closing the pipe tells an idle worker to exit.
+        self.connection.close()
+
+
+def _serve(
+    connection: Connection, max_memory_bytes: int | None, max_cpu_seconds: int | None
+) -> None:
+    _apply_worker_limits(max_memory_bytes, max_cpu_seconds)
+    while True:
+        try:
+            run, module_name, context = connection.recv()
+        except EOFError:
+            return
+        try:
+            outcome: tuple[str, object] = ("ok", run(module_name, context))
+        except Exception as exc:
+            outcome = ("error", exc)
+        try:
+            connection.send(outcome)
+        except Exception as exc:  # the module raised or returned something unpicklable
+            connection.send(("error", ModuleIsolationError(f"Module outcome not sendable: {exc}")))
+
+
+def _run_in_worker(module_name: str, context: ModuleContext) -> ModuleResult:
+    return get_module(module_name).run(context)
+
+
+def _apply_worker_limits(max_memory_bytes: int | None, max_cpu_seconds: int | None) -> None:
+    if resource is None:
+        return
+    if max_memory_bytes is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (max_memory_bytes, max_memory_bytes))
+    if max_cpu_seconds is not None:
+        resource.setrlimit(resource.RLIMIT_CPU, (max_cpu_seconds, max_cpu_seconds))
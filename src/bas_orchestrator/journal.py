@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any
+
+from pydantic import ValidationError
+
+from bas_orchestrator.models import ModuleResult
+
+# Write-ahead journal, one JSON object per line:
+#   {"record": "journal", "run_id", "started_at", "campaign_digest", "deterministic"}
+#   {"record": "result", "index": <campaign position>, "result": {...ModuleResult...}}
+# Every line is fsync'd before the result is handed on, so a crashed run can be resumed
+# from the last durable result. A torn final line is discarded on resume.
+
+JOURNAL_SUFFIX = ".journal"
+
+
+class JournalError(Exception):
+    pass
+
+
+@dataclass
+class JournalState:
+    run_id: str
+    started_at: datetime
+    campaign_digest: str
+    deterministic: bool
+    completed: dict[int, ModuleResult] = field(default_factory=dict)
+
+
+class RunJournal:
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+        self._path: Path | None = None
+        self._handle: IO[str] | None = None
+        self.state: JournalState | None = None
+
+    @classmethod
+    def resume(cls, path: Path) -> RunJournal:
+        journal = cls(path.parent)
+        journal._path = path
+        journal.state = _load_state(path)
+        return journal
+
+    @property
+    def path(self) -> Path | None:
+        return self._path
+
+    def begin(
+        self, *, run_id: str, started_at: datetime, campaign_digest: str, deterministic: bool
+    ) -> None:
+        if self.state is not None:
+            raise JournalError("Journal already started")
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._path = self._directory / f"{run_id}{JOURNAL_SUFFIX}"
+        if self._path.exists():
+            raise JournalError(f"Journal already exists: {self._path}")
+        self.state = JournalState(
+            run_id=run_id,
+            started_at=started_at,
+            campaign_digest=campaign_digest,
+            deterministic=deterministic,
+        )
+        self._append(
+            {
+                "record": "journal",
+                "run_id": run_id,
+                "started_at": started_at.isoformat(),
+                "campaign_digest": campaign_digest,
+                "deterministic": deterministic,
+            }
+        )
+
+    def record(self, index: int, result: ModuleResult) -> None:
+        self._append({"record": "result", "index": index, "result": result.model_dump(mode="json")})
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def complete(self) -> None:
+        # Called once the evidence is durably written: nothing is left to resume, and a
+        # deterministic rerun (same run id) must be able to start a fresh journal.
+        self.close()
+        if self._path is not None:
+            self._path.unlink(missing_ok=True)
+
+    def _append(self, record: dict[str, Any]) -> None:
+        if self._path is None:
+            raise JournalError("Journal not started")
+        if self._handle is None:
+            self._handle = self._path.open("a", encoding="utf-8")
+        self._handle.write(json.dumps(record, sort_keys=True, separators=(",", ":")) + "\n")
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+
+
+def _load_state(path: Path) -> JournalState:
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError as exc:
+        raise JournalError(f"Journal not found: {path}") from exc
+
+    lines = raw.split(b"\n")
+    state: JournalState | None = None
+    offset = 0
+    for position, line in enumerate(lines):
+        is_last = position == len(lines) - 1
+        if not line.strip():
+            offset += len(line) + (0 if is_last else 1)
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as exc:
+            if is_last:
+                # Torn write from a crash; drop it so appends continue on a clean line.
+                with path.open("r+b") as handle:
+                    handle.truncate(offset)
+                raw = raw[:offset]
+                break
+            raise JournalError(f"Corrupt journal line {position + 1}: {path}") from exc
+        offset += len(line) + (0 if is_last else 1)
+        if not isinstance(record, dict):
+            raise JournalError(f"Corrupt journal line {position + 1}: {path}")
+        if state is None:
+            state = _decode_header(record, path)
+            continue
+        index, result = _decode_result(record, position + 1, path)
+        state.completed[index] = result
+
+    if state is None:
+        raise JournalError(f"Journal has no header: {path}")
+    if not raw.endswith(b"\n"):
+        with path.open("ab") as handle:
+            handle.write(b"\n")
+    return state
+
+
+def _decode_header(record: dict[str, Any], path: Path) -> JournalState:
+    if record.get("record") != "journal":
+        raise JournalError(f"Journal has no header: {path}")
+    try:
+        return JournalState(
+            run_id=str(record["run_id"]),
+            started_at=datetime.fromisoformat(str(record["started_at"])),
+            campaign_digest=str(record["campaign_digest"]),
+            deterministic=bool(record["deterministic"]),
+        )
+    except (KeyError, ValueError) as exc:
+        raise JournalError(f"Invalid journal header: {path}") from exc
+
+
+def _decode_result(
+    record: dict[str, Any], line_number: int, path: Path
+) -> tuple[int, ModuleResult]:
+    index = record.get("index")
+    if record.get("record") != "result" or not isinstance(index, int) or index < 0:
+        raise JournalError(f"Corrupt journal line {line_number}: {path}")
+    try:
+        return index, ModuleResult.model_validate(record.get("result"))
+    except ValidationError as exc:
+        raise JournalError(f"Corrupt journal line {line_number}: {path}") from exc
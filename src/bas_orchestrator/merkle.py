@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+from collections.abc import Iterable
+from typing import Any
+
+from pydantic import ValidationError
+
+from bas_orchestrator.canonical import SIGNATURE_FIELDS, canonical_json
+from bas_orchestrator.models import EvidencePack, ModuleResult
+
+# Merkle signing: every result is a leaf (SHA-256 of 0x00 || canonical result JSON), interior
+# nodes hash 0x01 || left || right and the tree shape follows RFC 6962. The HMAC covers the
+# pack metadata plus the root and result count, so one result can be checked against the
+# signature with log2(n) sibling hashes instead of the whole pack.
+
+MERKLE_ALG = "merkle-hmac-sha256"
+PROOF_RECORD = "merkle-proof"
+_LEAF_PREFIX = b"\x00"
+_NODE_PREFIX = b"\x01"
+
+
+class MerkleProofError(ValueError):
+    def __init__(self, reason: str, message: str) -> None:
+        super().__init__(message)
+        self.reason = reason
+
+
+def leaf_hash(result: dict[str, Any]) -> bytes:
+    return hashlib.sha256(_LEAF_PREFIX + canonical_json(result)).digest()
+
+
+def _node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(_NODE_PREFIX + left + right).digest()
+
+
+class MerkleAccumulator:
+    # Builds the root as leaves arrive, holding one subtree per set bit of the leaf count.
+    def __init__(self) -> None:
+        self._stack: list[tuple[int, bytes]] = []
+        self.count = 0
+
+    def add(self, leaf: bytes) -> None:
+        size, node = 1, leaf
+        while self._stack and self._stack[-1][0] == size:
+            _, left = self._stack.pop()
+            node = _node_hash(left, node)
+            size *= 2
+        self._stack.append((size, node))
+        self.count += 1
+
+    def root(self) -> bytes:
+        if not self._stack:
+            return hashlib.sha256(b"").digest()
+        node = self._stack[-1][1]
+        for _, left in reversed(self._stack[:-1]):
+            node = _node_hash(left, node)
+        return node
+
+
+def merkle_root(leaves: Iterable[bytes]) -> bytes:
+    accumulator = MerkleAccumulator()
+    for leaf in leaves:
+        accumulator.add(leaf)
+    return accumulator.root()
+
+
+def inclusion_proof(leaves: list[bytes], index: int) -> list[bytes]:
+    # Sibling hashes from the leaf up to the root (RFC 6962 audit path).
+    if len(leaves) <= 1:
+        return []
+    split = 1 << ((len(leaves) - 1).bit_length() - 1)
+    if index < split:
+        return [*inclusion_proof(leaves[:split], index), merkle_root(leaves[split:])]
+    return [*inclusion_proof(leaves[split:], index - split), merkle_root(leaves[:split])]
+
+
+def root_from_proof(leaf: bytes, index: int, size: int, proof: list[bytes]) -> bytes | None:
+    # RFC 9162 section 2.1.3.2; None when the proof cannot belong to a tree of this size.
+    if not 0 <= index < size:
+        return None
+    node, position, last = leaf, index, size - 1
+    for sibling in proof:
+        if last == 0:
+            return None
+        if position & 1 or position == last:
+            node = _node_hash(sibling, node)
+            while not position & 1 and position:
+                position >>= 1
+                last >>= 1
+        else:
+            node = _node_hash(node, sibling)
+        position >>= 1
+        last >>= 1
+    return node if last == 0 else None
+
+
+def merkle_signature(evidence: EvidencePack, root: bytes, count: int, key: str) -> str:
+    fields = evidence.model_dump(mode="json", exclude=set(SIGNATURE_FIELDS) | {"results"})
+    message = canonical_json({**fields, "merkle_root": root.hex(), "result_count": count})
+    return hmac.new(key.encode("utf-8"), message, hashlib.sha256).hexdigest()
+
+
+def sign_merkle(evidence: EvidencePack, key: str) -> EvidencePack:
+    root = merkle_root(leaf_hash(result.model_dump(mode="json")) for result in evidence.results)
+    return evidence.model_copy(
+        update={
+            "signature_alg": MERKLE_ALG,
+            "signature": merkle_signature(evidence, root, len(evidence.results), key),
+            "merkle_root": root.hex(),
+        }
+    )
+
+
+def verify_merkle(evidence: EvidencePack, results: Iterable[dict[str, Any]], key: str) -> bool:
+    # Streams the results once; only O(log n) subtree hashes are held at a time.
+    if evidence.signature_alg != MERKLE_ALG or not evidence.signature or not evidence.merkle_root:
+        return False
+    accumulator = MerkleAccumulator()
+    for result in results:
+        accumulator.add(leaf_hash(result))
+    root = accumulator.root()
+    if not hmac.compare_digest(root.hex(), evidence.merkle_root):
+        return False
+    expected = merkle_signature(evidence, root, accumulator.count, key)
+    return hmac.compare_digest(expected, evidence.signature)
+
+
+def build_proof(
+    evidence: EvidencePack, results: Iterable[dict[str, Any]], module_id: str
+) -> dict[str, Any]:
+    if evidence.signature_alg != MERKLE_ALG or not evidence.merkle_root:
+        raise MerkleProofError("not_merkle_signed", "Evidence is not Merkle-signed")
+    leaves: list[bytes] = []
+    index: int | None = None
+    selected: dict[str, Any] | None = None
+    for position, result in enumerate(results):
+        leaves.append(leaf_hash(result))
+        if result.get("module_id") == module_id and index is None:
+            index, selected = position, result
+    if index is None or selected is None:
+        raise MerkleProofError("unknown_module", f"No result for module: {module_id}")
+    return {
+        "record": PROOF_RECORD,
+        "evidence": evidence.model_dump(mode="json", exclude={"results"}),
+        "result_count": len(leaves),
+        "index": index,
+        "result": selected,
+        "proof": [sibling.hex() for sibling in inclusion_proof(leaves, index)],
+    }
+
+
+def verify_proof(document: dict[str, Any], key: str) -> bool:
+    try:
+        evidence = EvidencePack.model_validate({**document["evidence"], "results": []})
+        count = int(document["result_count"])
+        index = int(document["index"])
+        result = ModuleResult.model_validate(document["result"]).model_dump(mode="json")
+        proof = [bytes.fromhex(sibling) for sibling in document["proof"]]
+    except (KeyError, TypeError, ValueError, ValidationError) as exc:
+        raise MerkleProofError("invalid_proof", "Invalid Merkle proof document") from exc
+    if evidence.signature_alg != MERKLE_ALG or not evidence.signature or not evidence.merkle_root:
+        return False
+    root = root_from_proof(leaf_hash(result), index, count, proof)
+    if root is None or not hmac.compare_digest(root.hex(), evidence.merkle_root):
+        return False
+    expected = merkle_signature(evidence, root, count, key)
+    return hmac.compare_digest(expected, evidence.signature)
@@ -1,9 +1,31 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Literal
+from typing import Any, ClassVar, Literal, TypeAlias
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, SerializerFunctionWrapHandler, model_serializer
+
+
+class _ContractModel(BaseModel):
+    # Optional fields added after v1 are dropped from dumps while unset, so run ids,
+    # policy hashes and evidence signatures of existing documents stay stable.
+    _omit_when_none: ClassVar[frozenset[str]] = frozenset()
+
+    @model_serializer(mode="wrap")
+    def _omit_unset_extensions(self, handler: SerializerFunctionWrapHandler) -> dict[str, Any]:
+        data: dict[str, Any] = handler(self)
+        for name in self._omit_when_none:
+            if data.get(name) is None:
+                data.pop(name, None)
+        return data
+
+
+class ExecutionLimits(BaseModel):
+    max_per_target: int | None = Field(default=None, ge=1)
+    max_per_tag: dict[str, int] = Field(default_factory=dict)
+    max_per_agent: int | None = Field(default=None, ge=1)
+    requests_per_second: float | None = Field(default=None, gt=0)
+    burst: int | None = Field(default=None, ge=1)
 
 
 class Target(BaseModel):
@@ -12,32 +34,49 @@ class Target(BaseModel):
     tags: list[str] = Field(default_factory=list)
 
 
-class ModuleSpec(BaseModel):
+class ModuleSpec(_ContractModel):
+    _omit_when_none = frozenset({"depends_on", "timeout_seconds"})
+
     id: str
     module: str
     target_id: str
     expectations: dict[str, Any] = Field(default_factory=dict)
     params: dict[str, Any] = Field(default_factory=dict)
     scope_allowlist: list[str] = Field(default_factory=list)
+    depends_on: list[str] | None = None
+    timeout_seconds: float | None = Field(default=None, gt=0)
 
 
-class CampaignSpec(BaseModel):
+class CampaignSpec(_ContractModel):
+    _omit_when_none = frozenset({"limits"})
+
     version: str = "v1"
     name: str
     targets: list[Target]
     modules: list[ModuleSpec]
+    limits: ExecutionLimits | None = None
+
 
+ResultStatus: TypeAlias = Literal["pass", "fail", "skipped", "error"]
+
+
+class ModuleResult(_ContractModel):
+    _omit_when_none = frozenset({"cached", "agent_id", "hedged"})
 
-class ModuleResult(BaseModel):
     module_id: str
-    status: Literal["pass", "fail", "skipped", "error"]
+    status: ResultStatus
     started_at: datetime
     finished_at: datetime
     evidence: dict[str, Any] = Field(default_factory=dict)
     notes: str | None = None
+    cached: bool | None = None
+    agent_id: str | None = None
+    hedged: bool | None = None
 
 
-class EvidencePack(BaseModel):
+class EvidencePack(_ContractModel):
+    _omit_when_none = frozenset({"merkle_root"})
+
     schema_version: str = "v1"
     campaign_name: str
     run_id: str
@@ -48,14 +87,45 @@ class EvidencePack(BaseModel):
     summary: dict[str, Any]
     signature_alg: str | None = None
     signature: str | None = None
+    # Hex root over per-result leaf hashes; set only for merkle-hmac-sha256 signatures.
+    merkle_root: str | None = None
+
+
+# Schema-light views for reporting: only the fields a summary prints are validated, and
+# unknown fields (evidence bodies, signatures) are skipped by the JSON parser without ever
+# becoming Python objects.
+
+
+class ResultRow(BaseModel):
+    module_id: str
+    status: ResultStatus
+    started_at: datetime
+    finished_at: datetime
+    notes: str | None = None
+
+
+class EvidenceHeader(BaseModel):
+    campaign_name: str
+    run_id: str
+    started_at: datetime
+    finished_at: datetime
+    score: float
+    signature_alg: str | None = None
+
+
+class EvidenceRows(EvidenceHeader):
+    results: list[ResultRow]
 
 
 class PolicyRule(BaseModel):
     allowlist: list[str] = Field(default_factory=list)
 
 
-class PolicySpec(BaseModel):
+class PolicySpec(_ContractModel):
+    _omit_when_none = frozenset({"limits"})
+
     version: str = "v1"
     allowlist: list[str] = Field(default_factory=list)
     targets: dict[str, PolicyRule] = Field(default_factory=dict)
     modules: dict[str, PolicyRule] = Field(default_factory=dict)
+    limits: ExecutionLimits | None = None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
@@ -14,10 +15,20 @@ class ModuleContext:
     params: dict[str, Any]
     expectations: dict[str, Any]
     scope_allowlist: list[str]
+    # Wall-clock (time.time) instant after which the orchestrator stops waiting for this run.
+    # Long-running modules should poll time_remaining() and return early once it reaches 0.
+    deadline: float | None = None
+
+    def time_remaining(self) -> float | None:
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.time())
 
 
 class Module:
     name: str = "base"
+    # Bump whenever behaviour changes so cached results from older code are not reused.
+    version: str = "1"
 
     def run(self, context: ModuleContext) -> ModuleResult:
         started_at = datetime.now(UTC)
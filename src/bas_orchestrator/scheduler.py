@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import math
+import random
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TypeVar
+
+_T = TypeVar("_T")
+
+
+class ConcurrencyLimiter:
+    # Keys look like "target:<id>", "tag:<tag>" or "agent:<id>". All keys of one request
+    # are acquired atomically, so holders of overlapping key sets cannot deadlock.
+    def __init__(self, limits: Mapping[str, int]) -> None:
+        for key, limit in limits.items():
+            if limit < 1:
+                raise ValueError(f"Concurrency limit for {key} must be at least 1")
+        self._limits = dict(limits)
+        self._in_flight: Counter[str] = Counter()
+        self._condition = threading.Condition()
+
+    @contextmanager
+    def hold(self, keys: Iterable[str], *, timeout: float | None = None) -> Iterator[None]:
+        # Raises TimeoutError when the slots are not free within timeout seconds.
+        wanted = Counter(key for key in keys if key in self._limits)
+        for key, count in wanted.items():
+            if count > self._limits[key]:
+                raise ValueError(f"Requested {count} slots for {key}; limit is {self._limits[key]}")
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._has_capacity(wanted), timeout):
+                raise TimeoutError(f"No free slot within {timeout:.3f}s")
+            self._in_flight.update(wanted)
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._in_flight.subtract(wanted)
+                self._condition.notify_all()
+
+    def limit(self, key: str) -> int | None:
+        return self._limits.get(key)
+
+    def in_flight(self, key: str) -> int:
+        with self._condition:
+            return self._in_flight[key]
+
+    def _has_capacity(self, wanted: Counter[str]) -> bool:
+        return all(
+            self._in_flight[key] + count <= self._limits[key] for key, count in wanted.items()
+        )
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("Token bucket rate must be positive")
+        if burst < 1:
+            raise ValueError("Token bucket burst must be at least 1")
+        self._rate = rate
+        self._burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 1, *, timeout: float | None = None) -> bool:
+        # Like Lock.acquire: returns False, without taking tokens, when they cannot be had
+        # within timeout seconds.
+        if tokens > self._burst:
+            raise ValueError(f"Requested {tokens} tokens; burst is {self._burst}")
+        give_up_at = self._clock() + timeout if timeout is not None else None
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return True
+                wait = (tokens - self._tokens) / self._rate
+            if give_up_at is not None and now + wait > give_up_at:
+                return False
+            self._sleep(wait)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = 1
+    base_delay_seconds: float = 0.1
+    max_delay_seconds: float = 5.0
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("Retry max_attempts must be at least 1")
+        if self.base_delay_seconds < 0 or self.max_delay_seconds < 0:
+            raise ValueError("Retry delays must not be negative")
+
+    def backoff(self, attempt: int, *, rng: Callable[[], float] = random.random) -> float:
+        # Full jitter: uniform in [0, min(max, base * 2^(attempt-1))] so retries from many
+        # modules hitting the same failed agent do not arrive in lockstep.
+        ceiling = min(self.max_delay_seconds, self.base_delay_seconds * 2.0 ** (attempt - 1))
+        return ceiling * rng()
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    # Send a second copy of a request once it has been outstanding longer than the given
+    # percentile of recently observed latencies (needs min_samples observations first).
+    percentile: float = 95.0
+    min_samples: int = 20
+    window: int = 256
+
+    def __post_init__(self) -> None:
+        if not 0 < self.percentile < 100:
+            raise ValueError("Hedge percentile must be between 0 and 100")
+        if self.min_samples < 1 or self.window < self.min_samples:
+            raise ValueError("Hedge window must hold at least min_samples >= 1 samples")
+
+
+class LatencyWindow:
+    def __init__(self, size: int) -> None:
+        self._samples: deque[float] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, percentile: float, *, min_samples: int = 1) -> float | None:
+        with self._lock:
+            ordered = sorted(self._samples)
+        if len(ordered) < max(1, min_samples):
+            return None
+        return nearest_rank(ordered, percentile)
+
+
+def nearest_rank(ordered: Sequence[_T], percentile: float) -> _T:
+    # Nearest-rank percentile of a non-empty, sorted sequence.
+    rank = math.ceil(percentile / 100 * len(ordered))
+    return ordered[min(len(ordered), max(rank, 1)) - 1]
+
+
+@dataclass(frozen=True)
+class CircuitBreakerPolicy:
+    failure_threshold: int = 5
+    reset_seconds: float = 30.0
+
+
+class CircuitBreaker:
+    # closed -> open after failure_threshold consecutive failures; open -> half-open once
+    # reset_seconds have passed, letting a single probe through that closes or reopens it.
+    def __init__(
+        self, policy: CircuitBreakerPolicy, *, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        if policy.failure_threshold < 1:
+            raise ValueError("Circuit breaker failure_threshold must be at least 1")
+        if policy.reset_seconds < 0:
+            raise ValueError("Circuit breaker reset_seconds must not be negative")
+        self._threshold = policy.failure_threshold
+        self._reset_seconds = policy.reset_seconds
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._probing or self._clock() - self._opened_at >= self._reset_seconds:
+                return "half-open"
+            return "open"
+
+    def available(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            return not self._probing and self._clock() - self._opened_at >= self._reset_seconds
+
+    def begin(self) -> None:
+        with self._lock:
+            if self._opened_at is not None:
+                self._probing = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self._threshold:
+                self._opened_at = self._clock()
+            self._probing = False
+
+    def release(self) -> None:
+        # The admitted request was abandoned before reaching the agent; let another probe in.
+        with self._lock:
+            self._probing = False
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from bas_orchestrator.agent_client import AgentClientConfig
+
+# One configurable fake agent for the agent client, pool and engine tests. The defaults answer
+# every endpoint successfully; each test switches on only the behaviour it exercises.
+
+HANDSHAKE_PATH = "/v1/agent/handshake"
+EXECUTE_PATH = "/v1/agent/modules/execute"
+EXECUTE_BATCH_PATH = "/v1/agent/modules/execute-batch"
+
+
+class FakeAgentServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, agent_id: str = "agent-1") -> None:
+        super().__init__(("127.0.0.1", 0), _FakeAgentHandler)
+        self.agent_id = agent_id
+        self.lock = threading.Lock()
+        # Handshake answer.
+        self.policy_hash: str | None = "abc"
+        self.features: list[str] = []
+        self.handshake_failure: int | None = None
+        # Execution answers: the first failures_left requests get failure_status.
+        self.failures_left = 0
+        self.failure_status = 503
+        self.reverse_batches = False
+        # Called with the module payload before answering it, e.g. to stall one module.
+        self.before_execute: Callable[[dict[str, Any]], None] | None = None
+        # Transport behaviour.
+        self.delay = 0.0
+        self.gzip_responses = False
+        self.corrupt_response: bytes | None = None
+        self.close_after_response = False
+        self.drop_after_response = False
+        # What was received.
+        self.requests: list[tuple[str, dict[str, Any]]] = []
+        self.request_encodings: list[str | None] = []
+        self.peers: list[int] = []
+        self.executions = 0
+        self.in_flight = 0
+        self.peak = 0
+
+    @property
+    def handshakes(self) -> int:
+        return sum(1 for path, _ in self.requests if path == HANDSHAKE_PATH)
+
+    def execution_paths(self) -> list[str]:
+        return [path for path, _ in self.requests if path != HANDSHAKE_PATH]
+
+    def config(self, **overrides: Any) -> AgentClientConfig:
+        host, port = self.server_address[:2]
+        return AgentClientConfig(
+            base_url=f"http://{host!s}:{port}", enabled=True, allow_insecure_http=True, **overrides
+        )
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        # Clients in these tests hang up mid-request on purpose (timeouts, cancellation).
+        return
+
+
+@contextmanager
+def serving(*servers: FakeAgentServer) -> Iterator[None]:
+    for server in servers:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield
+    finally:
+        for server in servers:
+            server.shutdown()
+            server.server_close()
+
+
+def module_result(agent_id: str, payload: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "module_id": payload["module_id"],
+        "status": "pass",
+        "started_at": "1970-01-01T00:00:00+00:00",
+        "finished_at": "1970-01-01T00:00:00+00:00",
+        "evidence": {"answered_by": agent_id, "params": payload.get("params", {})},
+    }
+
+
+class _FakeAgentHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: FakeAgentServer
+
+    def do_POST(self) -> None:
+        server = self.server
+        raw = self.rfile.read(int(self.headers.get("Content-Length", "0")))
+        encoding = self.headers.get("Content-Encoding")
+        payload = json.loads(gzip.decompress(raw) if encoding == "gzip" else raw)
+        with server.lock:
+            server.requests.append((self.path, payload))
+            server.request_encodings.append(encoding)
+            server.peers.append(self.client_address[1])
+            server.in_flight += 1
+            server.peak = max(server.peak, server.in_flight)
+        try:
+            time.sleep(server.delay)
+            status, body = self._answer(payload)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+        self._respond(status, body)
+
+    def _answer(self, payload: dict[str, Any]) -> tuple[int, dict[str, Any] | None]:
+        server = self.server
+        if self.path == HANDSHAKE_PATH:
+            if server.handshake_failure is not None:
+                return server.handshake_failure, None
+            return 200, {
+                "agent_id": server.agent_id,
+                "status": "ok",
+                "capabilities": payload["capabilities"],
+                "policy_hash": server.policy_hash,
+                "features": server.features,
+            }
+        if self.path not in (EXECUTE_PATH, EXECUTE_BATCH_PATH):
+            return 404, None
+        with server.lock:
+            server.executions += 1
+            failed = server.failures_left > 0
+            if failed:
+                server.failures_left -= 1
+        modules = payload["modules"] if self.path == EXECUTE_BATCH_PATH else [payload]
+        for module in modules:
+            if server.before_execute is not None:
+                server.before_execute(module)
+        if failed:
+            return server.failure_status, {"error": "injected failure"}
+        results = [module_result(server.agent_id, module) for module in modules]
+        if self.path == EXECUTE_PATH:
+            return 200, results[0]
+        if server.reverse_batches:
+            results.reverse()
+        return 200, {"results": results}
+
+    def _respond(self, status: int, body: dict[str, Any] | None) -> None:
+        server = self.server
+        data = json.dumps(body).encode("utf-8") if body is not None else b""
+        self.send_response(status)
+        if data:
+            self.send_header("Content-Type", "application/json")
+            if server.gzip_responses and "gzip" in self.headers.get("Accept-Encoding", ""):
+                data = server.corrupt_response or gzip.compress(data)
+                self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(data)))
+        if server.close_after_response:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(data)
+        if server.drop_after_response:
+            # Silently drop the keep-alive connection, as an agent restart or idle reaper would.
+            self.close_connection = True
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return
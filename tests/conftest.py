@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+from _agent_server import FakeAgentServer, serving
+
+
+@pytest.fixture
+def agent_server() -> Iterator[FakeAgentServer]:
+    server = FakeAgentServer()
+    with serving(server):
+        yield server
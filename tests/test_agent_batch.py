@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from _agent_server import EXECUTE_BATCH_PATH, FakeAgentServer
+
+from bas_orchestrator.agent_client import (
+    BATCH_FEATURE,
+    AgentClient,
+    AgentClientConfig,
+    AgentClientError,
+)
+from bas_orchestrator.engine import load_campaign, run_campaign
+
+
+@pytest.fixture
+def agent_server(agent_server: FakeAgentServer) -> FakeAgentServer:
+    agent_server.features = [BATCH_FEATURE]
+    return agent_server
+
+
+def _batch_sizes(server: FakeAgentServer) -> list[int]:
+    return [
+        len(payload["modules"]) for path, payload in server.requests if path == EXECUTE_BATCH_PATH
+    ]
+
+
+def _write_campaign(path: Path, count: int, *, limits: str = "", extra: str = "") -> Path:
+    modules = "".join(
+        f"""
+  - id: "noop-{index}"
+    module: "noop"
+    target_id: "local-host"
+    scope_allowlist: ["local"]
+"""
+        for index in range(count)
+    )
+    path.write_text(
+        f"""
+version: v1
+name: "batch-campaign"
+{limits}
+targets:
+  - id: "local-host"
+    name: "Local Host"
+modules:{modules}{extra}
+"""
+    )
+    return path
+
+
+def test_batches_modules_for_batch_capable_agent(
+    agent_server: FakeAgentServer, tmp_path: Path
+) -> None:
+    spec = load_campaign(_write_campaign(tmp_path / "campaign.yaml", 5))
+
+    evidence = run_campaign(
+        spec, deterministic=True, agent_config=agent_server.config(), agent_batch_size=2
+    )
+
+    assert [result.module_id for result in evidence.results] == [f"noop-{i}" for i in range(5)]
+    assert evidence.summary["passed"] == 5
+    assert _batch_sizes(agent_server) == [2, 2]
+    assert agent_server.execution_paths()[-1] == "/v1/agent/modules/execute"
+
+
+def test_falls_back_to_single_execution(agent_server: FakeAgentServer, tmp_path: Path) -> None:
+    agent_server.features = []
+    spec = load_campaign(_write_campaign(tmp_path / "campaign.yaml", 3))
+
+    evidence = run_campaign(spec, deterministic=True, agent_config=agent_server.config())
+
+    assert evidence.summary["passed"] == 3
+    assert agent_server.execution_paths() == ["/v1/agent/modules/execute"] * 3
+
+
+def test_batches_respect_agent_limits(agent_server: FakeAgentServer, tmp_path: Path) -> None:
+    limits = "limits:\n  max_per_agent: 2"
+    spec = load_campaign(_write_campaign(tmp_path / "campaign.yaml", 5, limits=limits))
+
+    evidence = run_campaign(spec, deterministic=True, agent_config=agent_server.config())
+
+    assert evidence.summary["passed"] == 5
+    assert _batch_sizes(agent_server) == [2, 2]
+    assert agent_server.execution_paths()[-1] == "/v1/agent/modules/execute"
+
+
+def test_batches_are_split_across_workers(agent_server: FakeAgentServer, tmp_path: Path) -> None:
+    spec = load_campaign(_write_campaign(tmp_path / "campaign.yaml", 8))
+
+    evidence = run_campaign(
+        spec, deterministic=True, agent_config=agent_server.config(), max_workers=4
+    )
+
+    assert evidence.summary["passed"] == 8
+    assert sorted(_batch_sizes(agent_server)) == [2, 2, 2, 2]
+
+
+def test_modules_with_own_timeout_run_alone(agent_server: FakeAgentServer, tmp_path: Path) -> None:
+    extra = """
+  - id: "timed"
+    module: "noop"
+    target_id: "local-host"
+    scope_allowlist: ["local"]
+    timeout_seconds: 5
+"""
+    spec = load_campaign(_write_campaign(tmp_path / "campaign.yaml", 2, extra=extra))
+
+    evidence = run_campaign(spec, deterministic=True, agent_config=agent_server.config())
+
+    assert [result.module_id for result in evidence.results] == ["noop-0", "noop-1", "timed"]
+    assert sorted(agent_server.execution_paths()) == [
+        "/v1/agent/modules/execute",
+        "/v1/agent/modules/execute-batch",
+    ]
+
+
+def test_mismatched_batch_results_error_every_module(
+    agent_server: FakeAgentServer, tmp_path: Path
+) -> None:
+    agent_server.reverse_batches = True
+    spec = load_campaign(_write_campaign(tmp_path / "campaign.yaml", 2))
+
+    evidence = run_campaign(spec, deterministic=True, agent_config=agent_server.config())
+
+    assert evidence.summary["errored"] == 2
+    assert all(result.evidence["error"] == "agent failure" for result in evidence.results)
+
+
+def test_execute_batch_requires_advertised_feature() -> None:
+    client = AgentClient(
+        AgentClientConfig(base_url="mock://agent", enabled=True, mock_capabilities=["noop"])
+    )
+    client.handshake(
+        agent_id="agent-1", capabilities=["noop"], version="v1", expected_policy_hash=None
+    )
+
+    with pytest.raises(AgentClientError, match="batch"):
+        client.execute_batch([{"module_id": "noop-1", "module": "noop"}])
+
+
+def test_mock_agent_executes_batches() -> None:
+    client = AgentClient(
+        AgentClientConfig(
+            base_url="mock://agent",
+            enabled=True,
+            mock_capabilities=["noop"],
+            mock_features=["execute-batch"],
+        )
+    )
+    client.handshake(
+        agent_id="agent-1", capabilities=["noop"], version="v1", expected_policy_hash=None
+    )
+
+    results = client.execute_batch(
+        [{"module_id": "noop-1", "module": "noop"}, {"module_id": "noop-2", "module": "noop"}]
+    )
+
+    assert [result.module_id for result in results] == ["noop-1", "noop-2"]
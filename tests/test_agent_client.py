@@ -3,6 +3,8 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+import pytest
+
 from bas_orchestrator.agent_client import AgentClient, AgentClientConfig, AgentClientError
 
 
@@ -135,3 +137,29 @@ def test_ca_bundle_error_message(tmp_path: Path) -> None:
         assert "CA bundle" in str(exc)
     else:
         raise AssertionError("expected AgentClientError")
+
+
+def test_results_decode_from_response_bytes() -> None:
+    client = AgentClient(AgentClientConfig(base_url="https://example", enabled=True))
+    body = json.dumps(
+        {
+            "module_id": "noop-1",
+            "status": "pass",
+            "started_at": "1970-01-01T00:00:00+00:00",
+            "finished_at": "1970-01-01T00:00:00+00:00",
+            "evidence": {"message": "ok"},
+        }
+    ).encode("utf-8")
+
+    result = client._decode_result(200, body, None)
+    batch = client._decode_batch(
+        200, b'{"results":[' + body + b"]}", None, [{"module_id": "noop-1"}]
+    )
+
+    assert result.status == "pass"
+    assert batch == [result]
+    for invalid in (b"not json", b'{"module_id": "noop-1"}'):
+        with pytest.raises(AgentClientError, match="invalid result"):
+            client._decode_result(200, invalid, None)
+    with pytest.raises(AgentClientError, match="invalid batch payload"):
+        client._decode_batch(200, b'{"results": {}}', None, [{"module_id": "noop-1"}])
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+from _agent_server import FakeAgentServer
+
+from bas_orchestrator.agent_client import (
+    GZIP_FEATURE,
+    AgentClient,
+    AgentClientConfig,
+    AgentClientError,
+    AsyncAgentClient,
+)
+
+
+@pytest.fixture
+def agent_server(agent_server: FakeAgentServer) -> FakeAgentServer:
+    agent_server.features = [GZIP_FEATURE]
+    agent_server.gzip_responses = True
+    return agent_server
+
+
+def _config(server: FakeAgentServer) -> AgentClientConfig:
+    return server.config(compress_min_bytes=256)
+
+
+def _payload(module_id: str, size: int) -> dict[str, Any]:
+    return {"module_id": module_id, "module": "noop", "params": {"blob": "x" * size}}
+
+
+def test_large_requests_are_gzipped_for_capable_agents(agent_server: FakeAgentServer) -> None:
+    client = AgentClient(_config(agent_server))
+    try:
+        client.handshake(
+            agent_id="agent-1", capabilities=["noop"], version="v1", expected_policy_hash=None
+        )
+        small = client.execute_module(_payload("small", 10))
+        large = client.execute_module(_payload("large", 4096))
+    finally:
+        client.close()
+
+    assert agent_server.request_encodings == [None, None, "gzip"]
+    assert small.evidence["params"] == {"blob": "x" * 10}
+    assert large.evidence["params"] == {"blob": "x" * 4096}
+
+
+def test_requests_stay_plain_without_gzip_feature(agent_server: FakeAgentServer) -> None:
+    agent_server.features = []
+    client = AgentClient(_config(agent_server))
+    try:
+        client.handshake(
+            agent_id="agent-1", capabilities=["noop"], version="v1", expected_policy_hash=None
+        )
+        result = client.execute_module(_payload("large", 4096))
+    finally:
+        client.close()
+
+    assert agent_server.request_encodings == [None, None]
+    assert result.status == "pass"
+
+
+def test_invalid_gzip_response_is_rejected(agent_server: FakeAgentServer) -> None:
+    agent_server.corrupt_response = b"not gzip"
+    client = AgentClient(_config(agent_server))
+    try:
+        with pytest.raises(AgentClientError, match="invalid gzip"):
+            client.handshake(
+                agent_id="agent-1", capabilities=["noop"], version="v1", expected_policy_hash=None
+            )
+    finally:
+        client.close()
+
+
+def test_async_client_compresses_both_ways(agent_server: FakeAgentServer) -> None:
+    async def scenario() -> str:
+        async with AsyncAgentClient(_config(agent_server)) as client:
+            await client.handshake(
+                agent_id="agent-1", capabilities=["noop"], version="v1", expected_policy_hash=None
+            )
+            result = await client.execute_module(_payload("large", 4096))
+            return result.status
+
+    assert asyncio.run(scenario()) == "pass"
+    assert agent_server.request_encodings == [None, "gzip"]
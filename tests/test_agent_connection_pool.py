@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import ssl
+from typing import Any
+
+import pytest
+from _agent_server import FakeAgentServer
+
+from bas_orchestrator.agent_client import AgentClient, AgentClientConfig, AgentClientError
+
+
+def _client(server: FakeAgentServer, **overrides: Any) -> AgentClient:
+    client = AgentClient(server.config(**overrides))
+    client.handshake(
+        agent_id="agent-1", capabilities=["noop"], version="v1", expected_policy_hash=None
+    )
+    return client
+
+
+def _execute(client: AgentClient, module_id: str) -> str:
+    result = client.execute_module({"module_id": module_id, "module": "noop"})
+    return result.status
+
+
+def test_requests_reuse_one_keep_alive_connection(agent_server: FakeAgentServer) -> None:
+    client = _client(agent_server)
+    try:
+        assert [_execute(client, f"m{index}") for index in range(5)] == ["pass"] * 5
+    finally:
+        client.close()
+
+    assert len(agent_server.peers) == 6
+    assert len(set(agent_server.peers)) == 1
+
+
+def test_connection_closed_by_agent_is_replaced(agent_server: FakeAgentServer) -> None:
+    agent_server.close_after_response = True
+    client = _client(agent_server)
+    try:
+        assert [_execute(client, f"m{index}") for index in range(3)] == ["pass"] * 3
+    finally:
+        client.close()
+
+    assert len(set(agent_server.peers)) == 4
+
+
+def test_stale_pooled_connection_reconnects(agent_server: FakeAgentServer) -> None:
+    agent_server.drop_after_response = True
+    client = _client(agent_server)
+    try:
+        assert [_execute(client, f"m{index}") for index in range(3)] == ["pass"] * 3
+    finally:
+        client.close()
+
+    assert len(set(agent_server.peers)) == 4
+
+
+def test_idle_timeout_discards_pooled_connections(agent_server: FakeAgentServer) -> None:
+    client = _client(agent_server, pool_idle_timeout_seconds=0.0)
+    try:
+        _execute(client, "m1")
+        _execute(client, "m2")
+    finally:
+        client.close()
+
+    assert len(set(agent_server.peers)) == 3
+
+
+def test_http_error_status_raises(agent_server: FakeAgentServer) -> None:
+    client = _client(agent_server)
+    try:
+        with pytest.raises(AgentClientError, match="HTTP 404"):
+            client._post_json("/v1/agent/unknown", {})
+    finally:
+        client.close()
+
+
+def test_ssl_context_is_built_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[int] = []
+    original = ssl.create_default_context
+
+    def counting_context(*args: Any, **kwargs: Any) -> ssl.SSLContext:
+        calls.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(ssl, "create_default_context", counting_context)
+    client = AgentClient(AgentClientConfig(base_url="https://127.0.0.1:9", enabled=True))
+    try:
+        for _ in range(3):
+            with pytest.raises(AgentClientError):
+                client._post_json("/v1/agent/handshake", {}, timeout_seconds=0.5)
+    finally:
+        client.close()
+
+    assert len(calls) == 1
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from _agent_server import FakeAgentServer, serving
+
+from bas_orchestrator.engine import load_campaign, run_campaign
+from bas_orchestrator.scheduler import HedgePolicy, LatencyWindow
+
+
+class _Stall:
+    # The first request for the "slow" module stalls, whichever agent receives it.
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.pending = True
+        self.stalled_on: str | None = None
+
+    def claim(self, agent_id: str) -> bool:
+        with self.lock:
+            if not self.pending:
+                return False
+            self.pending = False
+            self.stalled_on = agent_id
+            return True
+
+    def stall_slow_module(self, server: FakeAgentServer) -> None:
+        def before_execute(payload: dict[str, Any]) -> None:
+            if payload["module_id"] == "slow" and self.claim(server.agent_id):
+                time.sleep(1.0)
+
+        server.before_execute = before_execute
+
+
+@pytest.fixture
+def fleet() -> Iterator[tuple[list[FakeAgentServer], _Stall]]:
+    stall = _Stall()
+    servers = [FakeAgentServer("agent-a"), FakeAgentServer("agent-b")]
+    for server in servers:
+        stall.stall_slow_module(server)
+    with serving(*servers):
+        yield servers, stall
+
+
+def _campaign(tmp_path: Path, module_ids: list[str]) -> Path:
+    modules = "".join(
+        f"""
+  - id: "{module_id}"
+    module: "noop"
+    target_id: "local-host"
+    scope_allowlist: ["local"]
+"""
+        for module_id in module_ids
+    )
+    path = tmp_path / "campaign.yaml"
+    path.write_text(
+        f"""
+version: v1
+name: "hedge-campaign"
+targets:
+  - id: "local-host"
+    name: "Local Host"
+modules:{modules}
+"""
+    )
+    return path
+
+
+def test_slow_request_is_hedged_to_another_agent(
+    fleet: tuple[list[FakeAgentServer], _Stall], tmp_path: Path
+) -> None:
+    servers, stall = fleet
+    spec = load_campaign(_campaign(tmp_path, [f"warm-{index}" for index in range(5)] + ["slow"]))
+
+    started = time.monotonic()
+    evidence = run_campaign(
+        spec,
+        deterministic=True,
+        agent_configs=[server.config() for server in servers],
+        agent_hedge=HedgePolicy(percentile=90, min_samples=3),
+    )
+    elapsed = time.monotonic() - started
+
+    slow = evidence.results[-1]
+    assert evidence.summary["passed"] == 6
+    assert slow.hedged is True
+    assert slow.agent_id is not None and slow.agent_id != stall.stalled_on
+    assert slow.evidence["answered_by"] == slow.agent_id
+    assert elapsed < 0.9
+
+
+def test_no_hedging_without_enough_samples(
+    fleet: tuple[list[FakeAgentServer], _Stall], tmp_path: Path
+) -> None:
+    servers, stall = fleet
+    spec = load_campaign(_campaign(tmp_path, ["slow"]))
+
+    evidence = run_campaign(
+        spec,
+        deterministic=True,
+        agent_configs=[server.config() for server in servers],
+        agent_hedge=HedgePolicy(percentile=90, min_samples=20),
+    )
+
+    assert evidence.results[0].hedged is None
+    assert evidence.results[0].agent_id == stall.stalled_on
+
+
+def test_latency_window_percentile() -> None:
+    window = LatencyWindow(200)
+    assert window.percentile(95) is None
+    for value in range(1, 101):
+        window.add(float(value))
+
+    assert window.percentile(95) == 95.0
+    assert window.percentile(50) == 50.0
+    assert window.percentile(95, min_samples=101) is None
+
+
+def test_latency_window_keeps_recent_samples() -> None:
+    window = LatencyWindow(3)
+    for value in (10.0, 1.0, 2.0, 3.0):
+        window.add(value)
+
+    assert window.percentile(99) == 3.0
+
+
+def test_hedge_policy_validation() -> None:
+    with pytest.raises(ValueError):
+        HedgePolicy(percentile=100)
+    with pytest.raises(ValueError):
+        HedgePolicy(min_samples=10, window=5)
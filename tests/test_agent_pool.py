@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from bas_orchestrator.agent_client import AgentClientConfig, AgentClientError
+from bas_orchestrator.agent_pool import (
+    AgentPool,
+    AgentPoolError,
+    PooledAgent,
+    load_agent_configs,
+)
+from bas_orchestrator.cli import app
+from bas_orchestrator.engine import load_campaign, run_campaign
+
+
+def _mock_agent(agent_id: str, capabilities: list[str]) -> AgentClientConfig:
+    return AgentClientConfig(
+        base_url="mock://agent",
+        enabled=True,
+        agent_id=agent_id,
+        mock_capabilities=capabilities,
+    )
+
+
+def _write_campaign(path: Path) -> Path:
+    path.write_text(
+        """
+version: v1
+name: "fleet-campaign"
+targets:
+  - id: "local-host"
+    name: "Local Host"
+modules:
+  - id: "noop-1"
+    module: "noop"
+    target_id: "local-host"
+    scope_allowlist: ["local"]
+  - id: "echo-1"
+    module: "echo_expectation"
+    target_id: "local-host"
+    scope_allowlist: ["local"]
+"""
+    )
+    return path
+
+
+def test_modules_route_to_capable_agents(tmp_path: Path) -> None:
+    spec = load_campaign(_write_campaign(tmp_path / "campaign.yaml"))
+
+    evidence = run_campaign(
+        spec,
+        deterministic=True,
+        agent_configs=[
+            _mock_agent("noop-agent", ["noop"]),
+            _mock_agent("echo-agent", ["echo_expectation"]),
+        ],
+    )
+
+    assert evidence.summary["passed"] == 2
+    assert [result.agent_id for result in evidence.results] == ["noop-agent", "echo-agent"]
+
+
+def test_module_without_capable_agent_errors(tmp_path: Path) -> None:
+    spec = load_campaign(_write_campaign(tmp_path / "campaign.yaml"))
+
+    evidence = run_campaign(
+        spec,
+        deterministic=True,
+        agent_configs=[_mock_agent("a", ["noop"]), _mock_agent("b", ["noop"])],
+    )
+
+    assert [result.status for result in evidence.results] == ["pass", "error"]
+    assert evidence.results[1].evidence["error"] == "module not supported by agent"
+
+
+def test_failed_handshake_drops_agent_from_pool(tmp_path: Path) -> None:
+    spec = load_campaign(_write_campaign(tmp_path / "campaign.yaml"))
+    insecure = AgentClientConfig(base_url="http://agent.invalid", enabled=True)
+
+    evidence = run_campaign(
+        spec,
+        deterministic=True,
+        agent_configs=[insecure, _mock_agent("fleet", ["noop", "echo_expectation"])],
+    )
+
+    assert evidence.summary["passed"] == 2
+    assert {result.agent_id for result in evidence.results} == {"fleet"}
+
+
+def test_all_handshakes_failing_errors_every_module(tmp_path: Path) -> None:
+    spec = load_campaign(_write_campaign(tmp_path / "campaign.yaml"))
+    insecure = AgentClientConfig(base_url="http://agent.invalid", enabled=True)
+
+    evidence = run_campaign(spec, deterministic=True, agent_configs=[insecure, insecure])
+
+    assert evidence.summary["errored"] == 2
+    assert evidence.results[0].evidence["error"] == "agent handshake failed"
+
+
+def test_single_agent_still_requires_every_capability(tmp_path: Path) -> None:
+    spec = load_campaign(_write_campaign(tmp_path / "campaign.yaml"))
+
+    evidence = run_campaign(spec, deterministic=True, agent_config=_mock_agent("a", ["noop"]))
+
+    assert evidence.summary["errored"] == 2
+    assert "requested capabilities" in evidence.results[0].evidence["message"]
+
+
+def test_route_prefers_least_loaded_agent() -> None:
+    pool = AgentPool.connect(
+        [_mock_agent("a", ["noop"]), _mock_agent("b", ["noop"])],
+        capabilities=["noop"],
+        version="v1",
+    )
+
+    with pool.route(["noop"]) as first, pool.route(["noop"]) as second:
+        assert {first.agent_id, second.agent_id} == {"a", "b"}
+    assert all(agent.in_flight == 0 for agent in pool.agents)
+    assert all(agent.latency_ewma is not None for agent in pool.agents)
+
+
+def test_route_latency_excludes_slot_wait() -> None:
+    pool = AgentPool.connect([_mock_agent("a", ["noop"])], capabilities=["noop"], version="v1")
+    entered: list[str] = []
+
+    @contextmanager
+    def slow_slot(agent: PooledAgent) -> Iterator[None]:
+        threading.Event().wait(0.2)
+        entered.append(agent.agent_id)
+        yield
+
+    with pool.route(["noop"], slot=slow_slot) as agent:
+        assert entered == ["a"]
+    assert agent.latency_ewma is not None and agent.latency_ewma < 0.1
+    assert pool.latencies.percentile(50) == agent.latency_ewma
+
+
+def test_route_prefers_lower_latency_agent() -> None:
+    pool = AgentPool.connect(
+        [_mock_agent("slow", ["noop"]), _mock_agent("fast", ["noop"])],
+        capabilities=["noop"],
+        version="v1",
+    )
+    slow, fast = pool.agents
+    slow.latency_ewma = 1.0
+    fast.latency_ewma = 0.1
+
+    with pool.route(["noop"]) as first, pool.route(["noop"]) as second:
+        assert (first.agent_id, second.agent_id) == ("fast", "fast")
+
+
+def test_route_without_capable_agent_raises() -> None:
+    pool = AgentPool.connect([_mock_agent("a", ["noop"])], capabilities=["noop"], version="v1")
+
+    with pytest.raises(AgentClientError), pool.route(["echo_expectation"]):
+        pass
+
+
+def test_load_agent_configs(tmp_path: Path) -> None:
+    path = tmp_path / "agents.yaml"
+    path.write_text(
+        json.dumps(
+            {
+                "agents": [
+                    {"base_url": "https://a.local", "agent_id": "a"},
+                    {"base_url": "https://b.local", "ca_path": "ca.pem", "timeout_seconds": 3},
+                ]
+            }
+        )
+    )
+
+    configs = load_agent_configs(path)
+
+    assert [config.base_url for config in configs] == ["https://a.local", "https://b.local"]
+    assert all(config.enabled for config in configs)
+    assert configs[1].timeout_seconds == 3
+
+
+def test_load_agent_configs_rejects_unknown_keys(tmp_path: Path) -> None:
+    path = tmp_path / "agents.yaml"
+    path.write_text("agents:\n  - base_url: https://a.local\n    mock_capabilities: [noop]\n")
+
+    with pytest.raises(AgentPoolError, match="unknown keys: mock_capabilities"):
+        load_agent_configs(path)
+
+
+def test_cli_agents_file(tmp_path: Path) -> None:
+    campaign = _write_campaign(tmp_path / "campaign.yaml")
+    agents = tmp_path / "agents.yaml"
+    agents.write_text("agents:\n  - base_url: http://a.invalid\n  - base_url: http://b.invalid\n")
+    out = tmp_path / "evidence.json"
+
+    result = CliRunner().invoke(
+        app, ["run", str(campaign), "--out", str(out), "--agents-file", str(agents)]
+    )
+
+    assert result.exit_code == 0, result.output
+    evidence = json.loads(out.read_text())
+    assert evidence["summary"]["errored"] == 2
+    assert "Insecure agent URL" in evidence["results"][0]["evidence"]["message"]
+
+
+def test_cli_rejects_invalid_agents_file(tmp_path: Path) -> None:
+    campaign = _write_campaign(tmp_path / "campaign.yaml")
+    agents = tmp_path / "agents.yaml"
+    agents.write_text("agents: []\n")
+
+    result = CliRunner().invoke(
+        app,
+        ["run", str(campaign), "--out", str(tmp_path / "e.json"), "--agents-file", str(agents)],
+    )
+
+    assert result.exit_code == 2
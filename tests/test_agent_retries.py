@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from _agent_server import FakeAgentServer, serving
+
+from bas_orchestrator.engine import load_campaign, run_campaign
+from bas_orchestrator.scheduler import CircuitBreaker, CircuitBreakerPolicy, RetryPolicy
+
+
+@pytest.fixture
+def agents() -> Iterator[tuple[FakeAgentServer, FakeAgentServer]]:
+    servers = (FakeAgentServer("agent-a"), FakeAgentServer("agent-b"))
+    with serving(*servers):
+        yield servers
+
+
+def _campaign(tmp_path: Path, count: int) -> Path:
+    modules = "".join(
+        f"""
+  - id: "noop-{index}"
+    module: "noop"
+    target_id: "local-host"
+    scope_allowlist: ["local"]
+"""
+        for index in range(count)
+    )
+    path = tmp_path / "campaign.yaml"
+    path.write_text(
+        f"""
+version: v1
+name: "retry-campaign"
+targets:
+  - id: "local-host"
+    name: "Local Host"
+modules:{modules}
+"""
+    )
+    return path
+
+
+_FAST_RETRY = RetryPolicy(max_attempts=3, base_delay_seconds=0.0)
+
+
+def test_retryable_failure_is_retried(
+    agents: tuple[FakeAgentServer, FakeAgentServer], tmp_path: Path
+) -> None:
+    agent, _ = agents
+    agent.failures_left = 2
+    spec = load_campaign(_campaign(tmp_path, 1))
+
+    evidence = run_campaign(
+        spec, deterministic=True, agent_config=agent.config(), agent_retry=_FAST_RETRY
+    )
+
+    assert evidence.results[0].status == "pass"
+    assert agent.executions == 3
+
+
+def test_without_retries_failure_is_an_error(
+    agents: tuple[FakeAgentServer, FakeAgentServer], tmp_path: Path
+) -> None:
+    agent, _ = agents
+    agent.failures_left = 1
+    spec = load_campaign(_campaign(tmp_path, 1))
+
+    evidence = run_campaign(spec, deterministic=True, agent_config=agent.config())
+
+    assert evidence.results[0].status == "error"
+    assert "HTTP 503" in evidence.results[0].evidence["message"]
+
+
+def test_client_errors_are_not_retried(
+    agents: tuple[FakeAgentServer, FakeAgentServer], tmp_path: Path
+) -> None:
+    agent, _ = agents
+    agent.failures_left = 5
+    agent.failure_status = 400
+    spec = load_campaign(_campaign(tmp_path, 1))
+
+    evidence = run_campaign(
+        spec, deterministic=True, agent_config=agent.config(), agent_retry=_FAST_RETRY
+    )
+
+    assert evidence.results[0].status == "error"
+    assert agent.executions == 1
+
+
+def test_open_circuit_fast_fails_remaining_modules(
+    agents: tuple[FakeAgentServer, FakeAgentServer], tmp_path: Path
+) -> None:
+    agent, _ = agents
+    agent.failures_left = 100
+    spec = load_campaign(_campaign(tmp_path, 6))
+
+    evidence = run_campaign(
+        spec,
+        deterministic=True,
+        agent_config=agent.config(),
+        agent_breaker=CircuitBreakerPolicy(failure_threshold=2, reset_seconds=60),
+    )
+
+    assert evidence.summary["errored"] == 6
+    assert agent.executions == 2
+    assert "Circuit open" in evidence.results[-1].evidence["message"]
+
+
+def test_failed_agent_is_routed_around(
+    agents: tuple[FakeAgentServer, FakeAgentServer], tmp_path: Path
+) -> None:
+    broken, healthy = agents
+    broken.failures_left = 100
+    spec = load_campaign(_campaign(tmp_path, 5))
+
+    evidence = run_campaign(
+        spec,
+        deterministic=True,
+        agent_configs=[broken.config(), healthy.config()],
+        agent_retry=_FAST_RETRY,
+        agent_breaker=CircuitBreakerPolicy(failure_threshold=1, reset_seconds=60),
+    )
+
+    assert evidence.summary["passed"] == 5
+    assert {result.agent_id for result in evidence.results} == {"agent-b"}
+    assert broken.executions == 1
+
+
+def test_backoff_grows_exponentially_with_cap() -> None:
+    policy = RetryPolicy(max_attempts=5, base_delay_seconds=0.1, max_delay_seconds=0.3)
+
+    delays = [policy.backoff(attempt, rng=lambda: 1.0) for attempt in range(1, 5)]
+
+    assert delays == pytest.approx([0.1, 0.2, 0.3, 0.3])
+    assert policy.backoff(2, rng=lambda: 0.5) == pytest.approx(0.1)
+
+
+def test_circuit_breaker_states() -> None:
+    now = [0.0]
+    breaker = CircuitBreaker(
+        CircuitBreakerPolicy(failure_threshold=2, reset_seconds=10), clock=lambda: now[0]
+    )
+
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.available()
+
+    now[0] = 10.0
+    assert breaker.available()
+    breaker.begin()
+    assert not breaker.available()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    now[0] = 20.0
+    breaker.begin()
+    breaker.record_success()
+    assert breaker.state == "closed"
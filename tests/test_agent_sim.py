@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import http.client
+import json
+import random
+import shutil
+import subprocess
+import threading
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from typer.testing import CliRunner
+
+from bas_orchestrator.agent_client import (
+    BATCH_FEATURE,
+    GZIP_FEATURE,
+    AgentClient,
+    AgentClientConfig,
+    AgentClientError,
+)
+from bas_orchestrator.agent_sim import (
+    AgentSimConfig,
+    AgentSimError,
+    AgentSimServer,
+    LatencyDistribution,
+    parse_latency,
+    server_ssl_context,
+)
+from bas_orchestrator.cli import app
+from bas_orchestrator.engine import load_campaign, run_campaign
+
+
+@pytest.fixture
+def start_sim() -> Iterator[Callable[..., AgentSimServer]]:
+    servers: list[AgentSimServer] = []
+
+    def start(config: AgentSimConfig | None = None, **kwargs: Any) -> AgentSimServer:
+        server = AgentSimServer(config or AgentSimConfig(), **kwargs)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def _client(server: AgentSimServer, **overrides: Any) -> AgentClient:
+    options: dict[str, Any] = {"allow_insecure_http": True}
+    options.update(overrides)
+    client = AgentClient(AgentClientConfig(base_url=server.url, enabled=True, **options))
+    client.handshake(agent_id=None, capabilities=["noop"], version="v1", expected_policy_hash=None)
+    return client
+
+
+def _payload(module_id: str, module: str = "noop", **extra: Any) -> dict[str, Any]:
+    payload: dict[str, Any] = {
+        "run_id": "run-1",
+        "module_id": module_id,
+        "module": module,
+        "target_id": "local-host",
+        "params": {},
+        "expectations": {},
+        "scope": {"allowlist": ["local"], "expires_at": "2030-01-01T00:00:00+00:00"},
+    }
+    payload.update(extra)
+    return payload
+
+
+def test_parse_latency() -> None:
+    assert parse_latency("constant:25") == LatencyDistribution("constant", (25.0,))
+    assert 0.010 <= parse_latency("uniform:10:20").sample(random.Random(1)) <= 0.020
+    for spec in ("gamma:1", "uniform:5", "uniform:9:1", "constant:-1", "exponential:x"):
+        with pytest.raises(AgentSimError):
+            parse_latency(spec)
+
+
+def test_sim_runs_registry_modules(start_sim: Callable[..., AgentSimServer]) -> None:
+    server = start_sim()
+    client = _client(server)
+    try:
+        single = client.execute_module(_payload("noop-1"))
+        batch = client.execute_batch(
+            [
+                _payload(
+                    "echo-1",
+                    "echo_expectation",
+                    params={"value": "ok"},
+                    expectations={"expected_value": "nope"},
+                ),
+                _payload("noop-2", scope={"allowlist": []}),
+            ]
+        )
+    finally:
+        client.close()
+
+    assert single.status == "pass"
+    assert [result.status for result in batch] == ["fail", "error"]
+    assert server.stats.requests == 3
+    assert server.stats.modules == 3
+
+
+def test_sim_injects_errors_and_rejects_over_limit(
+    start_sim: Callable[..., AgentSimServer],
+) -> None:
+    failing = start_sim(AgentSimConfig(error_rate=1.0))
+    with pytest.raises(AgentClientError) as excinfo:
+        _client(failing)
+    assert excinfo.value.retryable
+    assert failing.stats.injected_errors == 1
+
+    busy = start_sim(AgentSimConfig(max_concurrency=1, latency=parse_latency("constant:300")))
+    client = _client(busy)
+    outcomes: list[str] = []
+
+    def execute(module_id: str) -> None:
+        try:
+            outcomes.append(client.execute_module(_payload(module_id)).status)
+        except AgentClientError as exc:
+            outcomes.append(str(exc))
+
+    threads = [threading.Thread(target=execute, args=(f"m{index}",)) for index in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    client.close()
+
+    assert sorted(outcomes) == ["Agent request failed: HTTP 429"] * 2 + ["pass"]
+    assert busy.stats.peak_in_flight == 1
+
+
+@pytest.mark.parametrize("features", [[BATCH_FEATURE, GZIP_FEATURE], [BATCH_FEATURE]])
+def test_sim_compresses_only_with_gzip_feature(
+    start_sim: Callable[..., AgentSimServer], features: list[str]
+) -> None:
+    server = start_sim(AgentSimConfig(features=features, compress_min_bytes=0))
+    host, port = server.server_address[:2]
+    connection = http.client.HTTPConnection(str(host), port, timeout=5)
+    try:
+        connection.request(
+            "POST",
+            "/v1/agent/modules/execute",
+            body=json.dumps(_payload("noop-1")),
+            headers={"Content-Type": "application/json", "Accept-Encoding": "gzip"},
+        )
+        response = connection.getresponse()
+        response.read()
+    finally:
+        connection.close()
+
+    assert response.status == 200
+    expected = "gzip" if GZIP_FEATURE in features else None
+    assert response.getheader("Content-Encoding") == expected
+
+
+def test_campaign_runs_against_sim(
+    start_sim: Callable[..., AgentSimServer], tmp_path: Path
+) -> None:
+    server = start_sim(AgentSimConfig(policy_hash="abc"))
+    campaign = tmp_path / "campaign.yaml"
+    assert CliRunner().invoke(app, ["init", str(campaign)]).exit_code == 0
+
+    evidence = run_campaign(
+        load_campaign(campaign),
+        deterministic=True,
+        agent_configs=[
+            AgentClientConfig(
+                base_url=server.url,
+                enabled=True,
+                allow_insecure_http=True,
+                expected_policy_hash="abc",
+            )
+        ],
+    )
+
+    assert evidence.summary["passed"] == 2
+    assert {result.agent_id for result in evidence.results} == {"agent-sim"}
+
+
+def _openssl(directory: Path, command: str) -> None:
+    subprocess.run(["openssl", *command.split()], cwd=directory, check=True, capture_output=True)
+
+
+@pytest.mark.skipif(shutil.which("openssl") is None, reason="openssl not available")
+def test_sim_requires_client_certificate(
+    start_sim: Callable[..., AgentSimServer], tmp_path: Path
+) -> None:
+    _openssl(
+        tmp_path,
+        "req -x509 -newkey rsa:2048 -nodes -days 1 -subj /CN=ca -keyout ca.key -out ca.crt",
+    )
+    for name, extensions in (
+        ("server", "subjectAltName=IP:127.0.0.1"),
+        ("client", "extendedKeyUsage=clientAuth"),
+    ):
+        (tmp_path / f"{name}.ext").write_text(extensions + "\n")
+        _openssl(
+            tmp_path,
+            f"req -newkey rsa:2048 -nodes -subj /CN={name} -keyout {name}.key -out {name}.csr",
+        )
+        _openssl(
+            tmp_path,
+            f"x509 -req -in {name}.csr -days 1 -CA ca.crt -CAkey ca.key -CAcreateserial "
+            f"-extfile {name}.ext -out {name}.crt",
+        )
+
+    context = server_ssl_context(
+        str(tmp_path / "server.crt"), str(tmp_path / "server.key"), str(tmp_path / "ca.crt")
+    )
+    server = start_sim(ssl_context=context)
+    assert server.url.startswith("https://")
+
+    client = _client(
+        server,
+        ca_path=str(tmp_path / "ca.crt"),
+        cert_path=str(tmp_path / "client.crt"),
+        key_path=str(tmp_path / "client.key"),
+    )
+    try:
+        assert client.execute_module(_payload("noop-1")).status == "pass"
+    finally:
+        client.close()
+
+    anonymous = AgentClient(
+        AgentClientConfig(base_url=server.url, enabled=True, ca_path=str(tmp_path / "ca.crt"))
+    )
+    with pytest.raises(AgentClientError):
+        anonymous.handshake(
+            agent_id=None, capabilities=["noop"], version="v1", expected_policy_hash=None
+        )
+    anonymous.close()
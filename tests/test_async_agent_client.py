@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+from _agent_server import FakeAgentServer
+
+from bas_orchestrator import agent_client
+from bas_orchestrator.agent_client import AgentClientConfig, AgentClientError, AsyncAgentClient
+
+
+async def _handshake(client: AsyncAgentClient, expected_policy_hash: str | None = None) -> None:
+    await client.handshake(
+        agent_id="agent-1",
+        capabilities=["noop"],
+        version="v1",
+        expected_policy_hash=expected_policy_hash,
+    )
+
+
+def test_sequential_requests_share_a_connection(agent_server: FakeAgentServer) -> None:
+    async def scenario() -> list[str]:
+        async with AsyncAgentClient(agent_server.config()) as client:
+            await _handshake(client, "abc")
+            return [
+                (await client.execute_module({"module_id": f"m{i}", "module": "noop"})).status
+                for i in range(3)
+            ]
+
+    assert asyncio.run(scenario()) == ["pass"] * 3
+    assert len(set(agent_server.peers)) == 1
+
+
+def test_concurrent_requests_from_one_thread(agent_server: FakeAgentServer) -> None:
+    agent_server.delay = 0.05
+
+    async def scenario() -> list[str]:
+        async with AsyncAgentClient(agent_server.config()) as client:
+            await _handshake(client)
+            results = await asyncio.gather(
+                *(
+                    client.execute_module({"module_id": f"m{i}", "module": "noop"})
+                    for i in range(50)
+                )
+            )
+            return [result.module_id for result in results]
+
+    assert asyncio.run(scenario()) == [f"m{i}" for i in range(50)]
+    assert agent_server.peak > 1
+
+
+def test_max_in_flight_caps_concurrency(agent_server: FakeAgentServer) -> None:
+    agent_server.delay = 0.02
+
+    async def scenario() -> None:
+        async with AsyncAgentClient(agent_server.config(), max_in_flight=2) as client:
+            await _handshake(client)
+            await asyncio.gather(
+                *(client.execute_module({"module_id": f"m{i}", "module": "noop"}) for i in range(6))
+            )
+
+    asyncio.run(scenario())
+    assert agent_server.peak <= 2
+
+
+def test_policy_hash_mismatch_rejected(agent_server: FakeAgentServer) -> None:
+    async def scenario() -> None:
+        async with AsyncAgentClient(agent_server.config()) as client:
+            await _handshake(client, "other")
+
+    with pytest.raises(AgentClientError, match="policy hash mismatch"):
+        asyncio.run(scenario())
+
+
+def test_request_timeout_raises(agent_server: FakeAgentServer) -> None:
+    async def scenario() -> None:
+        async with AsyncAgentClient(agent_server.config()) as client:
+            await _handshake(client)
+            agent_server.delay = 0.5
+            await client.execute_module({"module_id": "m1", "module": "noop"}, timeout_seconds=0.05)
+
+    with pytest.raises(AgentClientError, match="timed out"):
+        asyncio.run(scenario())
+
+
+def test_cancelled_request_closes_its_connection(
+    agent_server: FakeAgentServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    opened: list[Any] = []
+    connect = agent_client._AsyncConnectionPool.connect
+
+    async def recording_connect(self: Any) -> Any:
+        connection = await connect(self)
+        opened.append(connection)
+        return connection
+
+    monkeypatch.setattr(agent_client._AsyncConnectionPool, "connect", recording_connect)
+
+    async def scenario() -> None:
+        async with AsyncAgentClient(agent_server.config()) as client:
+            await _handshake(client)
+            agent_server.delay = 0.5
+            request = asyncio.create_task(
+                client.execute_module({"module_id": "m1", "module": "noop"})
+            )
+            await asyncio.sleep(0.1)
+            request.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await request
+            assert opened[0].writer.is_closing()
+            assert client._pool is not None and client._pool._idle == []
+
+    asyncio.run(scenario())
+
+
+def test_mock_agent_handshake_and_execute() -> None:
+    async def scenario() -> str:
+        client = AsyncAgentClient(
+            AgentClientConfig(
+                base_url="mock://agent",
+                enabled=True,
+                mock_capabilities=["noop"],
+                mock_policy_hash="abc",
+            )
+        )
+        await _handshake(client, "abc")
+        result = await client.execute_module({"module_id": "noop-1", "module": "noop"})
+        await client.aclose()
+        return result.status
+
+    assert asyncio.run(scenario()) == "pass"
+
+
+def test_insecure_http_rejected_by_default() -> None:
+    async def scenario() -> None:
+        await _handshake(AsyncAgentClient(AgentClientConfig(base_url="http://agent", enabled=True)))
+
+    with pytest.raises(AgentClientError, match="Insecure"):
+        asyncio.run(scenario())
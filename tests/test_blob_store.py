@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from bas_orchestrator.blob_store import BlobStore, BlobStoreError, blob_refs
+from bas_orchestrator.cli import app
+from bas_orchestrator.models import EvidencePack, ModuleResult
+
+LARGE = "x" * 5000
+
+
+def _campaign(tmp_path: Path) -> Path:
+    modules = "\n".join(
+        f"""  - id: "echo-{index}"
+    module: "echo_expectation"
+    target_id: "local-host"
+    scope_allowlist: ["local"]
+    expectations:
+      expected_value: "small"
+    params:
+      value: "{LARGE}\""""
+        for index in range(3)
+    )
+    path = tmp_path / "campaign.yaml"
+    path.write_text(
+        f"""
+version: v1
+name: "blob-campaign"
+targets:
+  - id: "local-host"
+    name: "Local Host"
+modules:
+{modules}
+"""
+    )
+    return path
+
+
+def _result(evidence: dict[str, object]) -> ModuleResult:
+    now = datetime(2026, 1, 1, tzinfo=UTC)
+    return ModuleResult(
+        module_id="m", status="pass", started_at=now, finished_at=now, evidence=evidence
+    )
+
+
+def test_large_values_are_stored_once_and_resolved(tmp_path: Path) -> None:
+    store = BlobStore(tmp_path / "blobs", min_bytes=100)
+    original = _result({"small": "ok", "large": {"lines": [LARGE]}})
+
+    first = store.externalize(original)
+    second = store.externalize(original)
+
+    assert first.evidence["small"] == "ok"
+    assert first.evidence["large"]["size"] > 5000
+    assert first == second
+    assert len(list((tmp_path / "blobs").glob("*/*"))) == 1
+    assert store.resolve(first) == original
+    assert store.externalize(_result({"small": "ok"})) == _result({"small": "ok"})
+
+
+def test_check_detects_missing_and_modified_blobs(tmp_path: Path) -> None:
+    store = BlobStore(tmp_path / "blobs", min_bytes=100)
+    result = store.externalize(_result({"large": LARGE}))
+    assert store.check([result]) == 1
+
+    [(_, digest)] = list(blob_refs(result))
+    blob = tmp_path / "blobs" / digest[:2] / digest
+    blob.write_bytes(b'"tampered"')
+    with pytest.raises(BlobStoreError) as exc:
+        store.check([result])
+    assert exc.value.reason == "invalid_blob"
+
+    blob.unlink()
+    with pytest.raises(BlobStoreError) as exc:
+        store.check([result])
+    assert exc.value.reason == "missing_blob"
+
+
+@pytest.mark.parametrize("output_format", ["json", "ndjson"])
+def test_run_externalizes_and_verify_checks_blobs(tmp_path: Path, output_format: str) -> None:
+    campaign = _campaign(tmp_path)
+    out = tmp_path / f"evidence.{output_format}"
+    blobs = tmp_path / "blobs"
+    runner = CliRunner()
+    result = runner.invoke(
+        app,
+        [
+            "run",
+            str(campaign),
+            "--out",
+            str(out),
+            "--deterministic",
+            "--sign-key",
+            "test-key",
+            "--format",
+            output_format,
+            "--blob-dir",
+            str(blobs),
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    assert LARGE not in out.read_text()
+    assert len(list(blobs.glob("*/*"))) == 1
+
+    verify = runner.invoke(
+        app, ["verify", str(out), "--sign-key", "test-key", "--blob-dir", str(blobs), "--json"]
+    )
+    assert json.loads(verify.stdout) == {"ok": True, "blobs": 1}
+
+    shown = runner.invoke(
+        app, ["report", str(out), "--module-id", "echo-1", "--blob-dir", str(blobs), "--json"]
+    )
+    assert json.loads(shown.stdout)["evidence"]["observed"] == LARGE
+
+    for blob in blobs.glob("*/*"):
+        blob.write_text('"tampered"')
+    tampered = runner.invoke(
+        app, ["verify", str(out), "--sign-key", "test-key", "--blob-dir", str(blobs), "--json"]
+    )
+    assert tampered.exit_code == 1
+    assert json.loads(tampered.stdout) == {"ok": False, "reason": "invalid_blob"}
+
+
+def test_report_summary_does_not_read_blobs(tmp_path: Path) -> None:
+    store = BlobStore(tmp_path / "blobs", min_bytes=100)
+    now = datetime(2026, 1, 1, tzinfo=UTC)
+    pack = EvidencePack(
+        campaign_name="c",
+        run_id="r",
+        started_at=now,
+        finished_at=now,
+        results=[store.externalize(_result({"large": LARGE}))],
+        score=1.0,
+        summary={},
+    )
+    path = tmp_path / "evidence.json"
+    path.write_text(pack.model_dump_json())
+    for blob in (tmp_path / "blobs").glob("*/*"):
+        blob.unlink()
+
+    report = CliRunner().invoke(app, ["report", str(path), "--json"])
+    assert report.exit_code == 0
+    missing = CliRunner().invoke(
+        app,
+        ["report", str(path), "--module-id", "m", "--blob-dir", str(tmp_path / "blobs"), "--json"],
+    )
+    assert missing.exit_code == 2
+    assert json.loads(missing.stdout) == {"ok": False, "reason": "missing_blob"}
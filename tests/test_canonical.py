@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from bas_orchestrator.canonical import (
+    CanonicalEvidence,
+    canonical_array,
+    canonical_json,
+    canonical_object,
+)
+from bas_orchestrator.cli import app
+from bas_orchestrator.engine import load_campaign, run_campaign, sign_evidence, verify_evidence
+
+
+def _campaign(tmp_path: Path) -> Path:
+    path = tmp_path / "campaign.yaml"
+    assert CliRunner().invoke(app, ["init", str(path)]).exit_code == 0
+    return path
+
+
+def test_chunked_object_matches_canonical_json() -> None:
+    value = {"b": [1, {"z": "é", "a": None}], "a": "x", "results": [{"k": 1}, {"k": 2}]}
+    fields = {key: canonical_json(item) for key, item in value.items() if key != "results"}
+    chunks = canonical_object({**fields, "results": canonical_array(value["results"])})
+
+    assert b"".join(chunks) == canonical_json(value)
+
+
+def test_signature_is_hmac_of_canonical_pack(tmp_path: Path) -> None:
+    evidence = run_campaign(load_campaign(_campaign(tmp_path)), deterministic=True)
+    message = json.dumps(
+        evidence.model_dump(mode="json", exclude={"signature", "signature_alg"}),
+        sort_keys=True,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    expected = hmac.new(b"test-key", message, hashlib.sha256).hexdigest()
+
+    signed = sign_evidence(evidence, "test-key")
+
+    assert signed.signature == expected
+    assert verify_evidence(signed, "test-key")
+    assert not verify_evidence(signed, "other-key")
+
+
+def test_compact_file_is_canonical_pack(tmp_path: Path) -> None:
+    evidence = run_campaign(load_campaign(_campaign(tmp_path)), deterministic=True)
+    document = CanonicalEvidence(evidence)
+    signed = document.sign("test-key")
+
+    compact = tmp_path / "compact.json"
+    pretty = tmp_path / "pretty.json"
+    document.write(compact, compact=True)
+    document.write(pretty)
+
+    assert compact.read_bytes() == canonical_json(signed.model_dump(mode="json"))
+    assert pretty.read_text() == json.dumps(
+        signed.model_dump(mode="json"), indent=2, sort_keys=True
+    )
+
+
+def test_run_compact_output_verifies(tmp_path: Path) -> None:
+    out = tmp_path / "evidence.json"
+    runner = CliRunner()
+    result = runner.invoke(
+        app,
+        [
+            "run",
+            str(_campaign(tmp_path)),
+            "--out",
+            str(out),
+            "--deterministic",
+            "--sign-key",
+            "test-key",
+            "--compact",
+        ],
+    )
+    assert result.exit_code == 0
+    assert b"\n" not in out.read_bytes()
+
+    verify = runner.invoke(app, ["verify", str(out), "--sign-key", "test-key", "--json"])
+    assert json.loads(verify.stdout) == {"ok": True}
+
+    rejected = runner.invoke(
+        app, ["run", str(tmp_path / "campaign.yaml"), "--format", "ndjson", "--compact"]
+    )
+    assert rejected.exit_code != 0
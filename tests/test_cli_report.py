@@ -74,3 +74,34 @@ def test_report_command_json_and_exit_code(tmp_path: Path) -> None:
     assert payload["summary"]["failed"] == 1
     assert payload["results"][0]["duration_ms"] >= 0
     assert payload["results"][0]["evidence_ref"].startswith("$.results[")
+
+
+def test_report_skips_evidence_but_checks_report_fields(tmp_path: Path) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path)
+    document = run_campaign(load_campaign(campaign_path), deterministic=True).model_dump(
+        mode="json"
+    )
+    expected = CliRunner().invoke(app, ["report", "--json", str(_write(tmp_path, document))])
+
+    # Evidence bodies are not validated by the summary path, only the fields it prints.
+    document["results"][0]["evidence"] = ["not", "an", "object"]
+    lenient = CliRunner().invoke(app, ["report", "--json", str(_write(tmp_path, document))])
+    assert lenient.exit_code == 0
+    assert json.loads(lenient.stdout) == json.loads(expected.stdout)
+
+    document["results"][1]["status"] = "unknown"
+    invalid = CliRunner().invoke(app, ["report", "--json", str(_write(tmp_path, document))])
+    assert invalid.exit_code == 2
+    assert json.loads(invalid.stdout) == {"ok": False, "reason": "invalid_schema"}
+
+    broken = tmp_path / "broken.json"
+    broken.write_text('{"results": [')
+    truncated = CliRunner().invoke(app, ["report", "--json", str(broken)])
+    assert json.loads(truncated.stdout) == {"ok": False, "reason": "invalid_json"}
+
+
+def _write(tmp_path: Path, document: dict[str, object]) -> Path:
+    path = tmp_path / "evidence.json"
+    path.write_text(json.dumps(document))
+    return path
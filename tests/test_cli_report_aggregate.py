@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from bas_orchestrator.aggregate import aggregate_runs, digest_runs, is_aggregate_source
+from bas_orchestrator.cli import app
+from bas_orchestrator.models import EvidencePack, ModuleResult, ResultStatus
+
+DAY = datetime(2026, 3, 1, tzinfo=UTC)
+NIGHTLY: list[dict[str, ResultStatus]] = [
+    {"steady": "pass", "flaky": "pass", "broken": "pass"},
+    {"steady": "pass", "flaky": "fail", "broken": "pass"},
+    {"steady": "pass", "flaky": "pass", "broken": "pass"},
+    {"steady": "pass", "flaky": "fail", "broken": "error"},
+]
+
+
+def _write_runs(directory: Path) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    for day, statuses in enumerate(NIGHTLY):
+        started = DAY + timedelta(days=day)
+        results = [
+            ModuleResult(
+                module_id=module_id,
+                status=status,
+                started_at=started,
+                finished_at=started + timedelta(milliseconds=100 * (day + 1)),
+            )
+            for module_id, status in statuses.items()
+        ]
+        pack = EvidencePack(
+            campaign_name="nightly",
+            run_id=f"run-{day}",
+            started_at=started,
+            finished_at=started + timedelta(seconds=1),
+            results=results,
+            score=0.0,
+            summary={},
+        )
+        # Written in reverse so ordering must come from started_at, not file names.
+        (directory / f"{9 - day}.json").write_text(pack.model_dump_json())
+
+
+def test_aggregate_statistics(tmp_path: Path) -> None:
+    _write_runs(tmp_path)
+    payload = aggregate_runs(digest_runs(sorted(tmp_path.glob("*.json")), workers=1))
+
+    modules = {row["module_id"]: row for row in payload["modules"]}
+    assert payload["runs"] == 4
+    assert modules["steady"]["pass_rate"] == 1.0
+    assert modules["steady"]["flakiness"] == 0.0
+    assert modules["flaky"]["pass_rate"] == 0.5
+    assert modules["flaky"]["flakiness"] == 1.0
+    assert (modules["broken"]["p50_ms"], modules["broken"]["p95_ms"]) == (200, 400)
+    assert [row["module_id"] for row in payload["regressions"]] == ["broken", "flaky"]
+    assert payload["regressions"][0]["passing_streak"] == 3
+    assert payload["ok"] is False
+
+
+def test_report_accepts_directory_and_glob(tmp_path: Path) -> None:
+    runs = tmp_path / "runs"
+    _write_runs(runs)
+    (runs / "broken.json").write_text("{")
+    runner = CliRunner()
+
+    parallel = runner.invoke(app, ["report", str(runs), "--json", "--workers", "2"])
+    assert parallel.exit_code == 0, parallel.output
+    payload = json.loads(parallel.stdout)
+    assert payload["runs"] == 4
+    assert payload["errors"] == [{"path": str(runs / "broken.json"), "reason": "invalid_json"}]
+
+    serial = runner.invoke(app, ["report", str(runs / "[0-9].json"), "--json", "--workers", "1"])
+    assert json.loads(serial.stdout) == {**payload, "errors": [], "ok": False}
+
+    text = runner.invoke(app, ["report", str(runs / "*.json"), "--exit-nonzero"])
+    assert text.exit_code == 1
+    assert "Regressions" in text.stdout
+    assert "broken" in text.stdout
+
+    empty = runner.invoke(app, ["report", str(tmp_path / "none-*.json")])
+    assert empty.exit_code != 0
+
+
+def test_existing_path_with_glob_characters_is_literal(tmp_path: Path) -> None:
+    _write_runs(tmp_path / "runs")
+    bracketed = tmp_path / "run[1].json"
+    (tmp_path / "runs" / "9.json").rename(bracketed)
+    (tmp_path / "run1.json").write_text("{")
+
+    assert not is_aggregate_source(str(bracketed))
+    assert is_aggregate_source(str(tmp_path / "run[0-9].json"))
+    result = CliRunner().invoke(app, ["report", str(bracketed), "--json"])
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.stdout)["run_id"] == "run-0"
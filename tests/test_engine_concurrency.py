@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from bas_orchestrator.cli import app
+from bas_orchestrator.engine import load_campaign, run_campaign
+from bas_orchestrator.models import ModuleResult
+from bas_orchestrator.modules.base import ModuleContext
+from bas_orchestrator.modules.registry import NoopModule
+
+
+def write_campaign(path: Path, count: int) -> None:
+    modules = "".join(
+        f"""
+  - id: "{kind}-{index}"
+    module: "{"noop" if kind == "noop" else "echo_expectation"}"
+    target_id: "local-host"
+    scope_allowlist: ["local"]
+    expectations:
+      expected_value: "ok"
+    params:
+      value: "{"ok" if index % 3 else "nope"}"
+"""
+        for index in range(count)
+        for kind in ("noop", "echo")
+    )
+    path.write_text(
+        f"""
+version: v1
+name: "concurrent-campaign"
+targets:
+  - id: "local-host"
+    name: "Local Host"
+modules:{modules}"""
+    )
+
+
+def test_concurrent_run_preserves_campaign_order(tmp_path: Path) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path, 10)
+    spec = load_campaign(campaign_path)
+
+    evidence = run_campaign(spec, max_workers=4)
+
+    assert [result.module_id for result in evidence.results] == [
+        module.id for module in spec.modules
+    ]
+
+
+def test_concurrent_deterministic_matches_serial(tmp_path: Path) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path, 10)
+    spec = load_campaign(campaign_path)
+
+    serial = run_campaign(spec, deterministic=True)
+    parallel = run_campaign(spec, deterministic=True, max_workers=8)
+
+    assert parallel.model_dump_json() == serial.model_dump_json()
+
+
+def test_concurrent_run_overlaps_modules(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path, 4)
+    spec = load_campaign(campaign_path)
+    barrier = threading.Barrier(4, timeout=5)
+    original = NoopModule.run
+
+    def blocking_run(self: NoopModule, context: ModuleContext) -> ModuleResult:
+        barrier.wait()
+        return original(self, context)
+
+    monkeypatch.setattr(NoopModule, "run", blocking_run)
+
+    evidence = run_campaign(spec, max_workers=4)
+
+    assert evidence.summary["total"] == 8
+    assert evidence.summary["errored"] == 0
+
+
+def test_max_workers_must_be_positive(tmp_path: Path) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path, 1)
+    spec = load_campaign(campaign_path)
+
+    with pytest.raises(ValueError, match="max_workers"):
+        run_campaign(spec, max_workers=0)
+
+
+def test_run_command_concurrency_is_byte_identical(tmp_path: Path) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path, 5)
+    serial_path = tmp_path / "serial.json"
+    parallel_path = tmp_path / "parallel.json"
+
+    runner = CliRunner()
+    serial = runner.invoke(
+        app, ["run", str(campaign_path), "--out", str(serial_path), "--deterministic"]
+    )
+    parallel = runner.invoke(
+        app,
+        [
+            "run",
+            str(campaign_path),
+            "--out",
+            str(parallel_path),
+            "--deterministic",
+            "--concurrency",
+            "4",
+        ],
+    )
+
+    assert serial.exit_code == 0
+    assert parallel.exit_code == 0
+    assert parallel_path.read_bytes() == serial_path.read_bytes()
+    assert json.loads(parallel_path.read_text())["summary"]["total"] == 10
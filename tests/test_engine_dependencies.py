@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from bas_orchestrator.cli import app
+from bas_orchestrator.engine import (
+    CampaignLoadError,
+    dependency_waves,
+    load_campaign,
+    run_campaign,
+)
+
+
+def write_campaign(path: Path, echo_value: str = "ok", extra: str = "") -> None:
+    path.write_text(
+        f"""
+version: v1
+name: "dag-campaign"
+targets:
+  - id: "local-host"
+    name: "Local Host"
+modules:
+  - id: "echo-1"
+    module: "echo_expectation"
+    target_id: "local-host"
+    scope_allowlist: ["local"]
+    expectations:
+      expected_value: "ok"
+    params:
+      value: "{echo_value}"
+  - id: "noop-1"
+    module: "noop"
+    target_id: "local-host"
+    scope_allowlist: ["local"]
+    depends_on: ["echo-1"]
+  - id: "noop-2"
+    module: "noop"
+    target_id: "local-host"
+    scope_allowlist: ["local"]
+    depends_on: ["noop-1"]
+  - id: "noop-3"
+    module: "noop"
+    target_id: "local-host"
+    scope_allowlist: ["local"]
+{extra}"""
+    )
+
+
+def test_dependency_waves_group_ready_frontiers(tmp_path: Path) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path)
+
+    waves = dependency_waves(load_campaign(campaign_path))
+
+    assert waves == [[0, 3], [1], [2]]
+
+
+def test_failed_prerequisite_skips_dependents(tmp_path: Path) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path, echo_value="nope")
+
+    evidence = run_campaign(load_campaign(campaign_path), max_workers=4)
+
+    statuses = {result.module_id: result.status for result in evidence.results}
+    assert statuses == {
+        "echo-1": "fail",
+        "noop-1": "skipped",
+        "noop-2": "skipped",
+        "noop-3": "pass",
+    }
+    assert [result.module_id for result in evidence.results] == [
+        "echo-1",
+        "noop-1",
+        "noop-2",
+        "noop-3",
+    ]
+    assert evidence.results[2].evidence["dependencies"] == ["noop-1"]
+
+
+def test_passing_prerequisites_run_dependents(tmp_path: Path) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path)
+
+    evidence = run_campaign(load_campaign(campaign_path), deterministic=True, max_workers=2)
+
+    assert evidence.summary["passed"] == 4
+
+
+def test_load_campaign_rejects_cycles(tmp_path: Path) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path)
+    text = campaign_path.read_text().replace(
+        '  - id: "echo-1"\n', '  - id: "echo-1"\n    depends_on: ["noop-2"]\n'
+    )
+    campaign_path.write_text(text)
+
+    with pytest.raises(CampaignLoadError, match="cycle"):
+        load_campaign(campaign_path)
+
+
+def test_validate_campaign_reports_dependency_errors(tmp_path: Path) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(
+        campaign_path,
+        extra="""  - id: "noop-4"
+    module: "noop"
+    target_id: "local-host"
+    scope_allowlist: ["local"]
+    depends_on: ["missing"]
+""",
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(app, ["validate-campaign", str(campaign_path), "--json"])
+
+    assert result.exit_code == 1
+    payload = json.loads(result.stdout.strip())
+    assert payload["errors"] == [
+        {
+            "code": "unknown_dependency",
+            "message": "Unknown dependency: missing",
+            "module_id": "noop-4",
+        }
+    ]
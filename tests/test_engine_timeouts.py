@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from _agent_server import FakeAgentServer
+from typer.testing import CliRunner
+
+from bas_orchestrator.cli import app
+from bas_orchestrator.engine import load_campaign, run_campaign
+from bas_orchestrator.models import ModuleResult
+from bas_orchestrator.modules.base import ModuleContext
+from bas_orchestrator.modules.registry import NoopModule
+
+
+def write_campaign(path: Path, timeout: str = "") -> None:
+    path.write_text(
+        f"""
+version: v1
+name: "timeout-campaign"
+targets:
+  - id: "local-host"
+    name: "Local Host"
+modules:
+  - id: "hang-1"
+    module: "noop"
+    target_id: "local-host"
+    scope_allowlist: ["local"]
+{timeout}
+  - id: "echo-1"
+    module: "echo_expectation"
+    target_id: "local-host"
+    scope_allowlist: ["local"]
+    expectations:
+      expected_value: "ok"
+    params:
+      value: "ok"
+    depends_on: ["hang-1"]
+  - id: "echo-2"
+    module: "echo_expectation"
+    target_id: "local-host"
+    scope_allowlist: ["local"]
+    expectations:
+      expected_value: "ok"
+    params:
+      value: "ok"
+"""
+    )
+
+
+@pytest.fixture
+def hanging_noop(monkeypatch: pytest.MonkeyPatch) -> Iterator[threading.Event]:
+    release = threading.Event()
+
+    def hanging_run(self: NoopModule, context: ModuleContext) -> ModuleResult:
+        release.wait(5)
+        raise AssertionError("module should have been abandoned")
+
+    monkeypatch.setattr(NoopModule, "run", hanging_run)
+    yield release
+    release.set()
+
+
+def test_module_timeout_records_error_and_skips_dependents(
+    tmp_path: Path, hanging_noop: threading.Event
+) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path, "    timeout_seconds: 0.05")
+
+    evidence = run_campaign(load_campaign(campaign_path))
+
+    hang, dependent, independent = evidence.results
+    assert hang.status == "error"
+    assert hang.evidence["error"] == "timeout"
+    assert hang.evidence["reason"] == "module timeout"
+    assert dependent.status == "skipped"
+    assert independent.status == "pass"
+
+
+def test_campaign_deadline_bounds_hung_modules(
+    tmp_path: Path, hanging_noop: threading.Event
+) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path)
+
+    evidence = run_campaign(load_campaign(campaign_path), deadline_seconds=0.05)
+
+    hang, dependent, late = evidence.results
+    assert hang.evidence["reason"] == "campaign deadline exceeded"
+    assert dependent.status == "skipped"
+    assert late.status == "skipped"
+    assert late.evidence == {"reason": "campaign deadline exceeded"}
+
+
+def test_rate_limit_wait_counts_against_deadline(tmp_path: Path) -> None:
+    modules = "".join(
+        f"""
+  - id: "noop-{index}"
+    module: "noop"
+    target_id: "local-host"
+    scope_allowlist: ["local"]"""
+        for index in range(12)
+    )
+    campaign_path = tmp_path / "campaign.yaml"
+    campaign_path.write_text(
+        f"""
+version: v1
+name: "rate-limited"
+limits:
+  requests_per_second: 2
+  burst: 1
+targets:
+  - id: "local-host"
+    name: "Local Host"
+modules:{modules}
+"""
+    )
+
+    started = time.monotonic()
+    evidence = run_campaign(load_campaign(campaign_path), deadline_seconds=1.0, max_workers=12)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 2.0
+    skipped = [result for result in evidence.results if result.status == "skipped"]
+    assert 8 <= len(skipped) < 12
+    assert all(result.evidence == {"reason": "campaign deadline exceeded"} for result in skipped)
+    assert evidence.summary["passed"] == 12 - len(skipped)
+
+
+def test_fast_modules_are_unaffected_by_timeouts(tmp_path: Path) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path, "    timeout_seconds: 5")
+
+    evidence = run_campaign(load_campaign(campaign_path), deadline_seconds=30, max_workers=2)
+
+    assert evidence.summary["passed"] == 3
+
+
+def test_module_context_exposes_remaining_time() -> None:
+    context = ModuleContext(
+        module_id="noop-1",
+        target_id="local-host",
+        params={},
+        expectations={},
+        scope_allowlist=["local"],
+    )
+    assert context.time_remaining() is None
+
+
+def test_run_command_deadline_option(tmp_path: Path, hanging_noop: threading.Event) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path)
+    out = tmp_path / "evidence.json"
+
+    runner = CliRunner()
+    result = runner.invoke(
+        app, ["run", str(campaign_path), "--out", str(out), "--deadline", "0.05"]
+    )
+
+    assert result.exit_code == 0
+    assert '"errored": 1' in out.read_text()
+
+
+def test_campaign_deadline_bounds_agent_slot_waits(
+    tmp_path: Path, agent_server: FakeAgentServer
+) -> None:
+    agent_server.before_execute = lambda module: time.sleep(1.0)
+    campaign_path = tmp_path / "campaign.yaml"
+    campaign_path.write_text(
+        """
+version: v1
+name: "agent-deadline"
+limits:
+  max_per_target: 1
+targets:
+  - id: "local-host"
+    name: "Local Host"
+modules:
+  - id: "noop-1"
+    module: "noop"
+    target_id: "local-host"
+    scope_allowlist: ["local"]
+  - id: "noop-2"
+    module: "noop"
+    target_id: "local-host"
+    scope_allowlist: ["local"]
+"""
+    )
+
+    started = time.monotonic()
+    evidence = run_campaign(
+        load_campaign(campaign_path),
+        agent_config=agent_server.config(),
+        deadline_seconds=0.5,
+        max_workers=2,
+    )
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 1.0
+    statuses = sorted(result.status for result in evidence.results)
+    assert statuses == ["error", "skipped"]
+    skipped = next(result for result in evidence.results if result.status == "skipped")
+    assert skipped.evidence == {"reason": "campaign deadline exceeded"}
+    # The module still waiting for its slot is never sent once the deadline has passed.
+    time.sleep(1.2)
+    assert agent_server.executions == 1
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from bas_orchestrator.cli import app
+from bas_orchestrator.engine import load_campaign, run_campaign, sign_evidence, stream_campaign
+from bas_orchestrator.evidence_stream import (
+    EvidenceStreamWriter,
+    is_evidence_stream,
+    open_evidence_stream,
+    verify_evidence_stream,
+)
+
+
+def _campaign(tmp_path: Path) -> Path:
+    path = tmp_path / "campaign.yaml"
+    assert CliRunner().invoke(app, ["init", str(path)]).exit_code == 0
+    return path
+
+
+def _run(tmp_path: Path, name: str, *args: str) -> Path:
+    out = tmp_path / name
+    result = CliRunner().invoke(
+        app,
+        [
+            "run",
+            str(tmp_path / "campaign.yaml"),
+            "--out",
+            str(out),
+            "--deterministic",
+            "--sign-key",
+            "test-key",
+            *args,
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    return out
+
+
+def test_compressed_stream_matches_plain_stream(tmp_path: Path) -> None:
+    spec = load_campaign(_campaign(tmp_path))
+    path = tmp_path / "evidence.ndjson.gz"
+
+    writer = EvidenceStreamWriter(path, compress=True)
+    shell = stream_campaign(spec, writer, deterministic=True, max_workers=2)
+    writer.finish(shell, sign_key="test-key")
+
+    expected = sign_evidence(run_campaign(spec, deterministic=True), "test-key")
+    assert path.read_bytes()[:2] == b"\x1f\x8b"
+    assert is_evidence_stream(path)
+    stream = open_evidence_stream(path)
+    assert stream.evidence.signature == expected.signature
+    assert list(stream.iter_results()) == expected.results
+    assert verify_evidence_stream(stream, "test-key")
+
+
+def test_compressed_formats_verify_and_report_like_plain(tmp_path: Path) -> None:
+    _campaign(tmp_path)
+    runner = CliRunner()
+    plain = _run(tmp_path, "evidence.json")
+    packed = _run(tmp_path, "evidence.json.gz", "--format", "json.gz", "--compact")
+    streamed = _run(
+        tmp_path, "evidence.ndjson.gz", "--format", "ndjson.gz", "--sign-mode", "merkle"
+    )
+
+    signature = json.loads(plain.read_text())["signature"]
+    assert json.loads(gzip.decompress(packed.read_bytes()))["signature"] == signature
+    reports = []
+    for path in (plain, packed, streamed):
+        verify = runner.invoke(app, ["verify", str(path), "--sign-key", "test-key", "--json"])
+        assert json.loads(verify.stdout) == {"ok": True}
+        report = runner.invoke(app, ["report", str(path), "--json"])
+        reports.append(json.loads(report.stdout))
+    assert reports[0] == reports[1] == reports[2]
+
+    summary = tmp_path / "summary.json.gz"
+    summary.write_bytes(gzip.compress(json.dumps(reports[0]).encode("utf-8")))
+    validate = runner.invoke(app, ["validate-summary", str(summary), "--json"])
+    assert json.loads(validate.stdout) == {"ok": True, "errors": []}
+    diff = runner.invoke(app, ["diff-summary", str(summary), str(summary), "--json"])
+    assert json.loads(diff.stdout) == {"ok": True, "diffs": []}
+
+
+def test_truncated_compressed_stream_is_incomplete(tmp_path: Path) -> None:
+    _campaign(tmp_path)
+    path = _run(tmp_path, "evidence.ndjson.gz", "--format", "ndjson.gz")
+    path.write_bytes(path.read_bytes()[:-20])
+
+    verify = CliRunner().invoke(app, ["verify", str(path), "--sign-key", "test-key", "--json"])
+    assert verify.exit_code == 2
+    assert json.loads(verify.stdout) == {"ok": False, "reason": "incomplete_stream"}
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from bas_orchestrator.cli import app
+from bas_orchestrator.engine import load_campaign, run_campaign, sign_evidence, stream_campaign
+from bas_orchestrator.evidence_stream import (
+    EvidenceStreamWriter,
+    is_evidence_stream,
+    open_evidence_stream,
+    verify_evidence_stream,
+)
+
+
+def write_campaign(path: Path) -> None:
+    path.write_text(
+        """
+version: v1
+name: "stream-campaign"
+targets:
+  - id: "local-host"
+    name: "Local Host"
+modules:
+  - id: "noop-1"
+    module: "noop"
+    target_id: "local-host"
+    scope_allowlist: ["local"]
+  - id: "echo-1"
+    module: "echo_expectation"
+    target_id: "local-host"
+    scope_allowlist: ["local"]
+    expectations:
+      expected_value: "ok"
+    params:
+      value: "nope"
+"""
+    )
+
+
+def test_stream_matches_in_memory_pack_and_signature(tmp_path: Path) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path)
+    spec = load_campaign(campaign_path)
+    stream_path = tmp_path / "evidence.ndjson"
+
+    writer = EvidenceStreamWriter(stream_path)
+    shell = stream_campaign(spec, writer, deterministic=True, max_workers=2)
+    writer.finish(shell, sign_key="test-key")
+
+    expected = sign_evidence(run_campaign(spec, deterministic=True), "test-key")
+    stream = open_evidence_stream(stream_path)
+    assert is_evidence_stream(stream_path)
+    assert stream.evidence.signature == expected.signature
+    assert list(stream.iter_results()) == expected.results
+    assert verify_evidence_stream(stream, "test-key")
+    assert not verify_evidence_stream(stream, "other-key")
+
+
+def test_stream_records_each_result_on_its_own_line(tmp_path: Path) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path)
+    stream_path = tmp_path / "evidence.ndjson"
+
+    runner = CliRunner()
+    result = runner.invoke(
+        app,
+        ["run", str(campaign_path), "--out", str(stream_path), "--format", "ndjson"],
+    )
+
+    assert result.exit_code == 0
+    records = [json.loads(line) for line in stream_path.read_text().splitlines()]
+    assert [record["record"] for record in records] == ["header", "result", "result", "trailer"]
+    assert records[-1]["summary"]["failed"] == 1
+
+
+def test_cli_report_verify_and_validate_summary_accept_streams(tmp_path: Path) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path)
+    stream_path = tmp_path / "evidence.ndjson"
+    json_path = tmp_path / "evidence.json"
+
+    runner = CliRunner()
+    common = ["--deterministic", "--sign-key", "test-key"]
+    runner.invoke(
+        app, ["run", str(campaign_path), "--out", str(stream_path), "--format", "ndjson", *common]
+    )
+    runner.invoke(app, ["run", str(campaign_path), "--out", str(json_path), *common])
+
+    verify = runner.invoke(app, ["verify", str(stream_path), "--sign-key", "test-key", "--json"])
+    assert verify.exit_code == 0
+    assert json.loads(verify.stdout) == {"ok": True}
+
+    stream_report = runner.invoke(app, ["report", str(stream_path), "--json"])
+    json_report = runner.invoke(app, ["report", str(json_path), "--json"])
+    assert stream_report.stdout == json_report.stdout
+
+    text_report = runner.invoke(app, ["report", str(stream_path)])
+    assert "echo-1" in text_report.stdout
+
+    validate = runner.invoke(app, ["validate-summary", str(stream_path), "--json"])
+    assert validate.exit_code == 0
+    assert json.loads(validate.stdout) == {"errors": [], "ok": True}
+
+
+def test_truncated_stream_is_reported_as_incomplete(tmp_path: Path) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path)
+    stream_path = tmp_path / "evidence.ndjson"
+    runner = CliRunner()
+    runner.invoke(app, ["run", str(campaign_path), "--out", str(stream_path), "--format", "ndjson"])
+    lines = stream_path.read_text().splitlines()
+    stream_path.write_text("\n".join(lines[:-1]) + "\n")
+
+    result = runner.invoke(app, ["report", str(stream_path), "--json"])
+
+    assert result.exit_code == 2
+    assert json.loads(result.stdout) == {"ok": False, "reason": "incomplete_stream"}
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from _agent_server import FakeAgentServer
+
+from bas_orchestrator.agent_client import (
+    BATCH_FEATURE,
+    AgentClient,
+    AsyncAgentClient,
+    HandshakeResult,
+)
+from bas_orchestrator.agent_pool import AgentPool
+from bas_orchestrator.handshake_cache import HandshakeCache
+
+
+def _handshake(
+    server: FakeAgentServer, cache: HandshakeCache, expected_policy_hash: str | None = "abc"
+) -> tuple[HandshakeResult, AgentClient]:
+    client = AgentClient(server.config())
+    result = client.handshake(
+        agent_id="agent-1",
+        capabilities=["noop"],
+        version="v1",
+        expected_policy_hash=expected_policy_hash,
+        cache=cache,
+    )
+    return result, client
+
+
+def _key(cache: HandshakeCache, server: FakeAgentServer, policy_hash: str | None = "abc") -> str:
+    return cache.key(
+        server.config().base_url,
+        agent_id="agent-1",
+        expected_policy_hash=policy_hash,
+        capabilities=["noop"],
+        version="v1",
+    )
+
+
+def test_cache_entries_expire_after_ttl(tmp_path: Path) -> None:
+    now = [1000.0]
+    cache = HandshakeCache(tmp_path, ttl_seconds=60, clock=lambda: now[0])
+    result = HandshakeResult(agent_id="agent-1", capabilities=["noop"], policy_hash="abc")
+    cache.put("key", result)
+
+    now[0] += 59
+    assert cache.get("key") == result
+    now[0] += 2
+    assert cache.get("key") is None
+    assert not (tmp_path / "key.json").exists()
+
+
+def test_corrupt_entry_is_a_miss(tmp_path: Path) -> None:
+    cache = HandshakeCache(tmp_path)
+    (tmp_path / "key.json").write_text("{not json")
+
+    assert cache.get("key") is None
+    assert not (tmp_path / "key.json").exists()
+
+
+def test_cached_handshake_is_revalidated_in_background(
+    agent_server: FakeAgentServer, tmp_path: Path
+) -> None:
+    cache = HandshakeCache(tmp_path)
+    first, client = _handshake(agent_server, cache)
+    client.close()
+    assert agent_server.handshakes == 1
+
+    second, client = _handshake(agent_server, cache)
+    client.close()
+
+    assert second == first
+    assert client.handshake_result == first
+    assert agent_server.handshakes == 2
+    assert cache.get(_key(cache, agent_server)) == first
+
+
+def test_rejected_revalidation_drops_entry_and_agent(
+    agent_server: FakeAgentServer, tmp_path: Path
+) -> None:
+    cache = HandshakeCache(tmp_path)
+    _, client = _handshake(agent_server, cache)
+    client.close()
+
+    agent_server.policy_hash = "changed"
+    cached, client = _handshake(agent_server, cache)
+    client.close()
+
+    assert cached.policy_hash == "abc"
+    assert client.handshake_result is None
+    assert cache.get(_key(cache, agent_server)) is None
+
+
+def test_pool_follows_revalidated_handshake(agent_server: FakeAgentServer, tmp_path: Path) -> None:
+    cache = HandshakeCache(tmp_path)
+    config = agent_server.config(agent_id="agent-1", expected_policy_hash="abc")
+
+    def connect() -> AgentPool:
+        return AgentPool.connect(
+            [config], capabilities=["noop"], version="v1", handshake_cache=cache
+        )
+
+    connect().close()
+    agent_server.features = [BATCH_FEATURE]
+    pool = connect()
+    pool.close()  # waits for the background revalidation
+
+    assert pool.supports_batch
+    assert pool.agents[0].handshake.features == [BATCH_FEATURE]
+
+
+def test_unreachable_agent_keeps_cached_entry(
+    agent_server: FakeAgentServer, tmp_path: Path
+) -> None:
+    cache = HandshakeCache(tmp_path)
+    _, client = _handshake(agent_server, cache)
+    client.close()
+
+    agent_server.handshake_failure = 503
+    _, client = _handshake(agent_server, cache)
+    client.close()
+
+    assert client.handshake_result is not None
+    assert cache.get(_key(cache, agent_server)) is not None
+
+
+def test_different_expected_policy_hash_misses(
+    agent_server: FakeAgentServer, tmp_path: Path
+) -> None:
+    cache = HandshakeCache(tmp_path)
+    _, client = _handshake(agent_server, cache)
+    client.close()
+
+    agent_server.policy_hash = "def"
+    result, client = _handshake(agent_server, cache, expected_policy_hash="def")
+    client.close()
+
+    assert result.policy_hash == "def"
+    assert cache.get(_key(cache, agent_server, "abc")) is not None
+    assert cache.get(_key(cache, agent_server, "def")) == result
+
+
+def test_async_client_uses_cache(agent_server: FakeAgentServer, tmp_path: Path) -> None:
+    cache = HandshakeCache(tmp_path)
+
+    async def handshake() -> HandshakeResult:
+        async with AsyncAgentClient(agent_server.config()) as client:
+            return await client.handshake(
+                agent_id="agent-1",
+                capabilities=["noop"],
+                version="v1",
+                expected_policy_hash="abc",
+                cache=cache,
+            )
+
+    first = asyncio.run(handshake())
+    second = asyncio.run(handshake())
+
+    assert second == first
+    assert agent_server.handshakes == 2
+    assert cache.get(_key(cache, agent_server)) == first
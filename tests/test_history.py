@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from bas_orchestrator.cli import app
+from bas_orchestrator.engine import sign_evidence
+from bas_orchestrator.history import HistoryFilter, HistoryIndex, parse_time
+from bas_orchestrator.models import EvidencePack, ModuleResult, ResultStatus
+
+DAY = datetime(2026, 3, 1, tzinfo=UTC)
+
+
+def _pack(day: int, statuses: dict[str, ResultStatus], durations_ms: int = 100) -> EvidencePack:
+    started = DAY + timedelta(days=day)
+    results = [
+        ModuleResult(
+            module_id=module_id,
+            status=status,
+            started_at=started,
+            finished_at=started + timedelta(milliseconds=durations_ms * (position + 1)),
+            evidence={"payload": "x" * 100},
+        )
+        for position, (module_id, status) in enumerate(statuses.items())
+    ]
+    return EvidencePack(
+        campaign_name="nightly",
+        run_id=f"run-{day}",
+        started_at=started,
+        finished_at=started + timedelta(seconds=5),
+        results=results,
+        score=1.0,
+        summary={},
+    )
+
+
+def _write(directory: Path, pack: EvidencePack) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{pack.run_id}.json"
+    path.write_text(sign_evidence(pack, "test-key").model_dump_json())
+    return path
+
+
+def test_index_is_incremental_and_records_verification(tmp_path: Path) -> None:
+    runs = tmp_path / "runs"
+    first = _write(runs, _pack(0, {"a": "pass", "b": "pass"}))
+    _write(runs, _pack(1, {"a": "pass", "b": "fail"}))
+
+    with HistoryIndex(tmp_path / "history.db") as index:
+        assert index.index(first).action == "indexed"
+        assert index.index(first).action == "unchanged"
+        verified = index.index(first, sign_key="test-key")
+        assert (verified.action, verified.verified) == ("indexed", True)
+        assert index.index(first, sign_key="test-key").action == "unchanged"
+
+        first.write_text(first.read_text().replace('"pass"', '"fail"', 1))
+        tampered = index.index(first, sign_key="test-key")
+        assert (tampered.action, tampered.verified) == ("indexed", False)
+        runs_view = index.query("runs")
+        assert [row["run_id"] for row in runs_view] == ["run-0"]
+        assert runs_view[0]["failed"] == 1
+
+        first.write_text(sign_evidence(_pack(2, {"a": "pass"}), "test-key").model_dump_json())
+        assert index.index(first).run_id == "run-2"
+        assert [row["run_id"] for row in index.query("runs")] == ["run-2"]
+
+
+def test_history_views(tmp_path: Path) -> None:
+    runs = tmp_path / "runs"
+    _write(runs, _pack(0, {"a": "pass", "b": "pass"}))
+    _write(runs, _pack(1, {"a": "pass", "b": "pass"}, durations_ms=300))
+    _write(runs, _pack(5, {"a": "fail", "b": "pass"}))
+    db = tmp_path / "history.db"
+    with HistoryIndex(db) as index:
+        for path in sorted(runs.iterdir()):
+            index.index(path)
+
+        modules = {row["module_id"]: row for row in index.query("modules")}
+        assert modules["a"]["total"] == 3
+        assert modules["a"]["failed"] == 1
+        assert (modules["a"]["p50_ms"], modules["a"]["p95_ms"]) == (100, 300)
+
+        since = HistoryFilter(since=DAY + timedelta(days=2))
+        failing = index.query("newly-failing", since)
+        assert [(row["module_id"], row["previous_status"]) for row in failing] == [("a", "pass")]
+        assert index.query("newly-failing", HistoryFilter(until=DAY + timedelta(days=2))) == []
+
+        trend = index.query("trend", HistoryFilter(module_id="b"))
+        assert [(row["day"], row["passed"]) for row in trend] == [
+            ("2026-03-01", 1),
+            ("2026-03-02", 1),
+            ("2026-03-06", 1),
+        ]
+
+
+def test_index_and_history_cli(tmp_path: Path) -> None:
+    runs = tmp_path / "runs"
+    _write(runs, _pack(0, {"a": "pass"}))
+    _write(runs, _pack(1, {"a": "error"}))
+    (runs / "broken.json").write_text("{")
+    db = tmp_path / "history.db"
+    runner = CliRunner()
+
+    indexed = runner.invoke(app, ["index", str(runs), "--db", str(db), "--json"])
+    assert indexed.exit_code == 1
+    payload = json.loads(indexed.stdout)
+    assert (payload["indexed"], payload["error"]) == (2, 1)
+
+    result = runner.invoke(
+        app, ["history", "--db", str(db), "--view", "newly-failing", "--since", "2026-03-02"]
+    )
+    assert result.exit_code == 0
+    assert "run-1" in result.stdout
+
+    queried = runner.invoke(app, ["history", "--db", str(db), "--status", "pass", "--json"])
+    assert json.loads(queried.stdout)["rows"][0]["total"] == 1
+    assert runner.invoke(app, ["history", "--db", str(db), "--view", "nope"]).exit_code != 0
+    filtered = runner.invoke(
+        app, ["history", "--db", str(db), "--view", "newly-failing", "--status", "fail"]
+    )
+    assert filtered.exit_code == 2
+
+
+def test_parse_time_accepts_relative_ages() -> None:
+    now = datetime(2026, 3, 10, tzinfo=UTC)
+    assert parse_time("7d", now=now) == datetime(2026, 3, 3, tzinfo=UTC)
+    assert parse_time("2026-03-01") == DAY
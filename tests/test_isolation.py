@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from bas_orchestrator import isolation
+from bas_orchestrator.cli import app
+from bas_orchestrator.engine import load_campaign, run_campaign
+from bas_orchestrator.isolation import ProcessIsolationConfig, ProcessModuleRunner
+from bas_orchestrator.models import ModuleResult
+from bas_orchestrator.modules.base import ModuleContext
+from bas_orchestrator.modules.registry import get_module
+
+
+def write_campaign(path: Path) -> None:
+    modules = "".join(
+        f"""
+  - id: "echo-{index}"
+    module: "echo_expectation"
+    target_id: "local-host"
+    scope_allowlist: ["local"]
+    expectations:
+      expected_value: "ok"
+    params:
+      value: "{"ok" if index % 2 else "nope"}"
+"""
+        for index in range(6)
+    )
+    path.write_text(
+        f"""
+version: v1
+name: "isolated-campaign"
+targets:
+  - id: "local-host"
+    name: "Local Host"
+modules:{modules}"""
+    )
+
+
+def test_process_isolation_matches_thread_execution(tmp_path: Path) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path)
+    spec = load_campaign(campaign_path)
+
+    threaded = run_campaign(spec, deterministic=True, max_workers=2)
+    isolated = run_campaign(
+        spec,
+        deterministic=True,
+        max_workers=2,
+        process_isolation=ProcessIsolationConfig(max_tasks_per_child=2),
+    )
+
+    assert isolated.model_dump_json() == threaded.model_dump_json()
+
+
+def test_runner_recycles_workers() -> None:
+    runner = ProcessModuleRunner(
+        ProcessIsolationConfig(max_workers=1, max_tasks_per_child=1), default_workers=4
+    )
+    context = ModuleContext(
+        module_id="noop-1",
+        target_id="local-host",
+        params={},
+        expectations={},
+        scope_allowlist=["local"],
+    )
+    try:
+        statuses = [runner.run("noop", context).status for _ in range(3)]
+    finally:
+        runner.shutdown()
+
+    assert statuses == ["pass", "pass", "pass"]
+
+
+def _hang_in_worker(module_name: str, context: ModuleContext) -> ModuleResult:
+    # Replaces isolation._run_in_worker; workers import it from this module by name.
+    if module_name == "noop":
+        time.sleep(15)
+    return get_module(module_name).run(context)
+
+
+def test_timed_out_worker_is_killed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(isolation, "_run_in_worker", _hang_in_worker)
+    campaign_path = tmp_path / "campaign.yaml"
+    campaign_path.write_text(
+        """
+version: v1
+name: "hanging-campaign"
+targets:
+  - id: "local-host"
+    name: "Local Host"
+modules:
+  - id: "hang-1"
+    module: "noop"
+    target_id: "local-host"
+    scope_allowlist: ["local"]
+    timeout_seconds: 1
+  - id: "echo-1"
+    module: "echo_expectation"
+    target_id: "local-host"
+    scope_allowlist: ["local"]
+    expectations:
+      expected_value: "ok"
+    params:
+      value: "ok"
+"""
+    )
+
+    started = time.monotonic()
+    evidence = run_campaign(
+        load_campaign(campaign_path),
+        max_workers=2,
+        process_isolation=ProcessIsolationConfig(),
+    )
+    elapsed = time.monotonic() - started
+
+    hang, echo = evidence.results
+    assert hang.evidence["error"] == "timeout"
+    assert echo.status == "pass"
+    assert elapsed < 5
+
+
+def _record_runs_in_worker(module_name: str, context: ModuleContext) -> ModuleResult:
+    # Replaces isolation._run_in_worker: "noop" hangs, anything else records each start.
+    if module_name == "noop":
+        time.sleep(15)
+    with open(context.params["log"], "a") as log:
+        log.write(f"{context.module_id}\n")
+    time.sleep(3)  # still running when the hung module times out
+    return get_module(module_name).run(context)
+
+
+def test_timeout_does_not_rerun_concurrent_modules(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(isolation, "_run_in_worker", _record_runs_in_worker)
+    log = tmp_path / "runs.log"
+    campaign_path = tmp_path / "campaign.yaml"
+    campaign_path.write_text(
+        f"""
+version: v1
+name: "hanging-campaign"
+targets:
+  - id: "local-host"
+    name: "Local Host"
+modules:
+  - id: "hang-1"
+    module: "noop"
+    target_id: "local-host"
+    scope_allowlist: ["local"]
+    timeout_seconds: 1.5
+    params:
+      log: "{log}"
+  - id: "slow-1"
+    module: "echo_expectation"
+    target_id: "local-host"
+    scope_allowlist: ["local"]
+    expectations:
+      expected_value: "ok"
+    params:
+      value: "ok"
+      log: "{log}"
+"""
+    )
+
+    started = time.monotonic()
+    evidence = run_campaign(
+        load_campaign(campaign_path),
+        max_workers=2,
+        process_isolation=ProcessIsolationConfig(),
+    )
+    elapsed = time.monotonic() - started
+
+    hang, slow = evidence.results
+    assert hang.evidence["error"] == "timeout"
+    assert slow.status == "pass"
+    assert log.read_text().splitlines() == ["slow-1"]
+    assert elapsed < 6
+
+
+def test_worker_limits_are_applied() -> None:
+    script = (
+        "import resource\n"
+        "from bas_orchestrator.isolation import _apply_worker_limits\n"
+        "_apply_worker_limits(4 * 1024 ** 3, 30)\n"
+        "print(resource.getrlimit(resource.RLIMIT_AS)[0])\n"
+        "print(resource.getrlimit(resource.RLIMIT_CPU)[0])\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    ).stdout
+
+    assert output.split() == [str(4 * 1024**3), "30"]
+
+
+def test_run_command_process_isolation(tmp_path: Path) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path)
+    out = tmp_path / "evidence.json"
+
+    runner = CliRunner()
+    result = runner.invoke(
+        app,
+        [
+            "run",
+            str(campaign_path),
+            "--out",
+            str(out),
+            "--isolation",
+            "process",
+            "--worker-max-tasks",
+            "2",
+            "--concurrency",
+            "2",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert json.loads(out.read_text())["summary"] == {
+        "errored": 0,
+        "failed": 3,
+        "passed": 3,
+        "skipped": 0,
+        "total": 6,
+    }
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from bas_orchestrator.cli import app
+from bas_orchestrator.engine import load_campaign, run_campaign
+from bas_orchestrator.journal import JournalError, RunJournal
+from bas_orchestrator.models import ModuleResult
+from bas_orchestrator.modules.base import ModuleContext
+from bas_orchestrator.modules.registry import NoopModule
+
+
+def write_campaign(path: Path, name: str = "journal-campaign") -> None:
+    modules = "".join(
+        f"""
+  - id: "noop-{index}"
+    module: "noop"
+    target_id: "local-host"
+    scope_allowlist: ["local"]
+"""
+        for index in range(6)
+    )
+    path.write_text(
+        f"""
+version: v1
+name: "{name}"
+targets:
+  - id: "local-host"
+    name: "Local Host"
+modules:{modules}"""
+    )
+
+
+def interrupted_journal(journal_dir: Path, keep_results: int) -> Path:
+    journal_path = next(journal_dir.glob("*.journal"))
+    lines = journal_path.read_text().splitlines(keepends=True)
+    journal_path.write_text("".join(lines[: 1 + keep_results]))
+    return journal_path
+
+
+def test_resume_skips_completed_modules_and_matches_full_run(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path)
+    spec = load_campaign(campaign_path)
+    journal_dir = tmp_path / "journal"
+
+    full = run_campaign(spec, deterministic=True, journal=RunJournal(journal_dir))
+    journal_path = interrupted_journal(journal_dir, 4)
+
+    executed: list[str] = []
+    original = NoopModule.run
+
+    def counting_run(self: NoopModule, context: ModuleContext) -> ModuleResult:
+        executed.append(context.module_id)
+        return original(self, context)
+
+    monkeypatch.setattr(NoopModule, "run", counting_run)
+    resumed = run_campaign(spec, deterministic=True, journal=RunJournal.resume(journal_path))
+
+    assert executed == ["noop-4", "noop-5"]
+    assert resumed.model_dump_json() == full.model_dump_json()
+    assert len(journal_path.read_text().splitlines()) == 7
+
+
+def test_resume_keeps_original_run_id_and_start(tmp_path: Path) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path)
+    spec = load_campaign(campaign_path)
+    journal_dir = tmp_path / "journal"
+
+    full = run_campaign(spec, journal=RunJournal(journal_dir), max_workers=3)
+    journal_path = interrupted_journal(journal_dir, 2)
+    journal = RunJournal.resume(journal_path)
+    assert journal.state is not None
+    replayed = dict(journal.state.completed)
+    resumed = run_campaign(spec, journal=journal, max_workers=3)
+
+    assert journal_path.name == f"{full.run_id}.journal"
+    assert resumed.run_id == full.run_id
+    assert resumed.started_at == full.started_at
+    assert len(replayed) == 2
+    for index, result in replayed.items():
+        assert resumed.results[index] == full.results[index] == result
+
+
+def test_resume_discards_torn_final_line(tmp_path: Path) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path)
+    spec = load_campaign(campaign_path)
+    journal_dir = tmp_path / "journal"
+    run_campaign(spec, deterministic=True, journal=RunJournal(journal_dir))
+    journal_path = interrupted_journal(journal_dir, 3)
+    with journal_path.open("a") as handle:
+        handle.write('{"record":"result","index":3,"res')
+
+    journal = RunJournal.resume(journal_path)
+
+    assert journal.state is not None
+    assert sorted(journal.state.completed) == [0, 1, 2]
+    assert journal_path.read_text().endswith("}\n")
+
+
+def test_resume_rejects_different_campaign(tmp_path: Path) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path)
+    journal_dir = tmp_path / "journal"
+    run_campaign(load_campaign(campaign_path), journal=RunJournal(journal_dir))
+    journal_path = next(journal_dir.glob("*.journal"))
+
+    write_campaign(campaign_path, name="other-campaign")
+    with pytest.raises(JournalError, match="different campaign"):
+        run_campaign(load_campaign(campaign_path), journal=RunJournal.resume(journal_path))
+
+
+def test_cli_resume_produces_identical_signed_pack(tmp_path: Path) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path)
+    journal_dir = tmp_path / "journal"
+    full_path = tmp_path / "full.json"
+    resumed_path = tmp_path / "resumed.json"
+    common = ["--deterministic", "--sign-key", "test-key"]
+
+    run_campaign(load_campaign(campaign_path), deterministic=True, journal=RunJournal(journal_dir))
+    journal_path = interrupted_journal(journal_dir, 1)
+
+    runner = CliRunner()
+    first = runner.invoke(app, ["run", str(campaign_path), "--out", str(full_path)] + common)
+    second = runner.invoke(
+        app,
+        ["run", str(campaign_path), "--out", str(resumed_path), "--resume", str(journal_path)]
+        + common,
+    )
+
+    assert first.exit_code == 0
+    assert second.exit_code == 0
+    assert resumed_path.read_bytes() == full_path.read_bytes()
+    assert not journal_path.exists()
+
+
+def test_cli_deterministic_rerun_with_journal_dir(tmp_path: Path) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path)
+    journal_dir = tmp_path / "journal"
+    command = ["run", str(campaign_path), "--deterministic", "--journal-dir", str(journal_dir)]
+
+    runner = CliRunner()
+    first = runner.invoke(app, [*command, "--out", str(tmp_path / "first.json")])
+    second = runner.invoke(app, [*command, "--out", str(tmp_path / "second.json")])
+
+    assert first.exit_code == 0, first.output
+    assert second.exit_code == 0, second.output
+    assert list(journal_dir.iterdir()) == []
+    assert (tmp_path / "first.json").read_bytes() == (tmp_path / "second.json").read_bytes()
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from bas_orchestrator.cli import app
+from bas_orchestrator.engine import (
+    load_campaign,
+    run_campaign,
+    sign_evidence,
+    stream_campaign,
+    verify_evidence,
+)
+from bas_orchestrator.evidence_stream import (
+    EvidenceStreamWriter,
+    open_evidence_stream,
+    verify_evidence_stream,
+)
+from bas_orchestrator.merkle import (
+    MERKLE_ALG,
+    inclusion_proof,
+    merkle_root,
+    root_from_proof,
+)
+from bas_orchestrator.models import EvidencePack
+
+
+def _reference_root(leaves: list[bytes]) -> bytes:
+    # RFC 6962 MTH, written recursively.
+    if not leaves:
+        return hashlib.sha256(b"").digest()
+    if len(leaves) == 1:
+        return leaves[0]
+    split = 1
+    while split * 2 < len(leaves):
+        split *= 2
+    return hashlib.sha256(
+        b"\x01" + _reference_root(leaves[:split]) + _reference_root(leaves[split:])
+    ).digest()
+
+
+def _campaign(tmp_path: Path, modules: int = 5) -> Path:
+    body = "\n".join(
+        f"""  - id: "noop-{index}"
+    module: "noop"
+    target_id: "local-host"
+    scope_allowlist: ["local"]"""
+        for index in range(modules)
+    )
+    path = tmp_path / "campaign.yaml"
+    path.write_text(
+        f"""
+version: v1
+name: "merkle-campaign"
+targets:
+  - id: "local-host"
+    name: "Local Host"
+modules:
+{body}
+"""
+    )
+    return path
+
+
+def test_roots_and_proofs_follow_rfc6962() -> None:
+    for size in range(10):
+        leaves = [hashlib.sha256(bytes([index])).digest() for index in range(size)]
+        root = merkle_root(leaves)
+        assert root == _reference_root(leaves)
+        for index, leaf in enumerate(leaves):
+            proof = inclusion_proof(leaves, index)
+            assert root_from_proof(leaf, index, size, proof) == root
+            assert root_from_proof(b"\x00" * 32, index, size, proof) != root
+            assert root_from_proof(leaf, size, size, proof) is None
+
+
+def test_merkle_signed_pack_verifies(tmp_path: Path) -> None:
+    evidence = run_campaign(load_campaign(_campaign(tmp_path)), deterministic=True)
+    signed = sign_evidence(evidence, "test-key", merkle=True)
+
+    assert signed.signature_alg == MERKLE_ALG
+    assert verify_evidence(signed, "test-key")
+    assert not verify_evidence(signed, "other-key")
+
+    tampered = signed.model_copy(
+        update={"results": [signed.results[0].model_copy(update={"status": "fail"})]}
+    )
+    assert not verify_evidence(tampered, "test-key")
+    assert "merkle_root" not in sign_evidence(evidence, "test-key").model_dump()
+
+
+def test_stream_signs_merkle_root_while_writing(tmp_path: Path) -> None:
+    spec = load_campaign(_campaign(tmp_path))
+    stream_path = tmp_path / "evidence.ndjson"
+
+    writer = EvidenceStreamWriter(stream_path, merkle=True)
+    shell = stream_campaign(spec, writer, deterministic=True, max_workers=2)
+    writer.finish(shell, sign_key="test-key")
+
+    expected = sign_evidence(run_campaign(spec, deterministic=True), "test-key", merkle=True)
+    stream = open_evidence_stream(stream_path)
+    assert stream.evidence.merkle_root == expected.merkle_root
+    assert stream.evidence.signature == expected.signature
+    assert verify_evidence_stream(stream, "test-key")
+    assert not verify_evidence_stream(stream, "other-key")
+
+
+def test_prove_and_verify_single_result(tmp_path: Path) -> None:
+    campaign = _campaign(tmp_path)
+    out = tmp_path / "evidence.json"
+    proof_path = tmp_path / "proof.json"
+    runner = CliRunner()
+
+    result = runner.invoke(
+        app,
+        [
+            "run",
+            str(campaign),
+            "--out",
+            str(out),
+            "--deterministic",
+            "--sign-key",
+            "test-key",
+            "--sign-mode",
+            "merkle",
+        ],
+    )
+    assert result.exit_code == 0
+    assert EvidencePack.model_validate_json(out.read_text()).signature_alg == MERKLE_ALG
+    verify = runner.invoke(app, ["verify", str(out), "--sign-key", "test-key", "--json"])
+    assert json.loads(verify.stdout) == {"ok": True}
+
+    prove = runner.invoke(
+        app, ["prove", str(out), "--module-id", "noop-3", "--out", str(proof_path)]
+    )
+    assert prove.exit_code == 0
+    checked = runner.invoke(
+        app, ["verify", str(proof_path), "--proof", "--sign-key", "test-key", "--json"]
+    )
+    assert json.loads(checked.stdout) == {"ok": True, "module_id": "noop-3"}
+
+    document = json.loads(proof_path.read_text())
+    document["result"]["status"] = "fail"
+    proof_path.write_text(json.dumps(document))
+    tampered = runner.invoke(
+        app, ["verify", str(proof_path), "--proof", "--sign-key", "test-key", "--json"]
+    )
+    assert tampered.exit_code == 1
+    assert json.loads(tampered.stdout) == {"ok": False, "reason": "invalid_signature"}
+
+    missing = runner.invoke(app, ["prove", str(out), "--module-id", "nope"])
+    assert missing.exit_code != 0
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from bas_orchestrator.cache import ResultCache
+from bas_orchestrator.cli import app
+from bas_orchestrator.engine import load_campaign, load_policy, run_campaign
+from bas_orchestrator.models import ModuleResult
+from bas_orchestrator.modules.base import ModuleContext
+from bas_orchestrator.modules.registry import NoopModule
+
+
+def write_campaign(path: Path, value: str = "ok") -> None:
+    path.write_text(
+        f"""
+version: v1
+name: "cache-campaign"
+targets:
+  - id: "local-host"
+    name: "Local Host"
+modules:
+  - id: "noop-1"
+    module: "noop"
+    target_id: "local-host"
+    scope_allowlist: ["local"]
+  - id: "echo-1"
+    module: "echo_expectation"
+    target_id: "local-host"
+    scope_allowlist: ["local"]
+    expectations:
+      expected_value: "ok"
+    params:
+      value: "{value}"
+"""
+    )
+
+
+def make_result(module_id: str) -> ModuleResult:
+    now = datetime(2026, 1, 1, tzinfo=UTC)
+    return ModuleResult(module_id=module_id, status="pass", started_at=now, finished_at=now)
+
+
+def test_second_run_reuses_results_and_marks_them(tmp_path: Path) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path)
+    spec = load_campaign(campaign_path)
+    cache = ResultCache(tmp_path / "cache")
+
+    first = run_campaign(spec, deterministic=True, cache=cache)
+    second = run_campaign(spec, deterministic=True, cache=cache)
+
+    assert all(result.cached is None for result in first.results)
+    assert all(result.cached is True for result in second.results)
+    assert second.summary == first.summary
+    assert "cached" not in first.model_dump(mode="json")["results"][0]
+
+
+def test_changed_module_is_re_executed(tmp_path: Path) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path)
+    cache = ResultCache(tmp_path / "cache")
+    run_campaign(load_campaign(campaign_path), cache=cache)
+
+    write_campaign(campaign_path, value="nope")
+    evidence = run_campaign(load_campaign(campaign_path), cache=cache)
+
+    cached = {result.module_id: result.cached for result in evidence.results}
+    assert cached == {"noop-1": True, "echo-1": None}
+    assert evidence.summary["failed"] == 1
+
+
+def test_policy_and_module_version_change_invalidate(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path)
+    spec = load_campaign(campaign_path)
+    policy_path = tmp_path / "policy.yaml"
+    policy_path.write_text('version: v1\nallowlist: ["local"]\n')
+    cache = ResultCache(tmp_path / "cache")
+    run_campaign(spec, cache=cache)
+
+    with_policy = run_campaign(spec, cache=cache, policy=load_policy(policy_path))
+    assert all(result.cached is None for result in with_policy.results)
+
+    monkeypatch.setattr(NoopModule, "version", "2")
+    bumped = run_campaign(spec, cache=cache)
+    assert {result.module_id: result.cached for result in bumped.results} == {
+        "noop-1": None,
+        "echo-1": True,
+    }
+
+
+def test_errors_are_not_cached(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def failing_run(self: NoopModule, context: ModuleContext) -> ModuleResult:
+        raise RuntimeError("boom")
+
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path)
+    spec = load_campaign(campaign_path)
+    cache = ResultCache(tmp_path / "cache")
+    monkeypatch.setattr(NoopModule, "run", failing_run)
+    run_campaign(spec, cache=cache)
+    monkeypatch.undo()
+
+    evidence = run_campaign(spec, cache=cache)
+
+    assert evidence.results[0].status == "pass"
+    assert evidence.results[0].cached is None
+
+
+def test_ttl_expires_entries(tmp_path: Path) -> None:
+    now = [1000.0]
+    cache = ResultCache(tmp_path / "cache", ttl_seconds=60, clock=lambda: now[0])
+    cache.put("ab" * 32, make_result("noop-1"))
+
+    now[0] += 30
+    assert cache.get("ab" * 32) is not None
+    now[0] += 31
+    assert cache.get("ab" * 32) is None
+
+
+def test_prune_evicts_least_recently_used(tmp_path: Path) -> None:
+    now = [1000.0]
+    cache = ResultCache(tmp_path / "cache", clock=lambda: now[0])
+    keys = [f"{index:02d}" * 32 for index in range(3)]
+    for key in keys:
+        cache.put(key, make_result(key[:2]))
+        now[0] += 1
+    assert cache.get(keys[0]) is not None
+    entry_size = (tmp_path / "cache" / "00" / f"{keys[0]}.json").stat().st_size
+
+    limited = ResultCache(tmp_path / "cache", max_bytes=entry_size * 2, clock=lambda: now[0])
+    assert limited.prune() == 1
+
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is not None
+
+
+def test_run_command_cache_dir(tmp_path: Path) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(campaign_path)
+    out = tmp_path / "evidence.json"
+    args = ["run", str(campaign_path), "--out", str(out), "--cache-dir", str(tmp_path / "c")]
+
+    runner = CliRunner()
+    assert runner.invoke(app, args).exit_code == 0
+    assert runner.invoke(app, args).exit_code == 0
+
+    payload = json.loads(out.read_text())
+    assert [result["cached"] for result in payload["results"]] == [True, True]
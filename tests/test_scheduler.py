@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from bas_orchestrator.engine import (
+    compute_policy_hash,
+    effective_limits,
+    load_campaign,
+    load_policy,
+    run_campaign,
+)
+from bas_orchestrator.models import ModuleResult
+from bas_orchestrator.modules.base import ModuleContext
+from bas_orchestrator.modules.registry import NoopModule
+from bas_orchestrator.scheduler import ConcurrencyLimiter, TokenBucket
+
+
+def write_campaign(path: Path, limits: str = "") -> None:
+    modules = "".join(
+        f"""
+  - id: "noop-{index}"
+    module: "noop"
+    target_id: "{"web" if index % 2 else "db"}"
+    scope_allowlist: ["local"]
+"""
+        for index in range(8)
+    )
+    path.write_text(
+        f"""
+version: v1
+name: "limited-campaign"
+targets:
+  - id: "web"
+    name: "Web"
+    tags: ["prod"]
+  - id: "db"
+    name: "Database"
+    tags: ["prod", "fragile"]
+modules:{modules}{limits}"""
+    )
+
+
+def test_limiter_caps_in_flight_per_key() -> None:
+    limiter = ConcurrencyLimiter({"target:web": 2})
+    peak = 0
+    active = 0
+    lock = threading.Lock()
+
+    def work() -> None:
+        nonlocal peak, active
+        with limiter.hold(["target:web", "tag:unlimited"]):
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            threading.Event().wait(0.01)
+            with lock:
+                active -= 1
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak == 2
+    assert limiter.in_flight("target:web") == 0
+
+
+def test_limiter_rejects_request_above_limit() -> None:
+    limiter = ConcurrencyLimiter({"agent:a": 1})
+    with pytest.raises(ValueError, match="limit is 1"):
+        with limiter.hold(["agent:a", "agent:a"]):
+            pass
+
+
+def test_token_bucket_waits_for_refill() -> None:
+    now = [0.0]
+    sleeps: list[float] = []
+
+    def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    bucket = TokenBucket(2.0, burst=2, clock=lambda: now[0], sleep=sleep)
+    for _ in range(4):
+        bucket.acquire()
+
+    assert sleeps == [0.5, 0.5]
+
+
+def test_waits_give_up_after_timeout() -> None:
+    now = [0.0]
+    bucket = TokenBucket(2.0, burst=1, clock=lambda: now[0], sleep=lambda seconds: None)
+    assert bucket.acquire(timeout=0.1)
+    assert not bucket.acquire(timeout=0.1)
+    now[0] += 0.5
+    assert bucket.acquire(timeout=0)
+
+    limiter = ConcurrencyLimiter({"agent:a": 1})
+    with limiter.hold(["agent:a"]):
+        with pytest.raises(TimeoutError):
+            with limiter.hold(["agent:a"], timeout=0.01):
+                pass
+    assert limiter.in_flight("agent:a") == 0
+
+
+def test_policy_limits_are_stricter_than_campaign(tmp_path: Path) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(
+        campaign_path,
+        """
+limits:
+  max_per_target: 4
+  max_per_tag:
+    prod: 6
+  requests_per_second: 50
+""",
+    )
+    policy_path = tmp_path / "policy.yaml"
+    policy_path.write_text(
+        """
+version: v1
+allowlist: ["local"]
+limits:
+  max_per_target: 2
+  max_per_tag:
+    fragile: 1
+    prod: 10
+"""
+    )
+
+    limits = effective_limits(load_campaign(campaign_path), load_policy(policy_path))
+
+    assert limits.max_per_target == 2
+    assert limits.max_per_tag == {"prod": 6, "fragile": 1}
+    assert limits.requests_per_second == 50
+
+
+def test_run_campaign_respects_tag_limit(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    campaign_path = tmp_path / "campaign.yaml"
+    write_campaign(
+        campaign_path,
+        """
+limits:
+  max_per_tag:
+    fragile: 1
+""",
+    )
+    spec = load_campaign(campaign_path)
+    peak = 0
+    active = 0
+    lock = threading.Lock()
+    original = NoopModule.run
+
+    def tracking_run(self: NoopModule, context: ModuleContext) -> ModuleResult:
+        nonlocal peak, active
+        if context.target_id == "db":
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            threading.Event().wait(0.01)
+            with lock:
+                active -= 1
+        return original(self, context)
+
+    monkeypatch.setattr(NoopModule, "run", tracking_run)
+
+    evidence = run_campaign(spec, max_workers=8)
+
+    assert evidence.summary["passed"] == 8
+    assert peak == 1
+
+
+def test_unset_limits_keep_policy_hash_stable(tmp_path: Path) -> None:
+    policy_path = tmp_path / "policy.yaml"
+    policy_path.write_text('version: v1\nallowlist: ["local"]\n')
+    legacy = json.dumps(
+        {"allowlist": ["local"], "modules": {}, "targets": {}, "version": "v1"},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+
+    digest = compute_policy_hash(load_policy(policy_path))
+
+    assert digest == hashlib.sha256(legacy.encode("utf-8")).hexdigest()